@@ -1,3 +1,5 @@
+import importlib
+import multiprocessing
 import sys
 from datetime import datetime
 
@@ -12,12 +14,23 @@ from PyQt5.QtWidgets import (
 
 from data_manager import DataManager
 from modul_video_analiz import JobManagementPanel, VideoPlayerPanel
-from modul_excel_raporu import create_most_report_job_based
 
-from modul_basic_most import BasicMostModule
-from modul_maxi_most import MaxiMostModule
-from modul_mini_most import MiniMostModule
-from modul_most_secici import MostSelectorDialog
+
+# Analiz sayfaları pencere açılırken değil, ilk kez açıldıklarında kurulur (bkz. analiz_sayfasi).
+# ad: (modül, sınıf adı adayları — ilk bulunan kullanılır)
+ANALIZ_MODULLERI = {
+    'westinghouse': ('modul_westinghouse', ('WestinghouseModule', 'WestinghousePanel')),
+    'basic_most': ('modul_basic_most', ('BasicMostModule',)),
+    'maxi_most': ('modul_maxi_most', ('MaxiMostModule',)),
+    'mini_most': ('modul_mini_most', ('MiniMostModule',)),
+}
+
+# MOST seçici diyaloğunun sonucu -> analiz sayfası
+MOST_SAYFALARI = {'BasicMOST': 'basic_most', 'MaxiMOST': 'maxi_most', 'MiniMOST': 'mini_most'}
+
+# Bu kadar veya daha fazla iş seçilirse rapor sayfaları süreç havuzunda paralel çizilir
+# (daha az işte süreç açma maliyeti kazançtan büyük)
+PARALEL_RAPOR_ESIGI = 8
 
 
 class AnaPencere(QMainWindow):
@@ -76,7 +89,6 @@ class AnaPencere(QMainWindow):
 
         # Sinyaller
         self.job_panel.stepSelected.connect(self.on_step_selected)
-        self.video_panel.measurement_saved.connect(self.refresh_left_panel_state)
 
     def init_analysis_panel(self):
         """Sağdaki dinamik panel (menü + analiz sayfaları)."""
@@ -97,10 +109,10 @@ class AnaPencere(QMainWindow):
         btn_selector = QPushButton("MOST Metodu Seçici")
         btn_excel = QPushButton("Excel Raporu Oluştur")
 
-        btn_west.clicked.connect(lambda: self.switch_analysis_page(self.west_module))
-        btn_basic.clicked.connect(lambda: self.switch_analysis_page(self.basic_most_module))
-        btn_maxi.clicked.connect(lambda: self.switch_analysis_page(self.maxi_most_module))
-        btn_mini.clicked.connect(lambda: self.switch_analysis_page(self.mini_most_module))
+        btn_west.clicked.connect(lambda: self.switch_analysis_page('westinghouse'))
+        btn_basic.clicked.connect(lambda: self.switch_analysis_page('basic_most'))
+        btn_maxi.clicked.connect(lambda: self.switch_analysis_page('maxi_most'))
+        btn_mini.clicked.connect(lambda: self.switch_analysis_page('mini_most'))
         btn_selector.clicked.connect(self.open_most_selector)
         btn_excel.clicked.connect(self.rapor_olustur)
 
@@ -120,43 +132,45 @@ class AnaPencere(QMainWindow):
         self.analysis_stack.addWidget(menu_widget)
 
         # --- Diğer Sayfalar: Analiz Modülleri ---
-        # Westinghouse: LAZY IMPORT (dairesel bağımlılığı önler)
-        # --- Westinghouse: lazy import (dairesel bağımlılığı önler) ---
-        # --- Westinghouse: güvenli (lazy) import ---
-        import importlib
-        mw = importlib.import_module("modul_westinghouse")
-        WestinghouseModule = getattr(mw, "WestinghouseModule", None)
-        if WestinghouseModule is None:
-            # alternatif isim kullandıysan (ör. WestinghousePanel) buradan yakalar
-            WestinghouseModule = getattr(mw, "WestinghousePanel", None)
-        if WestinghouseModule is None:
+        # Her modül yüzlerce combobox kurar; ilk açılışta oluşturulur (bkz. analiz_sayfasi)
+        self.analysis_modules = {}  # {ad: modül}, kurulma sırasıyla
+
+    def analiz_sayfasi(self, ad):
+        """ANALIZ_MODULLERI'ndeki sayfayı döndürür; ilk çağrıda modülü içe aktarıp kurar ve yığına ekler."""
+        module = self.analysis_modules.get(ad)
+        if module is not None:
+            return module
+
+        # İçe aktarma da burada: modüller dairesel bağımlılık olmadan ve yalnızca gerektiğinde yüklenir
+        modul_adi, sinif_adlari = ANALIZ_MODULLERI[ad]
+        mod = importlib.import_module(modul_adi)
+        sinif = next((getattr(mod, s) for s in sinif_adlari if hasattr(mod, s)), None)
+        if sinif is None:
             # burada hata verirse, dosyada sınıf adı gerçekten farklıdır
-            raise ImportError("modul_westinghouse içinde 'WestinghouseModule' sınıfı bulunamadı.")
-
-        self.west_module = WestinghouseModule(self.data_manager)
-
-
-        self.basic_most_module = BasicMostModule(self.data_manager)
-        self.maxi_most_module = MaxiMostModule(self.data_manager)
-        self.mini_most_module = MiniMostModule(self.data_manager)
-
-        self.analysis_modules = [
-            self.west_module, self.basic_most_module,
-            self.maxi_most_module, self.mini_most_module
-        ]
-
-        for module in self.analysis_modules:
-            self.analysis_stack.addWidget(module)
-            # back_button_pressed bazı modüllerde yoksa hata olmasın
-            if hasattr(module, "back_button_pressed"):
-                module.back_button_pressed.connect(self.show_analysis_menu)
+            raise ImportError(f"{modul_adi} içinde '{sinif_adlari[0]}' sınıfı bulunamadı.")
+
+        module = sinif(self.data_manager)
+        self.analysis_stack.addWidget(module)
+        # back_button_pressed bazı modüllerde yoksa hata olmasın
+        if hasattr(module, "back_button_pressed"):
+            module.back_button_pressed.connect(self.show_analysis_menu)
+        self.analysis_modules[ad] = module
+        return module
+
+    # Eski adlarla erişim (ilk erişimde sayfayı kurar)
+    west_module = property(lambda self: self.analiz_sayfasi('westinghouse'))
+    basic_most_module = property(lambda self: self.analiz_sayfasi('basic_most'))
+    maxi_most_module = property(lambda self: self.analiz_sayfasi('maxi_most'))
+    mini_most_module = property(lambda self: self.analiz_sayfasi('mini_most'))
 
     def switch_analysis_page(self, target_widget):
-        """İstenen analiz modülüne geç ve seçili adımın verisini yükle."""
+        """İstenen analiz modülüne geç ve seçili adımın verisini yükle (ad verilirse sayfa gerekirse kurulur)."""
         if self.current_job_id is None or self.current_step_id is None or self.current_step_id == -1:
             QMessageBox.warning(self, "Uyarı", "Lütfen önce bir iş ve analiz edilecek bir adım seçin.")
             return
 
+        if isinstance(target_widget, str):
+            target_widget = self.analiz_sayfasi(target_widget)
         self.analysis_stack.setCurrentWidget(target_widget)
 
         if hasattr(target_widget, 'load_step_data'):
@@ -168,15 +182,13 @@ class AnaPencere(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Lütfen önce bir iş ve analiz edilecek bir adım seçin.")
             return
 
+        from modul_most_secici import MostSelectorDialog
+
         dialog = MostSelectorDialog(self)
         if dialog.exec_():
             secilen_metod = dialog.secilen_metod
-            if secilen_metod == "BasicMOST":
-                self.switch_analysis_page(self.basic_most_module)
-            elif secilen_metod == "MaxiMOST":
-                self.switch_analysis_page(self.maxi_most_module)
-            elif secilen_metod == "MiniMOST":
-                self.switch_analysis_page(self.mini_most_module)
+            if secilen_metod in MOST_SAYFALARI:
+                self.switch_analysis_page(MOST_SAYFALARI[secilen_metod])
 
     def show_analysis_menu(self):
         """Sağ paneli ana menüye döndür."""
@@ -227,11 +239,16 @@ class AnaPencere(QMainWindow):
 
         # 3) Seçilen işleri Excel raporlamaya gönder
         try:
+            # openpyxl yalnızca rapor istendiğinde yüklenir (açılış süresi)
+            from modul_excel_raporu import create_most_report_job_based
+
+            # Rapor CSV dosyalarını okur; SQLite kullanılıyorsa önce güncel halleri dışa aktar
+            self.data_manager.export_csv()
             output = create_most_report_job_based(
                 output_path=file_path,
                 paths={
                     "is_adimlari": self.data_manager.is_adimlari_path,
-                    "zaman_etudu": self.data_manager.zaman_etudu_path,
+                    "zaman_etudu": self.data_manager.zaman_etudu_klasoru,
                     "basic_analiz": self.data_manager.basic_most_analizleri_path,
                     "basic_detay": self.data_manager.basic_most_detaylari_path,
                     "maxi_analiz": self.data_manager.maxi_most_analizleri_path,
@@ -240,7 +257,9 @@ class AnaPencere(QMainWindow):
                     "mini_detay": self.data_manager.mini_most_detaylari_path,
                     "westinghouse": self.data_manager.westinghouse_path,
                 },
-                selected_job_ids=selected_job_ids
+                selected_job_ids=selected_job_ids,
+                akis=True,  # sayfalar sırayla diske yazılır; çok işli raporlarda bellek sabit kalır
+                isci_sayisi=0 if len(selected_job_ids) >= PARALEL_RAPOR_ESIGI else 1
             )
 
             QMessageBox.information(self, "Başarılı",
@@ -262,6 +281,14 @@ class AnaPencere(QMainWindow):
         if hasattr(self.job_panel, 'update_view'):
             self.job_panel.update_view(self.current_job_id, self.current_step_id)
 
+    def closeEvent(self, event):
+        """Kapanmadan önce arka planda bekleyen kayıtları diske yaz."""
+        try:
+            self.data_manager.flush()
+        except Exception as e:
+            QMessageBox.critical(self, "Kayıt Hatası", f"Bekleyen kayıtlar diske yazılamadı:\n{e}")
+        super().closeEvent(event)
+
 class JobSelectionDialog(QDialog):
     """Excel raporu için hangi işlerin seçileceğini soran basit dialog."""
 
@@ -300,6 +327,8 @@ class JobSelectionDialog(QDialog):
 
 
 if __name__ == '__main__':
+    # Paketlenmiş (dondurulmuş) uygulamada rapor işçi süreçleri için gerekli
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     
     # --- SUNUM İÇİN ARAYÜZ GÜNCELLEMESİ BAŞLANGIÇ ---
@@ -0,0 +1,11 @@
+"""
+Başsız (ekransız) performans ölçümleri.
+
+    veri_uretici  — N iş × M adım × K ölçümlük gerçekçi sentetik veri klasörü üretir
+    calistir      — DataManager ve rapor işlemlerini farklı ölçeklerde ölçüp JSON'a yazar
+    acilis_suresi — uygulama açılış süresi (PyQt5 gerekir)
+
+Örnek:
+    python -m benchmarks.calistir --olcek kucuk,orta --cikti sonuc.json
+    python -m benchmarks.calistir --olcek kucuk --karsilastir onceki.json
+"""
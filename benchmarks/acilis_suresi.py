@@ -0,0 +1,125 @@
+"""
+Uygulama açılış süresi ölçümü.
+
+Her tekrar ayrı bir süreçte çalışır (içe aktarmalar her seferinde soğuk olsun) ve şunları ölçer:
+  - içe aktarma:     PyQt5 + ana_uygulama modüllerinin yüklenmesi
+  - pencere:         AnaPencere() kurulumu (DataManager + sol/orta paneller + menü)
+  - ilk boyama:      süreç başından pencerenin ilk Paint olayına kadar geçen süre
+  - sayfa kurulumu:  her analiz sayfasının ilk açılıştaki kurulum maliyeti (içe aktarma dahil)
+Ayrıca açılışta yüklenmiş ağır modüller (cv2, openpyxl, ...) listelenir.
+
+Kullanım:
+    python benchmarks/acilis_suresi.py [--tekrar 5] [--veri-klasoru YOL]
+
+--veri-klasoru verilmezse boş bir geçici veri klasörü kullanılır; gerçek veriyle ölçmek için
+LOCALAPPDATA olarak kullanılacak klasörü verin. Ekran gerekmez (QT_QPA_PLATFORM=offscreen).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+T0 = time.perf_counter()
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Açılışta yüklenmemesi beklenen modüller
+AGIR_MODULLER = ['cv2', 'openpyxl', 'modul_excel_raporu', 'modul_westinghouse',
+                 'modul_basic_most', 'modul_maxi_most', 'modul_mini_most', 'modul_most_secici']
+
+
+def _ms(baslangic, bitis):
+    return round((bitis - baslangic) * 1000, 1)
+
+
+def tek_olcum() -> dict:
+    """Bu süreçte bir açılışı ölçer; sonuçları sözlük olarak döndürür."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    sys.path.insert(0, REPO)
+
+    t_import = time.perf_counter()
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+    import ana_uygulama
+    t_import_son = time.perf_counter()
+
+    app = QApplication.instance() or QApplication([])
+
+    class IlkBoyama(QObject):
+        def __init__(self):
+            super().__init__()
+            self.zaman = None
+
+        def eventFilter(self, obj, event):
+            if self.zaman is None and event.type() == QEvent.Paint:
+                self.zaman = time.perf_counter()
+            return False
+
+    t_pencere = time.perf_counter()
+    pencere = ana_uygulama.AnaPencere()
+    t_pencere_son = time.perf_counter()
+
+    boyama = IlkBoyama()
+    pencere.installEventFilter(boyama)
+    pencere.show()
+    while boyama.zaman is None and time.perf_counter() - t_pencere_son < 30:
+        app.processEvents()
+    yuklu = [m for m in AGIR_MODULLER if m in sys.modules]
+
+    sayfalar = {}
+    for ad in ana_uygulama.ANALIZ_MODULLERI:
+        t = time.perf_counter()
+        pencere.analiz_sayfasi(ad)
+        app.processEvents()
+        sayfalar[ad] = _ms(t, time.perf_counter())
+
+    pencere.close()
+    return {
+        'ice_aktarma_ms': _ms(t_import, t_import_son),
+        'pencere_ms': _ms(t_pencere, t_pencere_son),
+        'ilk_boyama_ms': _ms(T0, boyama.zaman) if boyama.zaman is not None else None,
+        'sayfa_kurulumu_ms': sayfalar,
+        'acilista_yuklu': yuklu,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uygulama açılış süresi ölçümü")
+    parser.add_argument('--tekrar', type=int, default=5, help="ölçüm sayısı (her biri ayrı süreç)")
+    parser.add_argument('--veri-klasoru', help="LOCALAPPDATA olarak kullanılacak klasör (varsayılan: geçici)")
+    parser.add_argument('--tek', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.tek:
+        print(json.dumps(tek_olcum(), ensure_ascii=False))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen', LOCALAPPDATA=args.veri_klasoru or tmp)
+        sonuclar = []
+        for _ in range(args.tekrar):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), '--tek'], env=env,
+                                 capture_output=True, text=True, check=True).stdout
+            sonuclar.append(json.loads(out.strip().splitlines()[-1]))
+
+    def medyan(anahtar, alt=None):
+        degerler = [(s[anahtar][alt] if alt else s[anahtar]) for s in sonuclar]
+        degerler = [d for d in degerler if d is not None]
+        return statistics.median(degerler) if degerler else float('nan')
+
+    print(f"{args.tekrar} açılış, medyan (ms):")
+    print(f"  {'içe aktarma':<22}{medyan('ice_aktarma_ms'):>10.1f}")
+    print(f"  {'pencere kurulumu':<22}{medyan('pencere_ms'):>10.1f}")
+    print(f"  {'ilk boyama':<22}{medyan('ilk_boyama_ms'):>10.1f}")
+    print("Analiz sayfası ilk kurulumu (ms):")
+    for ad in sonuclar[0]['sayfa_kurulumu_ms']:
+        print(f"  {ad:<22}{medyan('sayfa_kurulumu_ms', ad):>10.1f}")
+    print("Açılışta yüklü ağır modüller:", ', '.join(sonuclar[0]['acilista_yuklu']) or '-')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+"""
+DataManager ve Excel raporu ölçümleri.
+
+Her ölçek için geçici bir klasörde sentetik veri üretilir (bkz. veri_uretici), yeni bir
+DataManager açılır ve işlemler ölçülür. Sonuçlar JSON olarak yazılır; --karsilastir ile
+önceki bir sürümün sonucuna göre yavaşlayan işlemler listelenir.
+
+    python -m benchmarks.calistir --olcek kucuk,orta --cikti sonuc.json
+    python -m benchmarks.calistir --olcek 100x20x10 --depolama sqlite --karsilastir onceki.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO not in sys.path:
+    sys.path.insert(0, REPO)
+
+from benchmarks.veri_uretici import veri_uret  # noqa: E402
+
+# ad: (iş, adım/iş, ölçüm/adım)
+OLCEKLER = {
+    'kucuk': (10, 10, 5),
+    'orta': (50, 20, 10),
+    'buyuk': (200, 30, 20),
+}
+
+# Karşılaştırmada medyanı bu oranın üzerinde artan işlemler yavaşlamış sayılır
+YAVASLAMA_ESIGI = 1.2
+
+
+def _olcek(deger: str):
+    if deger in OLCEKLER:
+        return deger, OLCEKLER[deger]
+    try:
+        is_sayisi, adim, olcum = (int(x) for x in deger.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen ölçek: {deger} (örn. kucuk veya 50x20x10)")
+    return deger, (is_sayisi, adim, olcum)
+
+
+def _ozetle(sureler_ms) -> dict:
+    sirali = sorted(sureler_ms)
+    n = len(sirali)
+    return {
+        'tekrar': n,
+        'medyan_ms': round(sirali[n // 2] if n % 2 else (sirali[n // 2 - 1] + sirali[n // 2]) / 2, 3),
+        'p95_ms': round(sirali[min(n - 1, int(n * 0.95))], 3),
+        'en_kucuk_ms': round(sirali[0], 3),
+        'en_buyuk_ms': round(sirali[-1], 3),
+        'toplam_ms': round(sum(sirali), 3),
+    }
+
+
+def _sure(fn, argumanlar) -> dict:
+    """fn'i her argüman demeti için bir kez çağırır; çağrı başına süreleri özetler."""
+    sureler = []
+    for arg in argumanlar:
+        t = time.perf_counter()
+        fn(*arg)
+        sureler.append((time.perf_counter() - t) * 1000)
+    return _ozetle(sureler)
+
+
+def olcek_calistir(kok: str, ad: str, boyut, depolama: str, tekrar: int, tohum: int = 0) -> dict:
+    """Bir ölçekte veri üretir ve işlemleri ölçer; {'veri': ..., 'islemler': {ad: özet}} döndürür."""
+    from data_manager import DataManager
+
+    localappdata = os.path.join(kok, ad)
+    os.makedirs(localappdata, exist_ok=True)
+    is_sayisi, adim_sayisi, olcum_sayisi = boyut
+
+    t = time.perf_counter()
+    veri = veri_uret(localappdata, is_sayisi, adim_sayisi, olcum_sayisi, tohum=tohum)
+    uretim_ms = (time.perf_counter() - t) * 1000
+
+    os.environ['LOCALAPPDATA'] = localappdata
+    islemler = {}
+    t = time.perf_counter()
+    dm = DataManager(backend=depolama)
+    islemler['acilis'] = _ozetle([(time.perf_counter() - t) * 1000])
+    try:
+        rnd = random.Random(tohum)
+        job_ids = sorted(dm.get_job_list())
+        adimlar = {j: list(dm.get_steps_for_job(j)) for j in job_ids[:1]}
+
+        islemler['get_steps_for_job'] = _sure(dm.get_steps_for_job, [(rnd.choice(job_ids),) for _ in range(tekrar)])
+
+        def olcum_kaydet(job_id):
+            if job_id not in adimlar:
+                adimlar[job_id] = list(dm.get_steps_for_job(job_id))
+            dm.kaydet_zaman_olcumu(job_id, rnd.choice(adimlar[job_id]), round(rnd.uniform(1, 60), 2))
+        islemler['kaydet_zaman_olcumu'] = _sure(olcum_kaydet, [(rnd.choice(job_ids),) for _ in range(tekrar)])
+        islemler['flush'] = _sure(dm.flush, [()])
+
+        islemler['_get_next_global_analiz_id'] = _sure(dm._get_next_global_analiz_id, [()] * tekrar)
+
+        # Rapor, uygulamadaki gibi CSV dosyalarından okur (bkz. AnaPencere.rapor_olustur)
+        from modul_excel_raporu import create_most_report_job_based
+
+        rapor_yollari = {
+            "is_adimlari": dm.is_adimlari_path,
+            "zaman_etudu": dm.zaman_etudu_klasoru,
+            "basic_analiz": dm.basic_most_analizleri_path,
+            "basic_detay": dm.basic_most_detaylari_path,
+            "maxi_analiz": dm.maxi_most_analizleri_path,
+            "maxi_detay": dm.maxi_most_detaylari_path,
+            "mini_analiz": dm.mini_most_analizleri_path,
+            "mini_detay": dm.mini_most_detaylari_path,
+            "westinghouse": dm.westinghouse_path,
+        }
+
+        def rapor(secili, akis=False, isci_sayisi=1, artimli=False):
+            dm.export_csv()
+            create_most_report_job_based(os.path.join(localappdata, f'Rapor_{len(secili)}.xlsx'), rapor_yollari,
+                                         selected_job_ids=secili, akis=akis, isci_sayisi=isci_sayisi, artimli=artimli,
+                                         veri_klasoru=dm.app_data_path)
+        islemler['create_most_report_job_based[tek_is]'] = _sure(rapor, [([job_ids[0]],)])
+        islemler['create_most_report_job_based[tum_isler]'] = _sure(rapor, [(job_ids,)])
+        islemler['create_most_report_job_based[tum_isler,akis]'] = _sure(rapor, [(job_ids, True)])
+        islemler['create_most_report_job_based[tum_isler,paralel]'] = _sure(rapor, [(job_ids, True, 0)])
+        # Ölçülmeyen ilk çağrı parmak izlerini yazar; ölçülen çağrı değişmemiş raporu yeniden kurar
+        rapor(job_ids, False, 1, True)
+        islemler['create_most_report_job_based[tum_isler,artimli]'] = _sure(rapor, [(job_ids, False, 1, True)])
+
+        # Aynı sayılar openpyxl'siz düz tablolar olarak (bkz. rapor_modeli.CIKTI_BICIMLERI)
+        from rapor_modeli import raporu_disa_aktar
+
+        def disa_aktar(bicim):
+            # csv: klasör, json: tek dosya
+            hedef = os.path.join(localappdata, 'Rapor.json' if bicim == 'json' else f'Rapor_{bicim}')
+            raporu_disa_aktar(hedef, rapor_yollari, selected_job_ids=job_ids, bicim=bicim)
+        for bicim in ('csv', 'json'):
+            islemler[f'raporu_disa_aktar[tum_isler,{bicim}]'] = _sure(disa_aktar, [(bicim,)])
+
+        # CPM: iş × adım × ölçüm kadar adımlı tek bir sentetik DAG (öncüller son 50 adımdan)
+        from cpm_motoru import CpmGrafigi
+
+        n = is_sayisi * adim_sayisi * olcum_sayisi
+        onculler = [",".join(str(p) for p in rnd.sample(range(max(0, i - 50), i), min(i, rnd.randint(1, 3))))
+                    for i in range(n)]
+        sureler = [rnd.uniform(1, 60) for _ in range(n)]
+        islemler[f'CpmGrafigi[{n}_adim]'] = _sure(CpmGrafigi, [(range(n), onculler)])
+        grafik = CpmGrafigi(range(n), onculler)
+        islemler[f'CpmGrafigi.hesapla[{n}_adim]'] = _sure(grafik.hesapla, [(sureler,)] * tekrar)
+
+        # Silme en sonda: veriyi değiştirir
+        silinecek = rnd.sample(job_ids, min(len(job_ids), max(1, tekrar // 10)))
+        islemler['delete_job'] = _sure(dm.delete_job, [(j,) for j in silinecek])
+    finally:
+        dm.kapat()
+
+    return {
+        'boyut': {'is': is_sayisi, 'adim': adim_sayisi, 'olcum': olcum_sayisi},
+        'veri': veri,
+        'uretim_ms': round(uretim_ms, 1),
+        'islemler': islemler,
+    }
+
+
+def _ortam() -> dict:
+    try:
+        surum = subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=REPO, capture_output=True,
+                               text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        surum = None
+    import numpy
+    import pandas
+    return {
+        'surum': surum,
+        'tarih': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'islemci': os.cpu_count(),
+        'pandas': pandas.__version__,
+        'numpy': numpy.__version__,
+    }
+
+
+def karsilastir(eski: dict, yeni: dict, esik: float = YAVASLAMA_ESIGI) -> list:
+    """
+    İki sonuç dosyasında ortak ölçek/işlemlerin medyanlarını karşılaştırır:
+    [(ölçek, işlem, eski_ms, yeni_ms, oran, yavaşladı_mı)].
+    """
+    satirlar = []
+    for olcek, sonuc in yeni.get('olcekler', {}).items():
+        onceki = eski.get('olcekler', {}).get(olcek)
+        if not onceki or onceki.get('boyut') != sonuc.get('boyut'):
+            continue
+        for islem, ozet in sonuc['islemler'].items():
+            if islem not in onceki['islemler']:
+                continue
+            a, b = onceki['islemler'][islem]['medyan_ms'], ozet['medyan_ms']
+            oran = b / a if a else float('inf')
+            satirlar.append((olcek, islem, a, b, oran, oran > esik))
+    return satirlar
+
+
+def _tablo_yaz(sonuc: dict):
+    for olcek, s in sonuc['olcekler'].items():
+        b = s['boyut']
+        print(f"\n[{olcek}] {b['is']} iş × {b['adim']} adım × {b['olcum']} ölçüm "
+              f"({s['veri']['Zaman_Etudu']} ölçüm satırı, üretim {s['uretim_ms']:.0f} ms)")
+        print(f"  {'işlem':<48}{'tekrar':>7}{'medyan ms':>12}{'p95 ms':>12}")
+        for islem, o in s['islemler'].items():
+            print(f"  {islem:<48}{o['tekrar']:>7}{o['medyan_ms']:>12.2f}{o['p95_ms']:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DataManager ve rapor performans ölçümleri")
+    parser.add_argument('--olcek', default='kucuk,orta',
+                        help=f"virgülle ayrılmış ölçekler: {', '.join(OLCEKLER)} veya İŞxADIMxÖLÇÜM")
+    parser.add_argument('--depolama', choices=['csv', 'sqlite'], default='csv')
+    parser.add_argument('--tekrar', type=int, default=100, help="tekrarlanan işlemlerde çağrı sayısı")
+    parser.add_argument('--tohum', type=int, default=0)
+    parser.add_argument('--cikti', help="sonuç JSON dosyası (varsayılan: yalnızca ekrana)")
+    parser.add_argument('--karsilastir', metavar='ONCEKI_JSON', help="önceki sonuçla karşılaştır")
+    parser.add_argument('--esik', type=float, default=YAVASLAMA_ESIGI)
+    args = parser.parse_args()
+
+    olcekler = [_olcek(o.strip()) for o in args.olcek.split(',') if o.strip()]
+    sonuc = {'ortam': _ortam(), 'depolama': args.depolama, 'tekrar': args.tekrar, 'olcekler': {}}
+    kok = tempfile.mkdtemp(prefix='entegre_olcum_')
+    eski_localappdata = os.environ.get('LOCALAPPDATA')
+    try:
+        for ad, boyut in olcekler:
+            sonuc['olcekler'][ad] = olcek_calistir(kok, ad, boyut, args.depolama, args.tekrar, args.tohum)
+    finally:
+        if eski_localappdata is None:
+            os.environ.pop('LOCALAPPDATA', None)
+        else:
+            os.environ['LOCALAPPDATA'] = eski_localappdata
+        shutil.rmtree(kok, ignore_errors=True)
+
+    _tablo_yaz(sonuc)
+    if args.cikti:
+        with open(args.cikti, 'w', encoding='utf-8') as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=1)
+        print(f"\nSonuçlar yazıldı: {args.cikti}")
+
+    if args.karsilastir:
+        with open(args.karsilastir, 'r', encoding='utf-8') as f:
+            eski = json.load(f)
+        satirlar = karsilastir(eski, sonuc, args.esik)
+        print(f"\nKarşılaştırma ({eski.get('ortam', {}).get('surum')} -> {sonuc['ortam']['surum']}):")
+        for olcek, islem, a, b, oran, yavas in satirlar:
+            print(f"  {olcek:<8}{islem:<48}{a:>10.2f}{b:>10.2f}  x{oran:.2f}{'  YAVAŞLADI' if yavas else ''}")
+        if any(r[5] for r in satirlar):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
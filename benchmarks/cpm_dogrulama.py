@@ -0,0 +1,213 @@
+"""
+CPM motoru (cpm_motoru) doğrulaması.
+
+Rastgele öncül grafikleri cpm_motoru ile ve adım adım çalışan kaba bir başvuru hesabıyla çözülür,
+sonuçlar karşılaştırılır:
+  - planlanamayan adımlar (döngüdeki veya döngünün ardındaki) ve döngü grupları
+  - ES/EF/LS/LF, bolluk ve kritik adımlar (tam eşitlik: toplama sırası başvuruyla aynıdır)
+  - kritik yollar (yol kümesi; EN_FAZLA_KRITIK_YOL'u aşan grafiklerde sınır ve alt küme)
+Grafikler döngüler, kendine öncül adımlar, grafikte olmayan öncüller, farklı ayraçlar ve sayı
+olmayan öğeler içerir; süreler küçük tamsayılardan seçildiğinde eşit uzunlukta birden çok kritik
+yol oluşur. Bir kısmı zincir içi NumPy geçişini de kapsayacak kadar büyük, çok zincirlidir.
+Bir uyuşmazlık bulunursa ilk örnekler yazdırılır ve çıkış kodu 1'dir.
+
+Kullanım:
+    python benchmarks/cpm_dogrulama.py [--grafik 3000] [--tohum 0]
+"""
+import argparse
+import os
+import random
+import sys
+from typing import Dict, List
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import numpy as np
+
+from cpm_motoru import EN_FAZLA_KRITIK_YOL, KRITIK_ESIK, CpmGrafigi
+
+AYRACLAR = [",", ", ", ";", " ", "/", " ; "]
+
+
+def rastgele_grafik(rnd: random.Random):
+    """(ids, öncül metinleri, öncül listeleri, süreler); listelerde grafikte olmayan ID'ler de bulunur."""
+    tur = rnd.choice(["dag", "dongulu", "zincirli", "genis"])
+    n = rnd.randint(1, 30) if tur in ("dag", "dongulu") else rnd.randint(40, 300)
+    ids = rnd.sample(range(1, 4 * n + 1), n)
+    onculler = {}
+    for i, aid in enumerate(ids):
+        if tur == "zincirli":
+            # Uzun zincirler: çoğu adımın tek öncülü bir önceki adım
+            secilen = [ids[i - 1]] if i and rnd.random() < 0.85 else rnd.sample(ids[:i], min(i, rnd.randint(0, 2)))
+        elif tur == "genis":
+            # Aynı seviyede çok sayıda kısa zincir
+            secilen = [ids[i - 20]] if i >= 20 and rnd.random() < 0.9 else []
+        else:
+            havuz = ids if tur == "dongulu" else ids[:i]
+            secilen = rnd.sample(havuz, min(len(havuz), rnd.randint(0, 3)))
+        if tur == "dongulu" and rnd.random() < 0.1:
+            secilen.append(aid)  # kendine öncül
+        if rnd.random() < 0.1:
+            secilen.append(4 * n + rnd.randint(1, 9))  # grafikte olmayan öncül
+        onculler[aid] = secilen
+
+    metinler = []
+    for aid in ids:
+        ogeler = [str(p) for p in onculler[aid]]
+        if rnd.random() < 0.05:
+            ogeler.append("x")  # sayı olmayan öğe yok sayılır
+        metinler.append(rnd.choice(AYRACLAR).join(ogeler))
+
+    if rnd.random() < 0.5:
+        sureler = [float(rnd.choice([1, 2, 3])) for _ in ids]
+    else:
+        sureler = [round(rnd.uniform(0.1, 60), 2) for _ in ids]
+    return ids, metinler, onculler, sureler
+
+
+def basvuru(ids: List[int], onculler: Dict[int, List[int]], sureler: List[float]) -> dict:
+    """Adım adım, kümelerle kaba CPM hesabı."""
+    kume = set(ids)
+    oncul = {a: list(dict.fromkeys(p for p in onculler[a] if p in kume)) for a in ids}
+    ardil = {a: [] for a in ids}
+    for a in ids:
+        for p in oncul[a]:
+            ardil[p].append(a)
+    sure = dict(zip(ids, sureler))
+
+    # Planlanabilir adımlar: bütün öncülleri planlanmış olanlar (sabit noktaya kadar)
+    sira, planli = [], set()
+    degisti = True
+    while degisti:
+        degisti = False
+        for a in ids:
+            if a not in planli and all(p in planli for p in oncul[a]):
+                planli.add(a)
+                sira.append(a)
+                degisti = True
+
+    # Döngüler: planlanamayan adımlar arasında karşılıklı erişilebilen gruplar
+    kalan = [a for a in ids if a not in planli]
+
+    def erisilen(a):
+        gorulen, yigin = set(), [a]
+        while yigin:
+            v = yigin.pop()
+            for p in oncul[v]:
+                if p not in planli and p not in gorulen:
+                    gorulen.add(p)
+                    yigin.append(p)
+        return gorulen
+
+    erisim = {a: erisilen(a) for a in kalan}
+    donguler = set()
+    for a in kalan:
+        grup = tuple(sorted(b for b in kalan if b == a or (b in erisim[a] and a in erisim[b])))
+        if len(grup) > 1 or a in erisim[a]:
+            donguler.add(grup)
+
+    es, ef, ls, lf = {}, {}, {}, {}
+    for a in sira:
+        es[a] = max((ef[p] for p in oncul[a]), default=0.0)
+        ef[a] = es[a] + sure[a]
+    proje = max(ef.values(), default=0.0)
+    for a in reversed(sira):
+        lf[a] = min((ls[s] for s in ardil[a] if s in planli), default=proje)
+        ls[a] = lf[a] - sure[a]
+    esik = KRITIK_ESIK * max(1.0, abs(proje))
+    kritik = {a for a in sira if abs(ls[a] - es[a]) <= esik}
+
+    # Kritik yollar: başlangıçtan proje bitişine sıkı (EF = ES) kritik kenarlarla giden yollar
+    yollar = []
+
+    def ilerle(yol):
+        if len(yollar) > EN_FAZLA_KRITIK_YOL:
+            return
+        son = yol[-1]
+        devam = [s for s in ardil[son] if s in kritik and abs(es[s] - ef[son]) <= esik]
+        if not devam:
+            if abs(ef[son] - proje) <= esik:
+                yollar.append(tuple(yol))
+            return
+        for s in devam:
+            ilerle(yol + [s])
+
+    for a in sira:
+        if a in kritik and abs(es[a]) <= esik:
+            ilerle([a])
+
+    return {"planli": planli, "donguler": sorted(list(g) for g in donguler), "es": es, "ef": ef,
+            "ls": ls, "lf": lf, "kritik": kritik, "proje": proje, "yollar": set(yollar)}
+
+
+def karsilastir(ids, metinler, onculler, sureler):
+    """(motor grafiği, motor sonucu, motor ile başvuru arasındaki farkların açıklamaları)."""
+    grafik = CpmGrafigi(ids, metinler)
+    sonuc = grafik.hesapla([dict(zip(ids, sureler))[a] for a in grafik.ids.tolist()])
+    beklenen = basvuru(ids, onculler, sureler)
+    farklar = []
+
+    motor_ids = grafik.ids.tolist()
+    planli = {a for a, e in zip(motor_ids, sonuc.es) if not np.isnan(e)}
+    if planli != beklenen["planli"]:
+        farklar.append(f"planlanan adımlar: {sorted(planli ^ beklenen['planli'])} farklı")
+    if grafik.donguler != beklenen["donguler"]:
+        farklar.append(f"döngüler: {grafik.donguler} != {beklenen['donguler']}")
+    if sonuc.proje_suresi != beklenen["proje"]:
+        farklar.append(f"proje süresi: {sonuc.proje_suresi} != {beklenen['proje']}")
+
+    for i, a in enumerate(motor_ids):
+        if a not in beklenen["planli"] or a not in planli:
+            continue
+        for ad, dizi in (("es", sonuc.es), ("ef", sonuc.ef), ("ls", sonuc.ls), ("lf", sonuc.lf)):
+            if dizi[i] != beklenen[ad][a]:
+                farklar.append(f"{ad.upper()}[{a}]: {dizi[i]!r} != {beklenen[ad][a]!r}")
+        if sonuc.bolluk[i] != beklenen["ls"][a] - beklenen["es"][a]:
+            farklar.append(f"bolluk[{a}]: {sonuc.bolluk[i]!r}")
+        if bool(sonuc.kritik[i]) != (a in beklenen["kritik"]):
+            farklar.append(f"kritik[{a}]: {bool(sonuc.kritik[i])}")
+
+    yollar = [tuple(y) for y in sonuc.kritik_yollar]
+    if len(set(yollar)) != len(yollar):
+        farklar.append("kritik yollar tekrarlanıyor")
+    if len(beklenen["yollar"]) <= EN_FAZLA_KRITIK_YOL:
+        if set(yollar) != beklenen["yollar"]:
+            farklar.append(f"kritik yollar: {sorted(yollar)} != {sorted(beklenen['yollar'])}")
+    elif len(yollar) != EN_FAZLA_KRITIK_YOL or not set(yollar) <= beklenen["yollar"]:
+        farklar.append(f"kritik yollar: sınırda {len(yollar)} yol, başvurunun alt kümesi değil")
+    return grafik, sonuc, farklar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPM motoru doğrulaması")
+    parser.add_argument('--grafik', type=int, default=3000, help="denenecek rastgele grafik sayısı")
+    parser.add_argument('--tohum', type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.tohum)
+    hatali, dongulu, cok_yollu = [], 0, 0
+    for k in range(args.grafik):
+        ids, metinler, onculler, sureler = rastgele_grafik(rnd)
+        grafik, sonuc, farklar = karsilastir(ids, metinler, onculler, sureler)
+        if farklar:
+            hatali.append((k, ids, metinler, sureler, farklar))
+        dongulu += bool(grafik.donguler)
+        cok_yollu += len(sonuc.kritik_yollar) > 1
+
+    print(f"{args.grafik} grafik: {dongulu} döngülü, {cok_yollu} birden çok kritik yollu")
+    if hatali:
+        print(f"BAŞARISIZ: {len(hatali)} grafikte uyuşmazlık")
+        for k, ids, metinler, sureler, farklar in hatali[:3]:
+            if len(ids) <= 30:
+                print(f"  grafik {k}: ids={ids} öncüller={metinler} süreler={sureler}")
+            else:
+                print(f"  grafik {k}: {len(ids)} adım (--tohum {args.tohum} ile yeniden üretilir)")
+            for fark in farklar[:5]:
+                print(f"    - {fark}")
+        sys.exit(1)
+    print("Tamam: motor başvuru hesabıyla aynı sonuçları veriyor.")
+
+
+if __name__ == '__main__':
+    main()
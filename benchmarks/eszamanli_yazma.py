@@ -0,0 +1,220 @@
+"""
+Çok süreçli yazma denetimi.
+
+Aynı veri klasörünü paylaşan birden çok süreç eşzamanlı olarak yazar:
+  - yazıcılar:    her biri kendi adımını oluşturur, --olcum kadar süre ölçümü kaydeder, her 10 kayıtta
+                  adımını yeniden adlandırır, her 20 kayıtta bir MOST ve bir Westinghouse analizi saklar;
+                  yarısı arka plan yazıcısıyla (write_behind), yarısı doğrudan yazar
+  - sıkıştırıcı:  yazıcılar bitene kadar compact_zaman_etudu'yu tekrar tekrar çağırır
+Veri klasörü önce geçmiş aylara yayılmış sentetik ölçümlerle doldurulur (sıkıştırılacak bölümler olsun).
+Sonunda diskteki tablolar doğrudan okunur ve denetlenir: OlcuID/AdımID/AnalizID/DetayID'ler tekil,
+ölçüm sayısı tam olarak beklenen kadar, her ölçüm yazan sürecin adımında ve her adımın son adı doğru.
+Bir denetim tutmazsa çıkış kodu 1'dir.
+
+Kullanım:
+    python benchmarks/eszamanli_yazma.py [--surec 6] [--olcum 120] [--veri-klasoru YOL]
+
+--veri-klasoru verilmezse geçici bir klasör kullanılır; verilen klasör boş olmalıdır.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+BASLA = 'basla'
+BITTI = 'bitti'
+ADLANDIRMA_ARALIGI = 10
+ANALIZ_ARALIGI = 20
+
+
+def _sure(sira: int, k: int) -> float:
+    """Süreç sırası ve kayıt numarasından tekil bir süre; denetimde ölçümün sahibini bulmaya yarar."""
+    return sira * 10000 + k + 0.5
+
+
+def _basla_bekle(klasor: str):
+    bekle = os.path.join(klasor, BASLA)
+    while not os.path.exists(bekle):
+        time.sleep(0.01)
+
+
+def yazici(klasor: str, sira: int, job_id: int, olcum: int, write_behind: bool) -> dict:
+    """Bu süreçte ölçüm ve analiz kaydeder; oluşturduğu adımı ve son adını döndürür."""
+    from data_manager import DataManager
+
+    dm = DataManager(backend='csv')
+    dm.write_behind = write_behind
+    _basla_bekle(klasor)
+    adim_id = dm.create_job_step(job_id, f"Süreç {sira}", [], "")
+    ad = f"Süreç {sira}"
+    analiz = 0
+    for k in range(olcum):
+        dm.kaydet_zaman_olcumu(job_id, adim_id, _sure(sira, k))
+        if (k + 1) % ADLANDIRMA_ARALIGI == 0:
+            ad = f"Süreç {sira} / {k + 1}"
+            dm.update_job_step(adim_id, ad, [], "")
+        if (k + 1) % ANALIZ_ARALIGI == 0:
+            dm.kaydet_most_analizi(job_id, adim_id, "Genel Hareket", 100, 3.6, "A1 B0 G1",
+                                   [{'kod': 'A', 'deger': '1', 'tekrar': 1}, {'kod': 'G', 'deger': '1'}])
+            dm.save_westinghouse_analysis(job_id, adim_id, {'Yetenek': 'Ortalama', 'NormalZaman': 1.0,
+                                                            'StandartZaman': 1.1})
+            analiz += 2
+    dm.kapat()
+    return {'adim_id': int(adim_id), 'ad': ad, 'analiz': analiz}
+
+
+def sikistirici(klasor: str) -> dict:
+    """Yazıcılar bitene kadar ölçümleri sıkıştırır; tur sayısını döndürür."""
+    from data_manager import DataManager
+
+    dm = DataManager(backend='csv')
+    _basla_bekle(klasor)
+    tur = 0
+    while not os.path.exists(os.path.join(klasor, BITTI)):
+        dm.compact_zaman_etudu()
+        tur += 1
+    dm.compact_zaman_etudu()
+    dm.kapat()
+    return {'tur': tur + 1}
+
+
+def _tek_calistir(args):
+    klasor = os.environ['LOCALAPPDATA']
+    if args.rol == 'sikistirici':
+        sonuc = sikistirici(klasor)
+    else:
+        sonuc = yazici(klasor, args.sira, args.job_id, args.olcum, args.rol == 'arka-plan')
+    print(json.dumps(sonuc, ensure_ascii=False))
+
+
+def denetle(localappdata: str, tohum_olcum: int, tohum_analiz: int, sonuclar: list, olcum: int) -> list:
+    """Diskteki tabloları okur; tutmayan denetimlerin açıklamalarını döndürür."""
+    import pandas as pd
+    from data_manager import DataManager
+    from zaman_bolumleri import bolumleri_oku
+
+    eski = os.environ.get('LOCALAPPDATA')
+    os.environ['LOCALAPPDATA'] = localappdata
+    try:
+        dm = DataManager(backend='csv')
+    finally:
+        if eski is None:
+            os.environ.pop('LOCALAPPDATA', None)
+        else:
+            os.environ['LOCALAPPDATA'] = eski
+    dm.kapat()
+
+    hatalar = []
+
+    def tekil(ad, seri):
+        tekrar = seri[seri.duplicated()]
+        if len(tekrar):
+            hatalar.append(f"{ad}: {len(tekrar)} tekrarlanan değer (ör. {tekrar.iloc[:5].tolist()})")
+
+    olcumler = bolumleri_oku(dm.zaman_etudu_klasoru, columns=dm.ZAMAN_ETUDU_COLUMNS)
+    tekil('OlcuID', olcumler['OlcuID'])
+    beklenen = tohum_olcum + len(sonuclar) * olcum
+    if len(olcumler) != beklenen:
+        hatalar.append(f"Zaman_Etudu: {len(olcumler)} satır, beklenen {beklenen}")
+
+    adimlar = pd.read_csv(dm.is_adimlari_path)
+    tekil('AdımID', adimlar['AdımID'].dropna())
+    analiz_ids = []
+    for path in (dm.westinghouse_path, dm.basic_most_analizleri_path):
+        analiz_ids.append(pd.read_csv(path)['AnalizID'])
+    tekil('AnalizID', pd.concat(analiz_ids, ignore_index=True))
+    tekil('DetayID', pd.read_csv(dm.basic_most_detaylari_path)['DetayID'])
+
+    for sira, sonuc in enumerate(sonuclar):
+        adim = adimlar[adimlar['AdımID'] == sonuc['adim_id']]
+        if len(adim) != 1 or adim['Adım Adı'].iloc[0] != sonuc['ad']:
+            hatalar.append(f"Süreç {sira}: adım {sonuc['adim_id']} adı {adim['Adım Adı'].tolist()}, "
+                           f"beklenen {sonuc['ad']!r}")
+        beklenen_sureler = {_sure(sira, k) for k in range(olcum)}
+        kendi = olcumler[olcumler['AdımID'] == sonuc['adim_id']]
+        if set(kendi['Sure']) != beklenen_sureler or len(kendi) != olcum:
+            hatalar.append(f"Süreç {sira}: {len(kendi)} ölçüm bulundu, beklenen {olcum}")
+
+    beklenen = tohum_analiz + sum(s['analiz'] for s in sonuclar)
+    bulunan = sum(len(ids) for ids in analiz_ids)
+    if bulunan != beklenen:
+        hatalar.append(f"Analizler: {bulunan} kayıt, beklenen {beklenen}")
+    return hatalar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çok süreçli yazma denetimi")
+    parser.add_argument('--surec', type=int, default=6, help="yazıcı süreç sayısı (en az 2)")
+    parser.add_argument('--olcum', type=int, default=120, help="yazıcı başına ölçüm sayısı")
+    parser.add_argument('--veri-klasoru', help="LOCALAPPDATA olarak kullanılacak boş klasör (varsayılan: geçici)")
+    parser.add_argument('--tek', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--rol', choices=['dogrudan', 'arka-plan', 'sikistirici'], help=argparse.SUPPRESS)
+    parser.add_argument('--sira', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--job-id', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.tek:
+        _tek_calistir(args)
+        return
+    if args.surec < 2:
+        parser.error("--surec en az 2 olmalı (yarısı arka plan yazıcısıyla çalışır)")
+
+    from benchmarks.veri_uretici import veri_uret
+
+    with tempfile.TemporaryDirectory() as tmp:
+        localappdata = args.veri_klasoru or tmp
+        ozet = veri_uret(localappdata, is_sayisi=2, adim_sayisi=10, olcum_sayisi=30)
+        for ad in (BASLA, BITTI):
+            if os.path.exists(os.path.join(localappdata, ad)):
+                os.remove(os.path.join(localappdata, ad))
+
+        env = dict(os.environ, LOCALAPPDATA=localappdata)
+        komut = [sys.executable, os.path.abspath(__file__), '--tek']
+        yazicilar = [subprocess.Popen(komut + ['--rol', 'arka-plan' if sira % 2 else 'dogrudan', '--sira', str(sira),
+                                               '--job-id', str(sira % 2 + 1), '--olcum', str(args.olcum)],
+                                      env=env, cwd=REPO, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                     for sira in range(args.surec)]
+        sikistiran = subprocess.Popen(komut + ['--rol', 'sikistirici'], env=env, cwd=REPO,
+                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # Süreçler içe aktarmaları bitirip aynı anda başlasın
+        time.sleep(2)
+        t0 = time.perf_counter()
+        open(os.path.join(localappdata, BASLA), 'w').close()
+
+        sonuclar, hatalar = [], []
+        for sira, surec in enumerate(yazicilar):
+            out, err = surec.communicate()
+            if surec.returncode:
+                hatalar.append(f"Süreç {sira} {surec.returncode} koduyla çıktı:\n{err}")
+            else:
+                sonuclar.append(json.loads(out.strip().splitlines()[-1]))
+        sure = time.perf_counter() - t0
+        open(os.path.join(localappdata, BITTI), 'w').close()
+        out, err = sikistiran.communicate()
+        if sikistiran.returncode:
+            hatalar.append(f"Sıkıştırıcı {sikistiran.returncode} koduyla çıktı:\n{err}")
+        else:
+            print(f"{args.surec} yazıcı × {args.olcum} ölçüm: {sure:.1f} s, "
+                  f"sıkıştırma turu: {json.loads(out.strip().splitlines()[-1])['tur']}")
+
+        if not hatalar:
+            hatalar = denetle(localappdata, ozet['Zaman_Etudu'],
+                              ozet['Westinghouse_Analizleri'] + ozet['Basic_Most_Analizleri'],
+                              sonuclar, args.olcum)
+
+    if hatalar:
+        print("BAŞARISIZ:")
+        for hata in hatalar:
+            print(f"  - {hata}")
+        sys.exit(1)
+    print("Tamam: kimlikler tekil, ölçüm sayısı ve adım adları beklendiği gibi.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Ölçümler için sentetik veri klasörü üretir.
+
+Her iş için M adımlık rastgele bir öncül grafiği (DAG: her adımın öncülleri kendinden önceki
+adımlardan seçilir), adım başına K süre ölçümü (son 12 aya yayılmış, aylık bölümlere yazılır),
+bir Westinghouse analizi ve bir Basic/Maxi/MiniMOST analizi (detaylarıyla) üretilir. Tablolar
+DataManager'ın dosya düzeninde doğrudan yazılır; sayaçlar da kaydedildiğinden açılışta tarama yapılmaz.
+
+    python -m benchmarks.veri_uretici HEDEF_KLASOR --is 50 --adim 20 --olcum 10
+HEDEF_KLASOR, LOCALAPPDATA olarak kullanılacak klasördür (veri .Entegre_Is_Etudu altına yazılır).
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO not in sys.path:
+    sys.path.insert(0, REPO)
+
+from data_manager import DataManager  # noqa: E402
+from islem_gunlugu import tablolari_atomik_yaz  # noqa: E402
+from zaman_bolumleri import bolumlere_yaz  # noqa: E402
+
+
+IS_ISTASYONLARI = ['Montaj-1', 'Montaj-2', 'Kaynak', 'Boya', 'Paketleme', 'Kalite Kontrol']
+DEGER_TURLERI = ['', 'VA', 'NVAN', 'NVA']
+
+# Westinghouse performans faktörleri: etiket -> puan (bkz. modul_westinghouse)
+YETENEK = {"Süper": 15, "Çok İyi": 11, "İyi": 6, "Orta": 0, "Zayıf": -5, "Çok Zayıf": -12}
+CABA = {"Aşırı": 13, "Çok İyi": 10, "İyi": 5, "Orta": 0, "Zayıf": -4, "Çok Zayıf": -10}
+KOSULLAR = {"İdeal": 10, "Çok İyi": 6, "İyi": 4, "Orta": 0, "Zayıf": -3, "Çok Zayıf": -7}
+TUTARLILIK = {"Mükemmel": 5, "Çok İyi": 4, "İyi": 3, "Ortalama": 0, "Zayıf": -2, "Çok Zayıf": -4}
+
+# Tek seçimli tolerans grupları (grup başına en fazla bir kolon) ve çoklu seçimli kolonlar: kolon -> puan
+TOLERANS_GRUPLARI = [
+    {'Fiziksel_Caba_Cok_Hafif': 0, 'Fiziksel_Caba_Hafif': 3, 'Fiziksel_Caba_Orta': 6, 'Fiziksel_Caba_Agir': 9},
+    {'Dusunsel_Caba_Plan_Normal': 0, 'Dusunsel_Caba_Karisik_Normal': 2, 'Dusunsel_Caba_Plan_Yogun': 4},
+    {'Poz_Serbest': 0, 'Poz_Sabit_Durus': 1, 'Poz_Sabit_Ayakta': 5, 'Poz_Cokme_Egilme': 8},
+    {'Atmosfer_Temiz': 0, 'Atmosfer_Kotu_Koku': 3},
+    {'Isı_Normal': 0, 'Isı_Soguk': 3, 'Isı_Sicak': 8},
+    {'Gurultu_Normal_Is': 0, 'Gurultu_Normal_Makine': 1, 'Gurultu_Yuksek_Sabit': 5},
+]
+TOLERANS_SECMELI = {'Genel_Kirli': 3, 'Genel_Monotonluk': 2, 'Koruyucu_Elbise_Eldiven': 2}
+
+# MOST yöntemleri: (model tipleri, parametre kodları, değer etiketi -> indis)
+MOST_YONTEMLERI = {
+    'basic': (['BasicMOST - Serbest Hareket', 'BasicMOST - Kontrollü Hareket', 'BasicMOST - Alet Kullanımı'],
+              ['A', 'B', 'G', 'P', 'M', 'X', 'I'],
+              {"Kolay": 1, "Orta": 3, "Zor": 6}),
+    'maxi': (['MaxiMOST - Parça Taşıma', 'MaxiMOST - Alet Kullanımı'],
+             ['A', 'B', 'P', 'T', 'F'],
+             {"Kolay": 1, "Orta": 3, "Zor": 6, "Çok Zor": 10}),
+    'mini': (['MiniMOST - Genel Hareket', 'MiniMOST - Kontrollü Hareket'],
+             ['A', 'B', 'G', 'P'],
+             {"Kolay": 1, "Orta": 3, "Zor": 6}),
+}
+
+
+def veri_uret(localappdata: str, is_sayisi: int, adim_sayisi: int, olcum_sayisi: int,
+              tohum: int = 0, bitis: datetime = None) -> dict:
+    """
+    localappdata altındaki boş veri klasörüne is_sayisi × adim_sayisi adımlık veri yazar ve
+    tablo başına satır sayılarını döndürür. Aynı tohum aynı veriyi üretir.
+    """
+    rng = np.random.default_rng(tohum)
+    bitis = bitis or datetime(2026, 10, 1)
+    zaman_araligi = int(timedelta(days=365).total_seconds())
+
+    eski = os.environ.get('LOCALAPPDATA')
+    os.environ['LOCALAPPDATA'] = localappdata
+    try:
+        # Yol ve kolon tanımları için (tablolar dosyalara doğrudan yazılır)
+        dm = DataManager(backend='csv')
+    finally:
+        if eski is None:
+            os.environ.pop('LOCALAPPDATA', None)
+        else:
+            os.environ['LOCALAPPDATA'] = eski
+
+    def zaman_damgasi(saniye):
+        return (bitis - timedelta(seconds=int(saniye))).strftime('%Y-%m-%d %H:%M:%S')
+
+    adimlar, olcumler, westinghouse = [], [], []
+    analizler = {ad: [] for ad in MOST_YONTEMLERI}
+    detaylar = {ad: [] for ad in MOST_YONTEMLERI}
+    adim_id = olcu_id = analiz_id = detay_id = 0
+
+    for job_id in range(1, is_sayisi + 1):
+        is_adi = f"İş {job_id:04d}"
+        adimlar.append({'JobID': job_id, 'AdımID': pd.NA, 'İş Adı': is_adi, 'Adım Adı': '',
+                        'Öncül Adım': '', 'DegerTuru': '', 'İş İstasyonu': ''})
+        is_adimlari = []
+        for i in range(adim_sayisi):
+            adim_id += 1
+            # Öncüller yalnızca önceki adımlardan: grafik her zaman döngüsüzdür
+            oncul_sayisi = min(i, int(rng.integers(0, 4)))
+            onculler = sorted(rng.choice(is_adimlari, size=oncul_sayisi, replace=False)) if oncul_sayisi else []
+            adimlar.append({'JobID': job_id, 'AdımID': adim_id, 'İş Adı': is_adi, 'Adım Adı': f"Adım {i + 1}",
+                            'Öncül Adım': ",".join(str(int(p)) for p in onculler),
+                            'DegerTuru': DEGER_TURLERI[int(rng.integers(len(DEGER_TURLERI)))],
+                            'İş İstasyonu': IS_ISTASYONLARI[int(rng.integers(len(IS_ISTASYONLARI)))]})
+            is_adimlari.append(adim_id)
+
+            # Süreler adım başına bir ortalama etrafında dağılır
+            ortalama = float(rng.uniform(2.0, 60.0))
+            sureler = np.round(np.abs(rng.normal(ortalama, ortalama * 0.15, olcum_sayisi)), 2)
+            for sure, saniye in zip(sureler, rng.integers(0, zaman_araligi, olcum_sayisi)):
+                olcu_id += 1
+                olcumler.append({'OlcuID': olcu_id, 'JobID': job_id, 'AdımID': adim_id,
+                                 'Sure': float(sure), 'Timestamp': zaman_damgasi(saniye)})
+
+            analiz_id += 1
+            westinghouse.append(_westinghouse_satiri(rng, analiz_id, job_id, adim_id, ortalama,
+                                                     zaman_damgasi(rng.integers(0, zaman_araligi))))
+
+            yontem = list(MOST_YONTEMLERI)[int(rng.integers(len(MOST_YONTEMLERI)))]
+            analiz_id += 1
+            analiz, satirlar = _most_analizi(rng, yontem, analiz_id, job_id, adim_id, detay_id + 1,
+                                             zaman_damgasi(rng.integers(0, zaman_araligi)))
+            analizler[yontem].append(analiz)
+            detaylar[yontem].extend(satirlar)
+            detay_id += len(satirlar)
+
+    tablolar = {
+        (dm.is_adimlari_path, tuple(dm.IS_ADIMLARI_COLUMNS)): adimlar,
+        (dm.westinghouse_path, tuple(dm.WESTINGHOUSE_COLUMNS)): westinghouse,
+        (dm.basic_most_analizleri_path, tuple(dm.BASIC_MOST_ANALIZLERI_COLUMNS)): analizler['basic'],
+        (dm.basic_most_detaylari_path, tuple(dm.BASIC_MOST_DETAYLARI_COLUMNS)): detaylar['basic'],
+        (dm.maxi_most_analizleri_path, tuple(dm.MAXI_MOST_ANALIZLERI_COLUMNS)): analizler['maxi'],
+        (dm.maxi_most_detaylari_path, tuple(dm.MAXI_MOST_DETAYLARI_COLUMNS)): detaylar['maxi'],
+        (dm.mini_most_analizleri_path, tuple(dm.MINI_MOST_ANALIZLERI_COLUMNS)): analizler['mini'],
+        (dm.mini_most_detaylari_path, tuple(dm.MINI_MOST_DETAYLARI_COLUMNS)): detaylar['mini'],
+    }
+    dm.flush()
+    tablolari_atomik_yaz({path: pd.DataFrame(rows, columns=list(cols)) for (path, cols), rows in tablolar.items()})
+    df_olcum = pd.DataFrame(olcumler, columns=dm.ZAMAN_ETUDU_COLUMNS).sort_values('Timestamp', kind='stable')
+    bolumlere_yaz(dm.zaman_etudu_klasoru, df_olcum)
+    dm._save_counters({'JobID': is_sayisi, 'AdımID': adim_id, 'OlcuID': olcu_id,
+                       'AnalizID': analiz_id, 'DetayID': detay_id})
+    dm.kapat()
+
+    ozet = {os.path.splitext(os.path.basename(path))[0]: len(rows) for (path, _), rows in tablolar.items()}
+    ozet['Zaman_Etudu'] = len(olcumler)
+    return ozet
+
+
+def _westinghouse_satiri(rng, analiz_id, job_id, adim_id, gozlenen, timestamp) -> dict:
+    secim = [list(faktor)[int(rng.integers(len(faktor)))] for faktor in (YETENEK, CABA, KOSULLAR, TUTARLILIK)]
+    puan = YETENEK[secim[0]] + CABA[secim[1]] + KOSULLAR[secim[2]] + TUTARLILIK[secim[3]]
+    satir = {'AnalizID': analiz_id, 'JobID': job_id, 'AdımID': adim_id, 'Yetenek': secim[0], 'Çaba': secim[1],
+             'Çalışma Koşulları': secim[2], 'Tutarlılık': secim[3]}
+    tolerans = int(rng.integers(2, 8))
+    satir['Kisisel_Gereksinimler'] = tolerans
+    for grup in TOLERANS_GRUPLARI:
+        if rng.random() < 0.7:
+            kolon = list(grup)[int(rng.integers(len(grup)))]
+            satir[kolon] = grup[kolon]
+            tolerans += grup[kolon]
+    for kolon, deger in TOLERANS_SECMELI.items():
+        if rng.random() < 0.2:
+            satir[kolon] = deger
+            tolerans += deger
+    normal = gozlenen * (1 + puan / 100)
+    satir['NormalZaman'] = round(normal, 4)
+    satir['StandartZaman'] = round(normal * (1 + tolerans / 100), 4)
+    satir['Timestamp'] = timestamp
+    return satir
+
+
+def _most_analizi(rng, yontem, analiz_id, job_id, adim_id, ilk_detay_id, timestamp):
+    modeller, kodlar, degerler = MOST_YONTEMLERI[yontem]
+    secilen = sorted(rng.choice(len(kodlar), size=int(rng.integers(3, len(kodlar) + 1)), replace=False))
+    satirlar, kodlama, tmu = [], [], 0
+    for k in secilen:
+        etiket = list(degerler)[int(rng.integers(len(degerler)))]
+        tekrar = int(rng.integers(1, 4)) if rng.random() < 0.2 else 1
+        tmu += degerler[etiket] * tekrar
+        kodlama.append(f"{kodlar[k]}({tekrar}){degerler[etiket]}" if tekrar > 1 else f"{kodlar[k]}{degerler[etiket]}")
+        satirlar.append({'ParametreKodu': kodlar[k], 'SecilenDeger': etiket, 'TekrarSayisi': tekrar})
+    genel_tekrar = int(rng.integers(1, 4))
+    satirlar.append({'ParametreKodu': 'GenelTekrar', 'SecilenDeger': '', 'TekrarSayisi': genel_tekrar})
+    tmu *= genel_tekrar * 10
+    for i, satir in enumerate(satirlar):
+        satir.update({'DetayID': ilk_detay_id + i, 'AnalizID': analiz_id})
+    analiz = {'AnalizID': analiz_id, 'JobID': job_id, 'AdımID': adim_id,
+              'ModelTipi': modeller[int(rng.integers(len(modeller)))], 'ToplamTMU': tmu,
+              'ToplamSaniye': round(tmu * 0.036, 2), 'Kodlama': " ".join(kodlama), 'Timestamp': timestamp}
+    return analiz, satirlar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik veri klasörü üretir")
+    parser.add_argument('hedef', help="LOCALAPPDATA olarak kullanılacak (boş) klasör")
+    parser.add_argument('--is', dest='is_sayisi', type=int, default=50)
+    parser.add_argument('--adim', type=int, default=20)
+    parser.add_argument('--olcum', type=int, default=10)
+    parser.add_argument('--tohum', type=int, default=0)
+    args = parser.parse_args()
+    os.makedirs(args.hedef, exist_ok=True)
+    ozet = veri_uret(args.hedef, args.is_sayisi, args.adim, args.olcum, tohum=args.tohum)
+    print(json.dumps(ozet, ensure_ascii=False, indent=1))
+
+
+if __name__ == '__main__':
+    main()
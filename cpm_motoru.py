@@ -0,0 +1,408 @@
+import operator
+import re
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import izleme
+
+
+# Kritik Yol Yöntemi (CPM). Öncüller bir kez ayrıştırılıp CSR biçiminde tamsayı dizilerine
+# çevrilir (CpmGrafigi): indptr[i]:indptr[i+1] aralığı, i. adımın öncüllerinin konumlarıdır.
+# Tek ardıllı bir adımdan tek öncüllü ardılına giden kenarlar zincir oluşturur (ardışık iş
+# adımları); zincir içinde ES/LF adım adım toplanır (ES + süre, LF - süre: adım adım geçişle aynı
+# kayan nokta sonuçları). Zincirler seviyelere ayrılır ve
+# ileri/geri geçişler seviye seviye NumPy ile yapılır: döngü sayısı adım sayısına değil, zincirler
+# arası seviye sayısına bağlıdır. Döngüdeki (ve döngünün ardındaki) adımlar planlanamaz: süreleri
+# NaN kalır, döngüler CpmGrafigi.donguler'de adım ID'leriyle raporlanır.
+
+# Bolluğu bu değerden küçük adımlar kritik sayılır (kayan nokta toplamları için)
+KRITIK_ESIK = 1e-9
+
+# Zincir içi geçişte bir konum, en az bu kadar zincirde varsa NumPy ile, yoksa kalan uzun zincirler
+# tek tek (itertools.accumulate) ilerletilir
+_VEKTOR_ESIGI = 16
+
+# Listelenecek en fazla kritik yol; dallanan grafiklerde yol sayısı üstel artabilir
+EN_FAZLA_KRITIK_YOL = 100
+
+
+# ; / boşluk ve virgül öncül ayracıdır
+_ONCUL_AYRAC = re.compile(r"[,;/\s]+")
+
+
+def oncul_ayristir(value) -> List[int]:
+    """
+    '1', '1,2', '1 2', '1;2' gibi yazılmış öncül listelerini
+    [1, 2] şeklinde int listesine çevirir.
+    """
+    if not isinstance(value, str):
+        if pd.isna(value):
+            return []
+        value = str(value)
+    if value.isdecimal():
+        # tek öncül (en sık durum)
+        return [int(value)]
+    result = []
+    for t in _ONCUL_AYRAC.split(value):
+        if not t:
+            continue
+        try:
+            result.append(int(t))
+        except ValueError:
+            # sayı değilse yok say
+            pass
+    return result
+
+
+def _araliklar(baslar: np.ndarray, bitisler: np.ndarray) -> np.ndarray:
+    """[bas, bit) aralıklarının uç uca eklenmiş konumları."""
+    uzunluk = bitisler - baslar
+    toplam = int(uzunluk.sum())
+    if not toplam:
+        return np.empty(0, dtype=np.int64)
+    kayma = np.cumsum(uzunluk) - uzunluk
+    return np.repeat(baslar - kayma, uzunluk) + np.arange(toplam)
+
+
+class CpmGrafigi:
+    """
+    Bir işin öncül grafiği:
+        ids:      adım ID'leri (ilk görülme sırasıyla, tekrarsız)
+        indptr, indices: öncüllerin CSR dizileri (konumlar; grafikte olmayan ID'ler atlanır)
+        sira:     planlanan adımlar; zincirler bitişik (baş adım önde), seviye sırasıyla
+        seviye:   adımın zincirinin seviyesi; döngüdeki veya döngünün ardındaki adımlar için -1
+        donguler: birbirine döngüsel bağlı adım grupları (her biri sıralı ID listesi)
+    """
+
+    def __init__(self, ids: Sequence[int], onculler: Sequence):
+        # Aynı ID birden fazla verilirse son öncül metni geçerlidir
+        oncul_metni: Dict[int, object] = {}
+        for aid, oncul in zip(ids, onculler):
+            oncul_metni[int(aid)] = oncul
+
+        self.ids = np.fromiter(oncul_metni.keys(), dtype=np.int64, count=len(oncul_metni))
+        konum = {aid: i for i, aid in enumerate(oncul_metni)}
+        n = len(self.ids)
+
+        listeler = [[konum[p] for p in oncul_ayristir(oncul) if p in konum] for oncul in oncul_metni.values()]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        self.indptr[1:] = np.cumsum([len(l) for l in listeler])
+        self.indices = np.fromiter((p for l in listeler for p in l), dtype=np.int64, count=int(self.indptr[-1]))
+
+        # Ardıllar (ters CSR): kenarlar öncüle göre sıralanır
+        self.hedef = np.repeat(np.arange(n), np.diff(self.indptr))
+        sira = np.argsort(self.indices, kind="stable")
+        self.ardil_indices = self.hedef[sira]
+        self.ardil_indptr = np.zeros(n + 1, dtype=np.int64)
+        self.ardil_indptr[1:] = np.cumsum(np.bincount(self.indices, minlength=n))
+
+        self._seviyelendir()
+        self.donguler = self._donguleri_bul()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _seviyelendir(self):
+        """
+        Zincirleri kurar ve Kahn algoritmasıyla seviyelere ayırır: son adımının ardıllarından
+        giriş derecesi sıfırlananlar bir sonraki seviyenin zincir başlarıdır.
+        """
+        # Grafik başına bir kez çalışır; düz listelerle, seviye başına NumPy çağrısından ucuzdur
+        n = len(self.ids)
+        giris = np.diff(self.indptr)
+        cikis = np.diff(self.ardil_indptr)
+        zincir = (giris[self.hedef] == 1) & (cikis[self.indices] == 1) & (self.indices != self.hedef)
+        sonraki = np.full(n, -1, dtype=np.int64)
+        sonraki[self.indices[zincir]] = self.hedef[zincir]
+        sonraki = sonraki.tolist()
+
+        ptr = self.ardil_indptr.tolist()
+        ardil = self.ardil_indices.tolist()
+        derece = giris.tolist()
+
+        # Zincir z = sira[zincir_sinir[z]:zincir_sinir[z+1]]; seviye L zincirleri = [seviye_sinir[L], seviye_sinir[L+1])
+        sira: List[int] = []
+        zincir_sinir = [0]
+        seviye_sinir = [0]
+        cephe = [v for v, d in enumerate(derece) if d == 0]
+        while cephe:
+            yeni = []
+            for v in cephe:
+                sira.append(v)
+                while sonraki[v] >= 0:
+                    v = sonraki[v]
+                    sira.append(v)
+                zincir_sinir.append(len(sira))
+                for w in ardil[ptr[v]:ptr[v + 1]]:
+                    derece[w] -= 1
+                    if derece[w] == 0:
+                        yeni.append(w)
+            seviye_sinir.append(len(zincir_sinir) - 1)
+            cephe = yeni
+
+        self.sira = np.asarray(sira, dtype=np.int64)
+        self.zincir_sinir = np.asarray(zincir_sinir, dtype=np.int64)
+        self.seviye_sinir = np.asarray(seviye_sinir, dtype=np.int64)
+        self._bas_konum = self.zincir_sinir[:-1]
+        self._son_konum = self.zincir_sinir[1:] - 1
+        self._zincir_uzunluk = np.diff(self.zincir_sinir)
+        self.zincir_bas = self.sira[self._bas_konum]
+        self.zincir_son = self.sira[self._son_konum]
+
+        self.seviye = np.full(n, -1, dtype=np.int64)
+        zincir_seviyesi = np.repeat(np.arange(len(seviye_sinir) - 1), np.diff(self.seviye_sinir))
+        self.seviye[self.sira] = np.repeat(zincir_seviyesi, self._zincir_uzunluk)
+        self._gecisleri_hazirla()
+
+    def _gecisleri_hazirla(self):
+        """
+        Geçişlerde seviye başına kullanılan diziler (self._seviyeler). İleri geçiş seviye >= 1 zincir
+        başlarının öncüllerini (hepsi zincir sonudur), geri geçiş ardılı olan zincir sonlarının
+        ardıllarını (hepsi zincir başıdır) okur. Zincir içi adımlar konum konum ilerletilir: j. adım
+        dizileri, uzunluğu j'den büyük zincirlerin bir önceki (ileri) / sonraki (geri) adım konumlarıdır.
+        """
+        def _dilimler(indptr, indices, adimlar, sinir):
+            # sinir aralığı başına (kenar uçları, reduceat başlangıçları); boş aralık için None
+            uzunluk = indptr[adimlar + 1] - indptr[adimlar]
+            kenar = indices[_araliklar(indptr[adimlar], indptr[adimlar + 1])]
+            bitis = np.cumsum(uzunluk)
+            bas = bitis - uzunluk
+            kenar_sinir = np.concatenate(([0], bitis))[sinir].tolist()
+            return [(kenar[ka:kb], bas[a:b] - ka) if a < b else None
+                    for a, b, ka, kb in zip(sinir[:-1], sinir[1:], kenar_sinir[:-1], kenar_sinir[1:])]
+
+        seviye_sinir = self.seviye_sinir.tolist()
+        ileri = [None] + (_dilimler(self.indptr, self.indices, self.zincir_bas[seviye_sinir[1]:],
+                                    [s - seviye_sinir[1] for s in seviye_sinir[1:]])
+                          if len(seviye_sinir) > 2 else [])
+
+        # Geri: yalnızca son adımının ardılı olan zincirler (diğerlerinin LF'si proje süresidir)
+        dolu = np.flatnonzero(self.ardil_indptr[self.zincir_son + 1] > self.ardil_indptr[self.zincir_son])
+        dolu_sinir = np.searchsorted(dolu, self.seviye_sinir).tolist()
+        geri = _dilimler(self.ardil_indptr, self.ardil_indices, self.zincir_son[dolu], dolu_sinir)
+        # Seviye içindeki sıra (seviye dizilerine konum)
+        dolu_sira = dolu - self.seviye_sinir[np.searchsorted(self.seviye_sinir, dolu, side="right") - 1]
+
+        bas_l, son_l = self._bas_konum.tolist(), self._son_konum.tolist()
+        self._seviyeler = []
+        for L, (za, zb) in enumerate(zip(seviye_sinir[:-1], seviye_sinir[1:])):
+            bas, son = self._bas_konum[za:zb], self._son_konum[za:zb]
+            ileri_adim, geri_adim = [], []
+            j = 1
+            if zb - za >= _VEKTOR_ESIGI:
+                uzunluk = self._zincir_uzunluk[za:zb]
+                sec = uzunluk > j
+                while np.count_nonzero(sec) >= _VEKTOR_ESIGI:
+                    ileri_adim.append(bas[sec] + (j - 1))
+                    geri_adim.append(son[sec] - (j - 1))
+                    j += 1
+                    sec = uzunluk > j
+            # Kalan zincirlerin ilk j (ileri) / son j (geri) adımı bilinir
+            uzun = [(a, b, j) for a, b in zip(bas_l[za:zb], son_l[za:zb]) if b - a >= j]
+            if geri[L] is not None:
+                a, b = dolu_sinir[L], dolu_sinir[L + 1]
+                geri_dilim = (dolu_sira[a:b],) + geri[L]
+            else:
+                geri_dilim = None
+            self._seviyeler.append((bas, son, self.zincir_bas[za:zb], self.zincir_son[za:zb],
+                                    ileri[L], geri_dilim, ileri_adim, geri_adim, uzun))
+
+    def _donguleri_bul(self) -> List[List[int]]:
+        """Planlanamayan adımlar arasındaki kuvvetli bağlı bileşenler (Tarjan, yinelemeli)."""
+        kalan = np.flatnonzero(self.seviye < 0)
+        if not kalan.size:
+            return []
+        kalan_kume = set(kalan.tolist())
+        onculler = {v: [int(p) for p in self.indices[self.indptr[v]:self.indptr[v + 1]] if int(p) in kalan_kume]
+                    for v in kalan_kume}
+
+        indeks: Dict[int, int] = {}
+        dusuk: Dict[int, int] = {}
+        yigin: List[int] = []
+        yiginda = set()
+        donguler = []
+        sayac = 0
+        for kok in sorted(kalan_kume):
+            if kok in indeks:
+                continue
+            is_yigini = [(kok, iter(onculler[kok]))]
+            indeks[kok] = dusuk[kok] = sayac
+            sayac += 1
+            yigin.append(kok)
+            yiginda.add(kok)
+            while is_yigini:
+                v, komsular = is_yigini[-1]
+                ilerledi = False
+                for w in komsular:
+                    if w not in indeks:
+                        indeks[w] = dusuk[w] = sayac
+                        sayac += 1
+                        yigin.append(w)
+                        yiginda.add(w)
+                        is_yigini.append((w, iter(onculler[w])))
+                        ilerledi = True
+                        break
+                    if w in yiginda:
+                        dusuk[v] = min(dusuk[v], indeks[w])
+                if ilerledi:
+                    continue
+                is_yigini.pop()
+                if is_yigini:
+                    u = is_yigini[-1][0]
+                    dusuk[u] = min(dusuk[u], dusuk[v])
+                if dusuk[v] == indeks[v]:
+                    bilesen = []
+                    while True:
+                        w = yigin.pop()
+                        yiginda.discard(w)
+                        bilesen.append(w)
+                        if w == v:
+                            break
+                    # Tek adımlı bileşen yalnızca kendi kendinin öncülüyse döngüdür
+                    if len(bilesen) > 1 or v in onculler[v]:
+                        donguler.append(sorted(int(self.ids[w]) for w in bilesen))
+        return sorted(donguler)
+
+    def onculler(self, i: int) -> List[int]:
+        """i. adımın (konum) öncül ID'leri, öncül metnindeki sırayla."""
+        return self.ids[self.indices[self.indptr[i]:self.indptr[i + 1]]].tolist()
+
+    def hesapla(self, sureler: Sequence[float]) -> "CpmSonucu":
+        """sureler: self.ids sırasıyla adım süreleri."""
+        if len(sureler) != len(self.ids):
+            raise ValueError(f"Süre sayısı ({len(sureler)}) adım sayısıyla ({len(self.ids)}) uyuşmuyor.")
+        return CpmSonucu(self, np.asarray(sureler, dtype=float))
+
+
+class CpmSonucu:
+    """
+    Bir süre kümesiyle CPM geçişleri (diziler CpmGrafigi.ids sırasıyla):
+        es, ef, ls, lf: erken/geç başlama ve bitiş; planlanamayan adımlar için NaN
+        bolluk: toplam bolluk (LS - ES)
+        kritik: bolluğu sıfır olan planlanmış adımlar
+        kritik_yollar: başlangıçtan proje bitişine sıkı bağlı kritik adım dizileri (ID)
+    """
+
+    def __init__(self, grafik: CpmGrafigi, sure: np.ndarray):
+        self.grafik = grafik
+        self.sure = sure
+        n = len(grafik)
+        self.es = np.full(n, np.nan)
+        self.ef = np.full(n, np.nan)
+        self.ls = np.full(n, np.nan)
+        self.lf = np.full(n, np.nan)
+
+        self.proje_suresi = 0.0
+        if grafik.sira.size:
+            self._gecisler()
+
+        planli = grafik.sira
+        self.bolluk = self.ls - self.es
+        self.kritik = np.zeros(n, dtype=bool)
+        self.kritik[planli] = np.abs(self.bolluk[planli]) <= KRITIK_ESIK * max(1.0, abs(self.proje_suresi))
+        self.kritik_yollar = self._kritik_yollar()
+
+    def _gecisler(self):
+        """
+        İleri: zincir başının ES'si öncüllerinin (zincir sonları) en büyük EF'sidir (seviye 0: 0).
+        Geri: zincir sonunun LF'si ardıllarının (zincir başları) en küçük LS'sidir (ardılı yoksa
+        proje süresi). Zincir içinde ES bir önceki adımın ES + süresi, LF bir sonrakinin LF - süresidir.
+        """
+        g = self.grafik
+        n = len(g)
+        sure = self.sure[g.sira]
+        sure_l = sure.tolist()
+
+        es = np.empty(len(sure))  # sira sırasıyla
+        ef = np.empty(n)  # yalnızca zincir sonları için
+        for bas, son, _, son_adim, dilim, _, adimlar, _, uzun in g._seviyeler:
+            es[bas] = 0.0 if dilim is None else np.maximum.reduceat(ef[dilim[0]], dilim[1])
+            for k in adimlar:
+                es[k + 1] = es[k] + sure[k]
+            for a, b, j in uzun:
+                k = a + j - 1
+                es[k:b + 1] = list(accumulate(sure_l[k:b], initial=float(es[k])))
+            ef[son_adim] = es[son] + sure[son]
+        self.es[g.sira] = es
+        self.ef[g.sira] = es + sure
+        self.proje_suresi = float(self.ef[g.sira].max())
+
+        # Planlanamayan ardıllar +inf: en küçüğe katılmaz, hepsi öyleyse LF proje süresi olur
+        # (planlanmış bir ardılın LS'si proje süresini aşamaz)
+        p = self.proje_suresi
+        lf = np.empty(len(sure))  # sira sırasıyla
+        ls = np.full(n, np.inf)  # yalnızca zincir başları için
+        for bas, son, bas_adim, _, _, dilim, _, adimlar, uzun in reversed(g._seviyeler):
+            lf_son = np.full(len(son), p)
+            if dilim is not None:
+                zincirler, kenar, kb = dilim
+                lf_son[zincirler] = np.minimum(np.minimum.reduceat(ls[kenar], kb), p)
+            lf[son] = lf_son
+            for k in adimlar:
+                lf[k - 1] = lf[k] - sure[k]
+            for a, b, j in uzun:
+                k = b - j + 1
+                lf[a:k + 1] = list(accumulate(reversed(sure_l[a + 1:k + 1]), operator.sub,
+                                              initial=float(lf[k])))[::-1]
+            ls[bas_adim] = lf[bas] - sure[bas]
+        self.lf[g.sira] = lf
+        self.ls[g.sira] = lf - sure
+
+    def _kritik_yollar(self) -> List[List[int]]:
+        """
+        Kritik adımlar arasında EF(öncül) = ES(ardıl) olan kenarlardan geçen tam yollar.
+        Bolluk zincir boyunca sabittir; arama zincirler üzerinde yapılır, yol zincirlerden kurulur.
+        """
+        g = self.grafik
+        if not self.kritik.any():
+            return []
+        esik = KRITIK_ESIK * max(1.0, abs(self.proje_suresi))
+        z = len(g.zincir_bas)
+        zincir_no = np.empty(len(g), dtype=np.int64)
+        zincir_no[g.sira] = np.repeat(np.arange(z), g._zincir_uzunluk)
+
+        # Zincirler arası sıkı kritik kenarlar (zincir sonu -> zincir başı), öncül zincire göre CSR
+        bas_mi = np.zeros(len(g), dtype=bool)
+        bas_mi[g.zincir_bas] = True
+        k, h = g.indices, g.hedef
+        sik = bas_mi[h] & self.kritik[k] & self.kritik[h] & (np.abs(self.es[h] - self.ef[k]) <= esik)
+        k, h = zincir_no[k[sik]], zincir_no[h[sik]]
+        ardil = h[np.argsort(k, kind="stable")].tolist()
+        ptr = np.zeros(z + 1, dtype=np.int64)
+        ptr[1:] = np.cumsum(np.bincount(k, minlength=z))
+        ptr = ptr.tolist()
+        bitis = (np.abs(self.ef[g.zincir_son] - self.proje_suresi) <= esik).tolist()
+        baslar = np.flatnonzero(self.kritik[g.zincir_bas] & (np.abs(self.es[g.zincir_bas]) <= esik)).tolist()
+        sinir = g.zincir_sinir.tolist()
+
+        # Derinlik öncelikli arama; yol, ebeveyn göstergeleriyle yalnızca bulununca kurulur
+        izler: List[Tuple[int, int]] = []
+        yollar: List[List[int]] = []
+        yigin = [(v, -1) for v in reversed(baslar)]
+        while yigin and len(yollar) < EN_FAZLA_KRITIK_YOL:
+            v, ebeveyn = yigin.pop()
+            izler.append((v, ebeveyn))
+            iz = len(izler) - 1
+            if ptr[v] == ptr[v + 1]:
+                if bitis[v]:
+                    zincirler = []
+                    while iz >= 0:
+                        zincirler.append(izler[iz][0])
+                        iz = izler[iz][1]
+                    adimlar = np.concatenate([g.sira[sinir[c]:sinir[c + 1]] for c in reversed(zincirler)])
+                    yollar.append(g.ids[adimlar].tolist())
+                continue
+            yigin.extend((w, iz) for w in reversed(ardil[ptr[v]:ptr[v + 1]]))
+        return yollar
+
+
+def cpm(ids: Sequence[int], onculler: Sequence, sureler: Dict[int, float]) -> CpmSonucu:
+    """Tek seferlik hesap: sureler {AdımID: süre} (olmayanlar 0)."""
+    grafik = CpmGrafigi(ids, onculler)
+    return grafik.hesapla([float(sureler.get(aid, 0.0) or 0.0) for aid in grafik.ids.tolist()])
+
+
+izleme.sinifi_olc(CpmGrafigi, ['__init__', 'hesapla'])
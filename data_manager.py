@@ -1,17 +1,112 @@
 import os
+import io
+import json
+import re
+import time
+import uuid
+import glob
+import socket
+import queue
+import itertools
+import atexit
+import threading
+from collections import namedtuple
+from contextlib import contextmanager, ExitStack
 from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+import izleme
+from islem_gunlugu import IslemGunlugu, ANAHTAR_KOLONLARI, islemi_uygula, kuyrugu_onar, tablolari_atomik_yaz
+from sema_gocleri import gocleri_uygula
+from zaman_bolumleri import (KLASOR_ADI, ay_anahtari, aylara_ayir, bolum_adlari, bolum_araligi, bolum_ozeti,
+                             bolumleri_oku, bolumlere_yaz, dosya_imzasi, ilgili_bolumler, kapsayan_bolum,
+                             manifest_oku, manifest_yaz)
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+def _kilit_al(lock_path, timeout=10.0):
+    """
+    Süreçler arası danışma (advisory) kilidi; kilit dosyasının ilk baytını kilitler ve açık
+    dosyayı döndürür (bkz. _kilidi_birak). timeout süresinde alınamazsa TimeoutError.
+    Kilit açık dosyaya bağlıdır: aynı süreçte ikinci kez alınmaya çalışılırsa da beklenir.
+    """
+    f = open(lock_path, 'a+b')
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if os.name == 'nt':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return f
+        except OSError:
+            if time.monotonic() > deadline:
+                f.close()
+                raise TimeoutError(f"Kilit alınamadı: {lock_path}")
+            time.sleep(0.01)
+
+
+def _kilidi_birak(f):
+    try:
+        if os.name == 'nt':
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    finally:
+        f.close()
+
+
+@contextmanager
+def _file_lock(lock_path, timeout=10.0):
+    """_kilit_al / _kilidi_birak çifti için bağlam yöneticisi."""
+    f = _kilit_al(lock_path, timeout)
+    try:
+        yield
+    finally:
+        _kilidi_birak(f)
+
+
+# Arka plan yazıcısının henüz diske yazmadığı önbellek girdilerinin imzası
+_YAZILMADI = object()
+
+# DataManager değişiklik olayları (bkz. DataManager.subscribe)
+JOB_CREATED = 'job_created'
+JOB_DELETED = 'job_deleted'
+STEP_CREATED = 'step_created'
+STEP_UPDATED = 'step_updated'              # ad, öncül veya iş istasyonu değişti
+STEP_DELETED = 'step_deleted'
+STEP_VALUE_TYPE_CHANGED = 'step_value_type_changed'
+MEASUREMENT_ADDED = 'measurement_added'
+ANALYSIS_SAVED = 'analysis_saved'          # veri['ModelTipi']: 'Westinghouse', 'BasicMOST', ...
+
+# tur: yukarıdaki sabitlerden biri; job_id/step_id: etkilenen iş/adım (yoksa None); veri: ek alanlar
+DegisiklikOlayi = namedtuple('DegisiklikOlayi', ['tur', 'job_id', 'step_id', 'veri'])
+
+def uygulama_veri_klasoru():
+    """Kullanıcının yerel uygulama veri klasörü (DataManager.app_data_path)."""
+    return os.path.join(os.getenv('LOCALAPPDATA'), '.Entegre_Is_Etudu')
+
+
 class DataManager:
     # BU DOĞRU KOD
-    def __init__(self):
-        app_data_path = os.path.join(os.getenv('LOCALAPPDATA'), '.Entegre_Is_Etudu')
+    def __init__(self, backend=None):
+        app_data_path = uygulama_veri_klasoru()
         os.makedirs(app_data_path, exist_ok=True)
+        self.app_data_path = app_data_path
 
         self.is_adimlari_path = os.path.join(app_data_path, "Is_Adimlari.csv")
+        # Eski tek dosyalı düzen; CSV modunda ölçümler zaman_etudu_klasoru'ndeki aylık bölümlerdedir
+        # (bkz. zaman_bolumleri). SQLite'ta tablo adı ve dışa aktarma için kullanılır.
         self.zaman_etudu_path = os.path.join(app_data_path, "Zaman_Etudu.csv")
+        self.zaman_etudu_klasoru = os.path.join(app_data_path, KLASOR_ADI)
         self.westinghouse_path = os.path.join(app_data_path, "Westinghouse_Analizleri.csv")
         self.basic_most_analizleri_path = os.path.join(app_data_path, "Basic_Most_Analizleri.csv")
         self.basic_most_detaylari_path = os.path.join(app_data_path, "Basic_Most_Detaylari.csv")
@@ -20,6 +115,17 @@ class DataManager:
         self.mini_most_analizleri_path = os.path.join(app_data_path, "Mini_Most_Analizleri.csv")
         self.mini_most_detaylari_path = os.path.join(app_data_path, "Mini_Most_Detaylari.csv")
         self.kok_raporu_template_path = os.path.join(app_data_path, "KOK_RAPOR.xlsm")
+        self.sayaclar_path = os.path.join(app_data_path, "Sayaclar.json")
+        self.ayarlar_path = os.path.join(app_data_path, "Ayarlar.json")
+        self.sqlite_path = os.path.join(app_data_path, "Entegre_Is_Etudu.sqlite")
+        # Süreçler arası kilit dosyaları tek klasörde (bkz. _kilit_yolu). Tablo ve bölüm kilitleri kalıcıdır:
+        # başka bir süreç açmışken silinen kilit dosyası yeniden yaratılınca iki süreç aynı anda kilit alabilir.
+        self.kilit_klasoru = os.path.join(app_data_path, ".kilitler")
+        os.makedirs(self.kilit_klasoru, exist_ok=True)
+        # Klasör ağ paylaşımında birden çok iş istasyonunca kullanılabilir: her DataManager'ın
+        # kendi günlüğü vardır (bkz. _gunlugu_oynat)
+        self.gunluk_path = os.path.join(
+            app_data_path, f"Gunluk-{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}.jsonl")
         
         
 
@@ -41,10 +147,99 @@ class DataManager:
         self.MAXI_MOST_DETAYLARI_COLUMNS = ['DetayID', 'AnalizID', 'ParametreKodu', 'SecilenDeger', 'TekrarSayisi']
         self.MINI_MOST_ANALIZLERI_COLUMNS = ['AnalizID', 'JobID', 'AdımID', 'ModelTipi', 'ToplamTMU', 'ToplamSaniye', 'Kodlama', 'Timestamp']
         self.MINI_MOST_DETAYLARI_COLUMNS = ['DetayID', 'AnalizID', 'ParametreKodu', 'SecilenDeger', 'TekrarSayisi']
-        self.IS_ADIMLARI_DTYPES = {'JobID': 'Int64', 'AdımID': 'Int64', 'Öncül Adım': str}
+        self.IS_ADIMLARI_DTYPES = {'JobID': 'Int32', 'AdımID': 'Int32', 'Öncül Adım': str}
+
+        # Bellek içi tipler: az sayıda farklı değer alan metinler category, ID'ler Int32.
+        # Süreler float64 kalır: tablo yeniden yazılınca diske bellekteki değer gider, float32 basamak kaybettirir.
+        # Tablo diskten yüklenirken ve yazılan tablo önbelleğe konurken uygulanır (bkz. _compact_dtypes).
+        analiz_tipleri = {'AnalizID': 'Int32', 'JobID': 'Int32', 'AdımID': 'Int32', 'ModelTipi': 'category'}
+        detay_tipleri = {'DetayID': 'Int32', 'AnalizID': 'Int32', 'ParametreKodu': 'category',
+                         'SecilenDeger': 'category', 'TekrarSayisi': 'Int32'}
+        self.BELLEK_TIPLERI = {
+            self.is_adimlari_path: {'JobID': 'Int32', 'AdımID': 'Int32', 'İş Adı': 'category', 'Adım Adı': 'category',
+                                    'DegerTuru': 'category', 'İş İstasyonu': 'category'},
+            self.zaman_etudu_path: {'OlcuID': 'Int32', 'JobID': 'Int32', 'AdımID': 'Int32'},
+            self.westinghouse_path: {'AnalizID': 'Int32', 'JobID': 'Int32', 'AdımID': 'Int32',
+                                     'Yetenek': 'category', 'Çaba': 'category', 'Çalışma Koşulları': 'category',
+                                     'Tutarlılık': 'category'},
+            self.basic_most_analizleri_path: analiz_tipleri,
+            self.basic_most_detaylari_path: detay_tipleri,
+            self.maxi_most_analizleri_path: analiz_tipleri,
+            self.maxi_most_detaylari_path: detay_tipleri,
+            self.mini_most_analizleri_path: analiz_tipleri,
+            self.mini_most_detaylari_path: detay_tipleri,
+        }
+
+        # Bellek içi tablo önbelleği: {dosya_yolu: (imza, dtypes, DataFrame)}
+        # İmza (mtime_ns, boyut) değişmedikçe CSV yeniden ayrıştırılmaz.
+        self._table_cache = {}
+        self._depo = None
+        # Her önbellek değişikliğinde ilerleyen bellek sürümü: {dosya_yolu: sürüm}
+        self._surumler = {}
+        self._surum_sayaci = itertools.count(1)
+
+        # Arka plan yazıcısı (yalnızca CSV): işlemler günlüğe ve önbelleğe hemen, tablo dosyalarına
+        # kuyruktan uygulanır (bkz. _uygula). {dosya_yolu: {'df': tam yazılacak tablo veya None,
+        # 'rows': sonuna eklenecek satırlar, 'seq': kapsanan son günlük kaydı}}
+        self.write_behind = True
+        self._bekleyen = {}
+        self._yaziliyor = set()
+        self._sirada = set()
+        self._yazma_kuyrugu = queue.Queue(maxsize=32)
+        self._yazici = None
+        self._yazma_kilidi = threading.RLock()  # önbellek ve bekleyen işler
+        self._gunluk_kilidi = threading.RLock() # günlük kayıtları (kilit sırası: disk > günlük > yazma)
+        self._disk_kilidi = threading.RLock()   # dosyaya yazma; tablo dosya kilitleri bunun altında alınır
+        # Süreçler arası: her tablonun yazmaları .kilitler/ altındaki dosya kilidi altında yapılır.
+        # Önbellek diskteki hangi dosya imzası üzerine kurulduysa _taban'da tutulur; yazarken dosya
+        # başka bir süreç tarafından değiştirilmişse bekleyen işlemler güncel tabloya yeniden uygulanır.
+        self.kilit_zaman_asimi = 10.0
+        self._tutulan_kilitler = set()
+        self._taban = {}
+        # Günlük, sahibi çalıştığı sürece kilitli tutulur; kilidi alınabilen günlükler sahipsizdir
+        self._gunluk = IslemGunlugu(self.gunluk_path)
+        self._gunluk_sahipligi = _kilit_al(self._kilit_yolu(self.gunluk_path), timeout=0)
+        atexit.register(self._gunlugu_kapat)
+        atexit.register(self.flush)
+
+        # Öncül grafiği: {adım: öncüller} ve ters indeks {adım: ardıllar}.
+        # Is_Adimlari her yüklendiğinde bir kez kurulur, adım yazmalarında yerinde güncellenir.
+        self._precedence = None  # (tablo_sürümü, preds, succs)
+        self._adimlar = None     # (tablo_sürümü, AdımID indeksli adım tablosu), bkz. _adim_tablosu
+
+        # Zaman etüdü özetleri (yalnızca CSV), bölüm başına: {bölüm_yolu: (tablo_sürümü, {JobID: {AdımID:
+        # [adet, ortalama, M2]}})}. Ölçüm kaydı ve iş silme sırasında artımlı (Welford) güncellenir; ortalama/std
+        # O(1) okunur. M2 ortalamadan sapmaların kareleri toplamıdır: kareler toplamından farkla hesaplanan varyans
+        # büyük ve birbirine yakın sürelerde (çevrim süreleri) sayısal olarak çöker.
+        self._sure_ozet = {}
+
+        # Bölüm manifesti {bölüm_adı: girdi} (bkz. _bolum_manifesti); diske flush'ta yazılır
+        self._manifest = None
+        self._manifest_kirli = False
+
+        # Zaman etüdü ölçümleri bölüm dosyasının sonuna eklenir (tüm dosya yeniden yazılmaz).
+        # compact_every > 0 ise her N ölçümde bir bölümler sıkıştırılır (0: kapalı). Sıkıştırmada
+        # bundan az satırlı eski aylar birleştirilir (bkz. compact_zaman_etudu).
+        self.zaman_etudu_compact_every = 0
+        self.zaman_bolum_hedef_satiri = 20000
+        self._appends_since_compact = 0
+        self._append_headers_ok = set()
+
+        # Değişiklik aboneleri: [(callback, olay_türleri veya None)]
+        self._aboneler = []
 
         self.init_files()
-        self._fix_westinghouse_csv_columns()
+        # Göçler günlükten önce: yeniden oynatılan satırlar güncel kolonlara yazılsın
+        self._semayi_guncelle()
+        self._gunlugu_oynat()
+
+        # Depolama motoru: parametre > ENTEGRE_IS_ETUDU_DEPOLAMA ortam değişkeni > Ayarlar.json > csv
+        self.backend = (backend or os.getenv('ENTEGRE_IS_ETUDU_DEPOLAMA')
+                        or self._load_settings().get('depolama') or 'csv').lower()
+        if self.backend == 'sqlite':
+            self._open_sqlite()
+        elif self.backend != 'csv':
+            raise ValueError(f"Bilinmeyen depolama motoru: {self.backend}")
 
 
     
@@ -79,7 +274,29 @@ class DataManager:
     ]
 
     def init_files(self):
-        files_to_check = {
+        os.makedirs(self.zaman_etudu_klasoru, exist_ok=True)
+        if os.path.exists(self.zaman_etudu_path):
+            self._zaman_etudunu_bolumle()
+        for path, columns in self._table_paths().items():
+            if path == self.zaman_etudu_path:
+                continue  # bölümler ilk ölçümle oluşur
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                # Aynı anda açılan başka bir süreç dosyayı oluşturup satır eklemiş olabilir
+                with self._tablo_kilidi(path):
+                    if not os.path.exists(path) or os.path.getsize(path) == 0:
+                        pd.DataFrame(columns=columns).to_csv(path, index=False)
+    
+
+    def _load_settings(self):
+        try:
+            with open(self.ayarlar_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _table_paths(self):
+        """{tablo_yolu: kolonlar} — dokuz tablonun tamamı."""
+        return {
             self.is_adimlari_path: self.IS_ADIMLARI_COLUMNS,
             self.zaman_etudu_path: self.ZAMAN_ETUDU_COLUMNS,
             self.westinghouse_path: self.WESTINGHOUSE_COLUMNS,
@@ -90,240 +307,1048 @@ class DataManager:
             self.mini_most_analizleri_path: self.MINI_MOST_ANALIZLERI_COLUMNS,
             self.mini_most_detaylari_path: self.MINI_MOST_DETAYLARI_COLUMNS,
         }
-        for path, columns in files_to_check.items():
-            if not os.path.exists(path) or os.path.getsize(path) == 0:
-                pd.DataFrame(columns=columns).to_csv(path, index=False)
-    
-
-    def _fix_westinghouse_csv_columns(self):
-        import pandas as pd
-
-        if not os.path.exists(self.westinghouse_path):
-            return
-
-        df = pd.read_csv(self.westinghouse_path)
-
-        changed = False
-        if "Tutarlılık" in df.columns:
-            base_index = df.columns.get_loc("Tutarlılık") + 1
-        else:
-            base_index = min(3, len(df.columns))
-
-        if "NormalZaman" not in df.columns:
-            df.insert(base_index, "NormalZaman", pd.NA)
-            base_index += 1
-            changed = True
-
-        if "StandartZaman" not in df.columns:
-            df.insert(base_index, "StandartZaman", pd.NA)
-            changed = True
-
-        if changed:
-            df.to_csv(self.westinghouse_path, index=False)
 
+    @staticmethod
+    def _table_name(file_path):
+        """
+        CSV yolundan tablo adı: 'Is_Adimlari.csv' -> 'Is_Adimlari' (SQLite tablosu ve günlük kayıtları).
+        Zaman etüdü bölümleri klasörüyle adlandırılır: 'Zaman_Etudu/2026-10.csv' -> 'Zaman_Etudu/2026-10'.
+        """
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        if os.path.basename(os.path.dirname(file_path)) == KLASOR_ADI:
+            return f"{KLASOR_ADI}/{name}"
+        return name
 
+    def _tablo_yolu(self, name):
+        """_table_name'in tersi; bilinmeyen tablo adı için None."""
+        if name.startswith(KLASOR_ADI + '/'):
+            ad = name.split('/', 1)[1]
+            path = os.path.join(self.zaman_etudu_klasoru, ad + '.csv')
+            if not os.path.exists(path) and bolum_araligi(ad) is not None:
+                # Bölüm sonradan birleştirilmiş olabilir (bkz. compact_zaman_etudu)
+                path = self._bolum_yolu(bolum_araligi(ad)[0])
+            return path
+        for path in self._table_paths():
+            if self._table_name(path) == name:
+                return path
+        return None
 
+    def _bolum_mu(self, file_path):
+        return os.path.dirname(file_path) == self.zaman_etudu_klasoru
 
+    def _kolonlar(self, file_path):
+        """Tablonun (veya zaman etüdü bölümünün) kolonları; bilinmeyen yol için None."""
+        if self._bolum_mu(file_path):
+            return self.ZAMAN_ETUDU_COLUMNS
+        return self._table_paths().get(file_path)
 
+    def _open_sqlite(self):
+        from sqlite_deposu import SqliteDeposu
 
+        self._depo = SqliteDeposu(
+            self.sqlite_path,
+            {self._table_name(p): cols for p, cols in self._table_paths().items()})
+        if self._depo.yeni_olusturuldu:
+            self.import_csv()
 
+    def import_csv(self):
+        """Tek seferlik içe aktarma: mevcut .Entegre_Is_Etudu/*.csv dosyalarını SQLite'a taşır."""
+        if self._depo is None:
+            raise RuntimeError("CSV içe aktarma yalnızca sqlite depolama motorunda kullanılabilir.")
+        self.flush()
+        self._depo.import_csv_files(
+            {self._table_name(p): p for p in self._table_paths() if p != self.zaman_etudu_path},
+            dtypes={self._table_name(self.is_adimlari_path): self.IS_ADIMLARI_DTYPES})
+        olcumler = bolumleri_oku(self.zaman_etudu_klasoru, columns=self.ZAMAN_ETUDU_COLUMNS)
+        if not olcumler.empty:
+            self._depo.replace_table(self._table_name(self.zaman_etudu_path), olcumler)
+        self.invalidate_cache()
 
+    def export_csv(self, target_dir=None):
+        """
+        Uyumluluk için SQLite tablolarını CSV olarak dışa aktarır (varsayılan: veri klasöründeki
+        CSV dosyalarının üzerine; Zaman_Etudu aylık bölümler halinde). Rapor modülü CSV okuduğu için
+        rapordan önce çağrılır; CSV modunda yalnızca bekleyen arka plan yazmaları diske uygulanır.
+        """
+        self.flush()
+        if self._depo is None:
+            return
+        self._depo.export_csv_files({
+            self._table_name(p): (os.path.join(target_dir, os.path.basename(p)) if target_dir else p)
+            for p in self._table_paths() if p != self.zaman_etudu_path})
+        bolumlere_yaz(os.path.join(target_dir, KLASOR_ADI) if target_dir else self.zaman_etudu_klasoru,
+                      self._depo.read_table(self._table_name(self.zaman_etudu_path)))
+        if target_dir is None:
+            # CSV dosyaları değişti; ekleme başlığı kontrolleri yeniden yapılsın
+            self._append_headers_ok.clear()
 
+    def _semayi_guncelle(self):
+        """
+        Şema sürümü geride kalan CSV tablolarına bekleyen göçleri uygular (bkz. sema_gocleri).
+        Tablolar güncelse yalnızca Sema.json okunur, hiçbir tablo taranmaz.
+        """
+        tablolar = {self._table_name(p): [p] for p in self._table_paths() if p != self.zaman_etudu_path}
+        tablolar[KLASOR_ADI] = [os.path.join(self.zaman_etudu_klasoru, ad + '.csv')
+                                for ad in bolum_adlari(self.zaman_etudu_klasoru)]
+        for tablo, surum in gocleri_uygula(self.app_data_path, tablolar, self._tablo_kilidi):
+            print(f"{tablo}: şema güncellendi (sürüm {surum}).")
 
     def _get_next_global_analiz_id(self):
-        """Tüm analiz dosyalarını tarayarak bir sonraki benzersiz AnalizID'yi döndürür."""
+        """Bir sonraki benzersiz AnalizID'yi kalıcı sayaçtan O(1) olarak döndürür."""
+        return self._next_counter('AnalizID', self._scan_max_analiz_id)
+
+    def _scan_max_analiz_id(self):
+        """Tüm analiz dosyalarını tarayarak en büyük AnalizID'yi bulur (sayaç yeniden kurulurken)."""
         all_ids = [0] 
 
-        df_west = self._read_csv(self.westinghouse_path, self.WESTINGHOUSE_COLUMNS)
+        df_west = self._get_table(self.westinghouse_path, self.WESTINGHOUSE_COLUMNS)
         if not df_west.empty and 'AnalizID' in df_west.columns and not df_west['AnalizID'].dropna().empty:
             all_ids.append(df_west['AnalizID'].max())
 
-        df_most = self._read_csv(self.basic_most_analizleri_path, self.BASIC_MOST_ANALIZLERI_COLUMNS)
+        df_most = self._get_table(self.basic_most_analizleri_path, self.BASIC_MOST_ANALIZLERI_COLUMNS)
         if not df_most.empty and 'AnalizID' in df_most.columns and not df_most['AnalizID'].dropna().empty:
             all_ids.append(df_most['AnalizID'].max())
 
-        df_maxi = self._read_csv(self.maxi_most_analizleri_path, self.MAXI_MOST_ANALIZLERI_COLUMNS)
+        df_maxi = self._get_table(self.maxi_most_analizleri_path, self.MAXI_MOST_ANALIZLERI_COLUMNS)
         if not df_maxi.empty and 'AnalizID' in df_maxi.columns and not df_maxi['AnalizID'].dropna().empty:
             all_ids.append(df_maxi['AnalizID'].max())
 
-        df_mini = self._read_csv(self.mini_most_analizleri_path, self.MINI_MOST_ANALIZLERI_COLUMNS)
+        df_mini = self._get_table(self.mini_most_analizleri_path, self.MINI_MOST_ANALIZLERI_COLUMNS)
         if not df_mini.empty and 'AnalizID' in df_mini.columns and not df_mini['AnalizID'].dropna().empty:
             all_ids.append(df_mini['AnalizID'].max())
             
-        return max(all_ids) + 1
+        return int(max(all_ids))
+
+    def _scan_max_detay_id(self):
+        """Üç MOST detay tablosundaki en büyük DetayID (sayaç yeniden kurulurken)."""
+        return max(self._max_id(self.basic_most_detaylari_path, self.BASIC_MOST_DETAYLARI_COLUMNS, 'DetayID'),
+                   self._max_id(self.maxi_most_detaylari_path, self.MAXI_MOST_DETAYLARI_COLUMNS, 'DetayID'),
+                   self._max_id(self.mini_most_detaylari_path, self.MINI_MOST_DETAYLARI_COLUMNS, 'DetayID'))
 
     def _read_csv(self, file_path, columns, dtypes=None):
+        """Tablonun değiştirilebilir bir kopyasını döndürür (yazma işlemleri için)."""
+        return self._get_table(file_path, columns, dtypes).copy()
+
+    def _read_csv_from_disk(self, file_path, columns, dtypes=None):
+        if self._depo is not None:
+            df = self._depo.read_table(self._table_name(file_path))
+            if dtypes:
+                df = df.astype({c: t for c, t in dtypes.items() if c in df.columns and t is not str})
+            return df
+        # Okuma kilitsizdir: tam yazmalar dosyayı atomik olarak değiştirir. Son satır yarımsa başka
+        # bir yazıcı o an satır ekliyor olabilir; yalnızca o eklemenin bitmesi beklenip yeniden okunur.
         try:
-            return pd.read_csv(file_path, dtype=dtypes)
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            if data and not data.endswith(b'\n'):
+                with self._tablo_kilidi(file_path):
+                    with open(file_path, 'rb') as f:
+                        data = f.read()
+            return pd.read_csv(io.BytesIO(data), dtype=dtypes)
         except (FileNotFoundError, pd.errors.EmptyDataError):
             return pd.DataFrame(columns=columns)
 
+    def _kilit_yolu(self, file_path):
+        """
+        Dosyanın süreçler arası kilit dosyası: .kilitler/ altında, uygulama klasörüne göre yolu
+        '__' ile düzleştirilmiş ad (Zaman_Etudu/2026-10.csv -> .kilitler/Zaman_Etudu__2026-10.csv.lock).
+        """
+        goreli = os.path.relpath(os.path.abspath(file_path), os.path.abspath(self.app_data_path))
+        if goreli.startswith(os.pardir):
+            goreli = os.path.abspath(file_path)
+        return os.path.join(self.kilit_klasoru, re.sub(r'[\\/:]+', '__', goreli) + '.lock')
+
+    @contextmanager
+    def _tablo_kilidi(self, file_path):
+        """
+        Tablonun süreçler arası yazma kilidi (bkz. _kilit_yolu). Aynı iş parçacığında iç içe
+        alınabilir; kilit süresince bu süreçteki diğer disk yazmaları da bekler.
+        """
+        with self._disk_kilidi:
+            if file_path in self._tutulan_kilitler:
+                yield
+                return
+            with _file_lock(self._kilit_yolu(file_path), timeout=self.kilit_zaman_asimi):
+                self._tutulan_kilitler.add(file_path)
+                try:
+                    yield
+                finally:
+                    self._tutulan_kilitler.discard(file_path)
+
+    def _file_signature(self, file_path):
+        """Tablonun önbellek imzası: CSV için (mtime_ns, boyut), SQLite için tablo sürümü; yoksa None."""
+        if self._depo is not None:
+            return self._depo.signature(self._table_name(file_path))
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _set_cache(self, file_path, signature, dtypes, df):
+        """Önbellek girdisini koyar (df=None: siler) ve tablonun bellek sürümünü ilerletir."""
+        with self._yazma_kilidi:
+            if df is None:
+                self._table_cache.pop(file_path, None)
+                self._taban.pop(file_path, None)
+            else:
+                self._table_cache[file_path] = (signature, dtypes, df)
+                if signature is not _YAZILMADI:
+                    self._taban[file_path] = signature
+            self._surumler[file_path] = next(self._surum_sayaci)
+
+    def _tablo_surumu(self, file_path):
+        """
+        Önbellekteki tablonun bellek sürümü; önbellek yoksa veya diskteki dosya dışarıdan
+        değiştiyse None. Grafik/özet gibi türetilmiş yapılar bu sürüme bağlanır.
+        """
+        with self._yazma_kilidi:
+            cached = self._table_cache.get(file_path)
+            if cached is None:
+                return None
+            if file_path in self._bekleyen or file_path in self._yaziliyor:
+                return self._surumler.get(file_path)
+        if cached[0] != self._file_signature(file_path):
+            return None
+        return self._surumler.get(file_path)
+
+    def _get_table(self, file_path, columns, dtypes=None):
+        """
+        Tabloyu önbellekten döndürür; dosyanın mtime'ı veya boyutu değiştiyse yeniden okur.
+        Dönen DataFrame önbellekle paylaşılır, üzerinde değişiklik YAPILMAMALIDIR.
+        Diske yazılmayı bekleyen tablolar için önbellek esastır (disk henüz eski haldedir).
+        """
+        with self._yazma_kilidi:
+            cached = self._table_cache.get(file_path)
+            pending = file_path in self._bekleyen or file_path in self._yaziliyor
+            if pending and cached is not None and cached[1] == dtypes:
+                return cached[2]
+        if pending:
+            # Önbellekte istenen haliyle yok: önce bekleyen yazmayı bitir, sonra diskten oku
+            self._yazma_isle(file_path)
+
+        signature = self._file_signature(file_path)
+        cached = self._table_cache.get(file_path)
+        if cached is not None and signature is not None and cached[0] == signature and cached[1] == dtypes:
+            return cached[2]
+
+        df = self._compact_dtypes(self._read_csv_from_disk(file_path, columns, dtypes), file_path)
+        self._set_cache(file_path, signature, dtypes, df if signature is not None else None)
+        return df
+
+    def _compact_dtypes(self, df, file_path):
+        """Kolonları BELLEK_TIPLERI'ndeki tiplere çevirir; çevrilemeyen kolon (ör. kesirli ID) olduğu gibi kalır."""
+        if self._bolum_mu(file_path):
+            file_path = self.zaman_etudu_path
+        for col, tip in self.BELLEK_TIPLERI.get(file_path, {}).items():
+            if col not in df.columns or str(df[col].dtype) == tip:
+                continue
+            try:
+                if tip == 'category':
+                    df[col] = df[col].astype('category')
+                else:
+                    df[col] = pd.to_numeric(df[col]).astype(tip)
+            except (ValueError, TypeError, OverflowError):
+                continue
+        return df
+
+    def bellek_raporu(self, detay=False):
+        """
+        Önbellekteki tabloların bellek kullanımı (deep=True). detay=True ise kolon bazında
+        [Tablo, Kolon, Tip, Bayt], değilse tablo bazında [Tablo, Satır, Bayt] döndürür.
+        """
+        satirlar = []
+        tablolar = list(self._table_paths().items())
+        if self._depo is None:
+            # Zaman etüdünün yalnızca önbellekteki bölümleri (rapor için bölüm açılmaz)
+            with self._yazma_kilidi:
+                bolumler = sorted(p for p in self._table_cache if self._bolum_mu(p))
+            tablolar = [(p, c) for p, c in tablolar if p != self.zaman_etudu_path]
+            tablolar += [(p, self.ZAMAN_ETUDU_COLUMNS) for p in bolumler]
+        for path, columns in tablolar:
+            dtypes = self.IS_ADIMLARI_DTYPES if path == self.is_adimlari_path else None
+            df = self._get_table(path, columns, dtypes)
+            kullanim = df.memory_usage(index=True, deep=True)
+            if detay:
+                satirlar.extend({'Tablo': self._table_name(path), 'Kolon': col,
+                                 'Tip': str(df[col].dtype) if col in df.columns else '',
+                                 'Bayt': int(b)} for col, b in kullanim.items())
+            else:
+                satirlar.append({'Tablo': self._table_name(path), 'Satır': len(df), 'Bayt': int(kullanim.sum())})
+        return pd.DataFrame(satirlar)
+
+    def _tablo_dtypes(self, file_path):
+        """Tablonun okuma tipleri (Is_Adimlari için IS_ADIMLARI_DTYPES, diğerleri için None)."""
+        return self.IS_ADIMLARI_DTYPES if file_path == self.is_adimlari_path else None
+
+    def _write_csv(self, df, file_path, dtypes=None):
+        """
+        Tabloyu tamamen değiştirir (sıkıştırma, kolon düzeltme gibi bakım işleri için); olağan
+        yazmalar _uygula'dan geçer. CSV'de geçici dosya + fsync + rename ile eşzamanlı yazılır.
+        Çağıran df'yi aynı tablo kilidi altında (bkz. _tablo_kilidi) güncel tablodan üretmiş olmalıdır;
+        bu tablo için bekleyen arka plan yazmaları yeni içerikle geçersiz kalır.
+        """
+        df = df.reset_index(drop=True)
+        if self._depo is not None:
+            self._depo.replace_table(self._table_name(file_path), df)
+            self._cache_written(df, file_path, dtypes)
+            return
+        if list(df.columns) != list(self._kolonlar(file_path) or df.columns):
+            self._append_headers_ok.discard(file_path)
+        with self._tablo_kilidi(file_path), self._gunluk_kilidi:
+            with self._yazma_kilidi:
+                superseded = self._bekleyen.pop(file_path, None)
+            try:
+                tablolari_atomik_yaz({file_path: df})
+            except Exception:
+                if superseded is not None:
+                    with self._yazma_kilidi:
+                        self._bekleyen.setdefault(file_path, superseded)
+                raise
+            self._cache_written(df, file_path, dtypes)
+            self._gunluk_ilerlet([file_path], self._gunluk.seq)
+
+    def _bellek_bicimi(self, df, file_path, dtypes=None):
+        """Yazılan satırları diskten okunmuş halleriyle aynı tiplere getirir (tipler uymazsa ValueError/TypeError)."""
+        # Boş metinler CSV'de NaN'a döner, boş tabloya eklenen satırlar ise object tipinde kalır.
+        text_cols = [c for c in df.columns
+                     if df[c].dtype == object or pd.api.types.is_string_dtype(df[c])]
+        if len(text_cols):
+            # mask: replace('', np.nan) object kolonları sessizce tip değiştirir (pandas 2.2 FutureWarning)
+            df[text_cols] = df[text_cols].mask(df[text_cols] == '')
+        df = df.infer_objects()
+        if dtypes:
+            df = df.astype({c: t for c, t in dtypes.items() if c in df.columns and t is not str})
+        return self._compact_dtypes(df, file_path)
+
+    def _cache_written(self, df, file_path, dtypes=None, signature=None):
+        """Yazılmış tabloyu önbelleğe, diskten okunmuş haliyle aynı olacak şekilde koyar ve döndürür."""
+        try:
+            df = self._bellek_bicimi(df, file_path, dtypes)
+        except (ValueError, TypeError):
+            self._set_cache(file_path, None, None, None)
+            return df
+        if signature is None:
+            signature = self._file_signature(file_path)
+        self._set_cache(file_path, signature, dtypes, df if signature is not None else None)
+        return df
+
+    # ------------ Günlüklü yazma ------------
+
+    def _uygula(self, ops):
+        """
+        Mantıksal yazma işlemlerini hep birlikte uygular:
+        [{'op': 'append' | 'update' | 'delete', 'table': 'Is_Adimlari', ...}]
+        (işlem biçimleri için bkz. islem_gunlugu.islemi_uygula).
+        CSV: işlemler önce günlüğe yazılıp fsync edilir (maliyet tablo boyutundan değil değişiklikten
+        gelir), sonra önbelleğe uygulanır; tablo dosyaları arka plan yazıcısıyla güncellenir.
+        Dosyalar yazılmadan çökülürse işlemler açılışta günlükten yeniden oynatılır (bkz. _gunlugu_oynat).
+        'Zaman_Etudu' işlemleri ilgili aylık bölümlere dağıtılır (bkz. _bolumlere_dagit).
+        SQLite: tek bir veritabanı işleminde uygulanır.
+        """
+        if self._depo is not None:
+            paths = {self._table_name(p): p for p in self._table_paths()}
+            tables = list(dict.fromkeys(op['table'] for op in ops))
+            fresh = {t: self._tablo_surumu(paths[t]) is not None for t in tables}
+            before = self._depo.signature(tables[0])[0] if tables else None
+            self._depo.apply_ops(ops)
+            # Arada başka bir bağlantı commit ettiyse önbellekler onun satırlarını içermez
+            others = tables and self._depo.signature(tables[0])[0] != before
+            for t in tables:
+                cached = self._table_cache.get(paths[t])
+                if others or not fresh[t] or cached is None:
+                    self._set_cache(paths[t], None, None, None)
+                    continue
+                self._islemleri_onbellege(cached[2], [op for op in ops if op['table'] == t],
+                                          paths[t], cached[1], self._file_signature(paths[t]))
+            return
+
+        ops = self._bolumlere_dagit(ops)
+        tables = list(dict.fromkeys(op['table'] for op in ops))
+        paths = {t: self._tablo_yolu(t) for t in tables}
+        # Dokunulan tablolar önbellekte olsun (gerekirse diskten yüklenir)
+        loaded = {t: self._get_table(paths[t], self._kolonlar(paths[t]), self._tablo_dtypes(paths[t]))
+                  for t in tables}
+        with self._gunluk_kilidi:
+            seq = self._gunluk.yaz(ops)
+            with self._yazma_kilidi:
+                for t in tables:
+                    path = paths[t]
+                    cached = self._table_cache.get(path)
+                    df, dtypes = (cached[2], cached[1]) if cached is not None else (loaded[t], self._tablo_dtypes(path))
+                    table_ops = [op for op in ops if op['table'] == t]
+                    df, rewrite = self._islemleri_onbellege(df, table_ops, path, dtypes, _YAZILMADI)
+                    # İşlemler saklanır: dosya bu arada başka bir süreçte değişirse güncel tabloya
+                    # yeniden uygulanır (bkz. _yazma_isle). rewrite: dosya baştan yazılmalı.
+                    job = self._bekleyen.setdefault(path, {'ops': [], 'rewrite': False, 'seq': seq})
+                    job['ops'].extend(table_ops)
+                    job['rewrite'] = job['rewrite'] or rewrite
+                    job['seq'] = seq
+        for t in tables:
+            if self.write_behind:
+                self._yazma_sirala(paths[t])
+            else:
+                self._yazma_isle(paths[t])
+
+    def _bolumlere_dagit(self, ops):
+        """
+        CSV: 'Zaman_Etudu' işlemlerini bölüm işlemlerine çevirir. Eklenen satırlar Timestamp aylarının
+        bölümlerine gider; JobID'ye göre silme/güncelleme yalnızca manifestte o işi içeren bölümlere,
+        diğer koşullar tüm bölümlere uygulanır.
+        """
+        if not any(op['table'] == KLASOR_ADI for op in ops):
+            return ops
+        dagitilmis = []
+        for op in ops:
+            if op['table'] != KLASOR_ADI:
+                dagitilmis.append(op)
+            elif op['op'] == 'append':
+                gruplar = {}
+                for row in op['rows']:
+                    gruplar.setdefault(self._bolum_yolu(ay_anahtari(row.get('Timestamp'))), []).append(row)
+                dagitilmis.extend({'op': 'append', 'table': self._table_name(path), 'rows': rows}
+                                  for path, rows in gruplar.items())
+            else:
+                col, value = op['where']
+                job_ids = None
+                if col == 'JobID':
+                    job_ids = value if isinstance(value, (list, tuple, set)) else [value]
+                dagitilmis.extend(dict(op, table=self._table_name(path))
+                                  for path in self._zaman_bolumleri(job_ids))
+        return dagitilmis
+
+    @staticmethod
+    def _bos_kolonlari_hizala(df, new_rows_df):
+        """
+        Tipleri farklı kolonlarda tamamen boş (NA) tarafı diğer tarafın tipine çevirir; böylece concat'in
+        sonuç tipi boş kolonlardan etkilenmez (pandas 2.2 FutureWarning, 3.0'da davranış değişikliği).
+        NA tutamayan numpy tamsayı/bool tipleri atlanır: concat onları zaten uyarısız genişletir.
+        Önbellekteki df yerinde değiştirilmez.
+        """
+        def na_tutabilir(dtype):
+            return not (isinstance(dtype, np.dtype) and dtype.kind in 'iub')
+
+        for col in new_rows_df.columns.intersection(df.columns):
+            if df[col].dtype == new_rows_df[col].dtype:
+                continue
+            if new_rows_df[col].isna().all() and na_tutabilir(df[col].dtype):
+                new_rows_df[col] = new_rows_df[col].astype(df[col].dtype)
+            elif df[col].isna().all() and na_tutabilir(new_rows_df[col].dtype):
+                df = df.copy(deep=False)
+                df[col] = df[col].astype(new_rows_df[col].dtype)
+        return df, new_rows_df
+
+    def _islemleri_onbellege(self, df, table_ops, file_path, dtypes, signature):
+        """
+        Bir tablonun işlemlerini önbellekteki DataFrame'e uygular ve önbelleğe koyar; (yeni_df, rewrite) döner.
+        Eklemede yalnızca yeni satırlar dönüştürülür; rewrite, bir güncelleme/silmenin satır değiştirdiğini
+        (dosyanın baştan yazılması gerektiğini) belirtir.
+        """
+        rewrite = False
+        for op in table_ops:
+            if op['op'] == 'append':
+                new_rows_df = pd.DataFrame(op['rows'], columns=list(df.columns))
+                try:
+                    new_rows_df = self._bellek_bicimi(new_rows_df, file_path, dtypes)
+                except (ValueError, TypeError):
+                    rewrite = True  # tipler uymadı: tablo aşağıda baştan dönüştürülür
+                df = new_rows_df if df.empty else pd.concat(self._bos_kolonlari_hizala(df, new_rows_df),
+                                                             ignore_index=True)
+            else:
+                new_df = islemi_uygula(df, op, list(df.columns))
+                rewrite = rewrite or new_df is not df
+                df = new_df
+        if rewrite:
+            return self._cache_written(df, file_path, dtypes, signature), True
+        df = self._compact_dtypes(df, file_path)
+        self._set_cache(file_path, signature, dtypes, df)
+        return df, False
+
+    def _gunluk_ilerlet(self, file_paths, seq):
+        """
+        Tablolar seq kaydına kadar diske yazıldı: başka bekleyen yazma yoksa günlük boşaltılır,
+        varsa tablolar için checkpoint kaydı düşülür. Günlük kilidi altında çağrılır.
+        """
+        with self._yazma_kilidi:
+            bos = not self._bekleyen and not self._yaziliyor
+        if bos:
+            self._gunluk.temizle()
+        else:
+            for file_path in file_paths:
+                self._gunluk.checkpoint(self._table_name(file_path), seq)
+
+    def _gunlugu_oynat(self):
+        """
+        Açılışta, sahibi artık çalışmayan günlüklerdeki (çökme veya elektrik kesintisi sonrası)
+        tablo dosyalarına yazıldığı kesinleşmemiş işlemleri yeniden uygular ve günlükleri siler.
+        Çalışan başka bir DataManager'ın günlüğü kilitli olduğundan atlanır. Eklenen satırlar anahtar
+        kolonlarına göre (bkz. ANAHTAR_KOLONLARI) tekrarlanmadan yazılır; yarım kalmış son satırlar kesilir.
+        """
+        for gunluk_path in sorted(glob.glob(os.path.join(self.app_data_path, 'Gunluk*.jsonl'))):
+            if gunluk_path == self.gunluk_path:
+                continue
+            try:
+                sahiplik = _kilit_al(self._kilit_yolu(gunluk_path), timeout=0)
+            except TimeoutError:
+                continue  # sahibi çalışıyor
+            try:
+                ops = [op for op in IslemGunlugu(gunluk_path).oynatilacaklar()
+                       if op['table'] == KLASOR_ADI or self._tablo_yolu(op['table']) is not None]
+                # Bölümlerden önceki sürümlerin günlüklerindeki 'Zaman_Etudu' işlemleri de dağıtılır
+                ops = self._bolumlere_dagit(ops)
+                for table in dict.fromkeys(op['table'] for op in ops):
+                    path = self._tablo_yolu(table)
+                    table_ops = [op for op in ops if op['table'] == table]
+                    anahtar = ANAHTAR_KOLONLARI.get(table.split('/')[0])
+                    with self._tablo_kilidi(path):
+                        if any(op['op'] == 'append' for op in table_ops):
+                            kuyrugu_onar(path)
+                        df = self._read_csv_from_disk(path, self._kolonlar(path), self._tablo_dtypes(path))
+                        for op in table_ops:
+                            df = islemi_uygula(df, op, list(df.columns), anahtar)
+                        tablolari_atomik_yaz({path: df})
+                if ops:
+                    print(f"{os.path.basename(gunluk_path)}: {len(ops)} işlem tablolara yeniden uygulandı.")
+                os.remove(gunluk_path)
+            except FileNotFoundError:
+                pass  # başka bir süreç aynı anda oynatıp sildi
+            finally:
+                _kilidi_birak(sahiplik)
+                try:
+                    os.remove(self._kilit_yolu(gunluk_path))
+                except OSError:
+                    pass
+
+    def _gunlugu_kapat(self):
+        """Çıkışta (flush'tan sonra) boş günlüğü ve kilidini siler; yazılamamış işlem varsa günlük kalır."""
+        if self._gunluk_sahipligi is None:
+            return
+        with self._gunluk_kilidi:
+            with self._yazma_kilidi:
+                bos = not self._bekleyen and not self._yaziliyor
+            if bos:
+                try:
+                    os.remove(self.gunluk_path)
+                except OSError:
+                    pass
+            _kilidi_birak(self._gunluk_sahipligi)
+            self._gunluk_sahipligi = None
+            try:
+                os.remove(self._kilit_yolu(self.gunluk_path))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _append_rows_to_file(file_path, new_rows_df):
+        """Satırları CSV'nin sonuna yazıp fsync eder; son satır satır sonu ile bitmiyorsa True döner."""
+        with open(file_path, 'rb') as f:
+            # Son satır satır sonu ile bitmiyorsa yeni satır bir öncekine yapışmasın
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) not in (b'\n', b'\r')
+            else:
+                needs_newline = False
+        with open(file_path, 'a', encoding='utf-8', newline='') as f:
+            if needs_newline:
+                f.write('\n')
+            new_rows_df.to_csv(f, header=False, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        return needs_newline
+
+    def _baslik_uygun(self, file_path):
+        """CSV başlığı beklenen kolonlarla aynı mı (satır eklemeden önce; sonuç hatırlanır)."""
+        if file_path in self._append_headers_ok:
+            return True
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                header = f.readline().strip().lstrip('\ufeff')
+        except OSError:
+            return False
+        if header.split(',') != list(self._kolonlar(file_path) or ()):
+            return False
+        self._append_headers_ok.add(file_path)
+        return True
+
+    # ------------ Arka plan yazıcısı (write-behind) ------------
+
+    def _yazma_sirala(self, file_path):
+        """
+        Tabloyu arka plan yazıcısının kuyruğuna koyar. Aynı tablo zaten sıradaysa tekrar eklenmez
+        (ardışık yazmalar birleşir). Kuyruk doluysa yazma çağıranın iş parçacığında yapılır.
+        """
+        with self._yazma_kilidi:
+            if file_path in self._sirada:
+                return
+            self._sirada.add(file_path)
+            if self._yazici is None or not self._yazici.is_alive():
+                self._yazici = threading.Thread(target=self._yazici_dongusu, name='DataManagerYazici', daemon=True)
+                self._yazici.start()
+        try:
+            self._yazma_kuyrugu.put_nowait(file_path)
+        except queue.Full:
+            with self._yazma_kilidi:
+                self._sirada.discard(file_path)
+            self._yazma_isle(file_path)
+
+    def _yazici_dongusu(self):
+        while True:
+            file_path = self._yazma_kuyrugu.get()
+            try:
+                with self._yazma_kilidi:
+                    self._sirada.discard(file_path)
+                self._yazma_isle(file_path)
+            except Exception as e:
+                # Bekleyen iş geri konmuştur; flush() tekrar dener ve hatayı çağırana iletir
+                print(f"Arka plan yazma hatası ({os.path.basename(file_path)}): {e}")
+            finally:
+                self._yazma_kuyrugu.task_done()
+
+    def _yazma_isle(self, file_path):
+        """
+        Tablonun bekleyen işlemlerini tablo kilidi altında diske uygular (yazıcı veya flush çağırır):
+        - yalnızca ekleme varsa satırlar dosya sonuna fsync ile eklenir (başka süreçlerin
+          eklemeleriyle çakışmaz);
+        - tam yazma gerekiyorsa önbellekteki tablo geçici dosya + fsync + rename ile yazılır. Dosya,
+          önbellek yüklendikten sonra başka bir süreçte değişmişse (iyimser yazma çakışması) işlemler
+          diskteki güncel tabloya yeniden uygulanır ve o yazılır; diğer süreçlerin satırları kaybolmaz.
+        Ardından tablo günlükte yazılmış sayılır (bkz. _gunluk_ilerlet).
+        """
+        with self._disk_kilidi:
+            if file_path not in self._bekleyen:
+                return
+            with self._tablo_kilidi(file_path):
+                baslik_ok = self._baslik_uygun(file_path)
+                with self._yazma_kilidi:
+                    job = self._bekleyen.pop(file_path, None)
+                    if job is None:
+                        return
+                    # Önbellek = taban imzadaki dosya + bu işin tüm işlemleri (hepsi birlikte alındı)
+                    cached = self._table_cache.get(file_path)
+                    taban = self._taban.get(file_path)
+                    self._yaziliyor.add(file_path)
+                try:
+                    cakisma = taban is None or self._file_signature(file_path) != taban
+                    rebased = None
+                    if not job['rewrite'] and baslik_ok:
+                        # Satır değiştirmeyen güncelleme/silmeler yalnızca çakışmada yeniden uygulanır
+                        rows = [row for op in job['ops'] if op['op'] == 'append' for row in op['rows']]
+                        if rows:
+                            self._append_rows_to_file(
+                                file_path, pd.DataFrame(rows, columns=self._kolonlar(file_path)))
+                    elif cakisma or cached is None:
+                        rebased = self._read_csv_from_disk(
+                            file_path, self._kolonlar(file_path), self._tablo_dtypes(file_path))
+                        anahtar = ANAHTAR_KOLONLARI.get(self._table_name(file_path).split('/')[0])
+                        for op in job['ops']:
+                            rebased = islemi_uygula(rebased, op, list(rebased.columns), anahtar)
+                        tablolari_atomik_yaz({file_path: rebased})
+                        self._append_headers_ok.discard(file_path)
+                    else:
+                        tablolari_atomik_yaz({file_path: cached[2]})
+                        self._append_headers_ok.discard(file_path)
+                except Exception:
+                    with self._yazma_kilidi:
+                        newer = self._bekleyen.get(file_path)
+                        if newer is not None:
+                            # Sonradan gelen işlemler, yazılamayan işin ardına
+                            job = {'ops': job['ops'] + newer['ops'], 'rewrite': job['rewrite'] or newer['rewrite'],
+                                   'seq': newer['seq']}
+                        self._bekleyen[file_path] = job
+                        self._yaziliyor.discard(file_path)
+                    raise
+                with self._gunluk_kilidi:
+                    with self._yazma_kilidi:
+                        self._yaziliyor.discard(file_path)
+                        signature = self._file_signature(file_path)
+                        current = self._table_cache.get(file_path)
+                        if file_path in self._bekleyen:
+                            # Yeni işlemler geldi; çakışma olduysa onlar da güncel tabloya uygulanacak
+                            self._taban[file_path] = None if cakisma else signature
+                        elif not cakisma and current is not None:
+                            # Disk artık önbellekle aynı: imzayı hizala (bellek sürümü değişmez)
+                            self._table_cache[file_path] = (signature, current[1], current[2])
+                            self._taban[file_path] = signature
+                        elif rebased is not None:
+                            # Diğer süreçlerin satırları da artık önbellekte
+                            self._cache_written(rebased, file_path,
+                                                current[1] if current is not None else self._tablo_dtypes(file_path),
+                                                signature)
+                        else:
+                            self._set_cache(file_path, None, None, None)
+                    self._gunluk_ilerlet([file_path], job['seq'])
+
+    def flush(self):
+        """Bekleyen tüm yazmaları diske uygular; uygulama kapanırken ve dışa okumalardan önce çağrılır."""
+        with self._yazma_kilidi:
+            paths = list(self._bekleyen)
+        for file_path in paths:
+            self._yazma_isle(file_path)
+        if self._depo is None:
+            self._manifesti_kaydet()
+
+    def kapat(self):
+        """
+        Bekleyenleri yazar, günlüğü ve SQLite bağlantısını kapatır; çıkış kancaları kaldırılır.
+        Aynı süreçte birden çok veri klasörü açan araçlar (ör. ölçümler) için; uygulama çıkışta
+        bunları zaten yapar. Kapatılan nesne bir daha kullanılmamalıdır.
+        """
+        self.flush()
+        self._gunlugu_kapat()
+        atexit.unregister(self.flush)
+        atexit.unregister(self._gunlugu_kapat)
+        if self._depo is not None:
+            self._depo.close()
+
+    def _load_counters(self):
+        try:
+            with open(self.sayaclar_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_counters(self, counters):
+        tmp_path = self.sayaclar_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(counters, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.sayaclar_path)
+
+    def _next_counter(self, name, seed_fn, adet=1):
+        """
+        Kalıcı sayaçtan bir sonraki ID'yi verir (adet > 1 ise ardışık bloğun ilk ID'si).
+        Oku-artır-yaz adımı dosya kilidi altında yapıldığından aynı klasörü kullanan birden
+        çok süreç aynı ID'yi alamaz.
+        Sayaç dosyası yoksa veya bozuksa seed_fn() ile tablolardaki en büyük değerden kurulur.
+        """
+        with _file_lock(self._kilit_yolu(self.sayaclar_path)):
+            counters = self._load_counters()
+            last = counters.get(name)
+            if last is None:
+                # Diğer süreçlerin yazdığı satırları da görmek için diskten oku
+                self.invalidate_cache()
+                last = int(seed_fn())
+            counters[name] = int(last) + adet
+            self._save_counters(counters)
+            return int(last) + 1
+
+    def _max_id(self, file_path, columns, id_col):
+        df = self._get_table(file_path, columns, self._tablo_dtypes(file_path))
+        if df.empty or id_col not in df.columns or df[id_col].dropna().empty:
+            return 0
+        return int(df[id_col].max())
+
+    def invalidate_cache(self, file_path=None):
+        """Önbelleği (veya tek bir tabloyu) boşaltır; bir sonraki okumada diskten yüklenir."""
+        self.flush()
+        for path in ([file_path] if file_path else list(self._table_cache)):
+            self._set_cache(path, None, None, None)
+        if file_path is None:
+            self._append_headers_ok.clear()
+        else:
+            self._append_headers_ok.discard(file_path)
+
+    # ------------ Değişiklik bildirimleri ------------
+
+    def subscribe(self, callback, event_types=None):
+        """
+        callback(DegisiklikOlayi) her başarılı yazmadan sonra, yazmayı yapan iş parçacığında çağrılır.
+        event_types verilirse yalnızca bu türler iletilir. Paneller tüm tabloyu yeniden sorgulamak yerine
+        sadece etkilenen satırı güncellemek için kullanır.
+        """
+        self._aboneler.append((callback, set(event_types) if event_types else None))
+
+    def unsubscribe(self, callback):
+        self._aboneler = [(cb, turler) for cb, turler in self._aboneler if cb != callback]
+
+    def _emit(self, tur, job_id=None, step_id=None, **veri):
+        olay = DegisiklikOlayi(tur,
+                               int(job_id) if job_id is not None and not pd.isna(job_id) else None,
+                               int(step_id) if step_id is not None and not pd.isna(step_id) else None,
+                               veri)
+        for callback, turler in list(self._aboneler):
+            if turler is not None and tur not in turler:
+                continue
+            try:
+                callback(olay)
+            except Exception as e:
+                # Bir panelin hatası kaydı ve diğer aboneleri etkilemesin
+                print(f"Değişiklik bildirimi işlenirken hata ({tur}): {e}")
+
     def get_job_list(self):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
         job_definitions = df[df['AdımID'].isnull()].copy()
         if job_definitions.empty: return {}
         job_dict = job_definitions.set_index('JobID')['İş Adı'].to_dict()
         return {int(k): v for k, v in job_dict.items()}
 
     def create_new_job(self, job_name):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
-        new_id = int(df['JobID'].max() + 1) if not df.empty and not df['JobID'].dropna().empty else 1
+        new_id = self._next_counter(
+            'JobID', lambda: self._max_id(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, 'JobID'))
         new_job_row = {'JobID': new_id, 'İş Adı': job_name, 'AdımID': pd.NA, 'Adım Adı': '', 'Öncül Adım': '', 'DegerTuru': '', 'İş İstasyonu': ''}
-        df = self._append_row_to_df(df, new_job_row)
-        df.to_csv(self.is_adimlari_path, index=False)
+        self._uygula([{'op': 'append', 'table': 'Is_Adimlari', 'rows': [new_job_row]}])
+        self._emit(JOB_CREATED, new_id, name=job_name)
         return new_id
 
     def get_steps_for_job(self, job_id):
         if job_id is None: return {}
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        if self._depo is not None:
+            df = self._depo.query(
+                'SELECT "AdımID", "Adım Adı" FROM "Is_Adimlari" '
+                'WHERE "JobID" = ? AND "AdımID" IS NOT NULL ORDER BY rowid', (int(job_id),))
+            return {int(k): v for k, v in zip(df['AdımID'], df['Adım Adı'])}
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
         steps_df = df[(df['JobID'] == job_id) & (df['AdımID'].notnull())].copy()
-        return steps_df.set_index('AdımID')['Adım Adı'].to_dict()
+        step_dict = steps_df.set_index('AdımID')['Adım Adı'].to_dict()
+        return {int(k): v for k, v in step_dict.items()}
+
+    STEP_VIEW_COLUMNS = ['AdımID', 'Adım Adı', 'İş İstasyonu', 'Ortalama Süre', 'Öncül Adları', 'DegerTuru']
+
+    def get_step_view(self, job_id):
+        """
+        Adım tablosu için bir işin tüm adımlarını tek geçişte birleştirir:
+        AdımID, Adım Adı, İş İstasyonu, Ortalama Süre, Öncül Adları (virgülle), DegerTuru.
+        Satır sırası get_steps_for_job ile aynıdır.
+        """
+        if job_id is None:
+            return pd.DataFrame(columns=self.STEP_VIEW_COLUMNS)
+
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        all_steps = df[df['AdımID'].notnull()]
+        steps = all_steps[all_steps['JobID'] == job_id]
+        if steps.empty:
+            return pd.DataFrame(columns=self.STEP_VIEW_COLUMNS)
+
+        view = steps[['AdımID', 'Adım Adı', 'İş İstasyonu', 'DegerTuru']].copy()
+
+        # Ortalama süreler: süre özetlerinden, satır başına O(1)
+        ozet = self._sure_ozetleri(job_id)
+        ortalamalar = []
+        for adim_id in view['AdımID']:
+            kayit = ozet.get(int(adim_id))
+            ortalamalar.append(kayit[1] if kayit and kayit[0] else 0.0)
+        view['Ortalama Süre'] = ortalamalar
+
+        # Öncül adları: "1,2;3" -> satır başına tek ID'ye aç, adlarla eşle, tekrar birleştir
+        name_map = self._adim_tablosu()['Adım Adı'].astype(object)
+        tokens = (steps['Öncül Adım'].fillna('').astype(str)
+                  .str.replace(';', ',', regex=False).str.split(',').explode().str.strip())
+        pred_ids = np.trunc(pd.to_numeric(tokens, errors='coerce')).dropna().astype('int64')
+        if pred_ids.empty:
+            view['Öncül Adları'] = ''
+        else:
+            names = pred_ids.map(name_map)
+            names = names.where(names.notna(), 'ID:' + pred_ids.astype(str))
+            view['Öncül Adları'] = names.astype(str).groupby(level=0).agg(', '.join).reindex(view.index).fillna('')
+
+        return view[self.STEP_VIEW_COLUMNS].reset_index(drop=True)
 
     def get_step_details(self, step_id):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
         step_data = df[df['AdımID'] == step_id]
         if not step_data.empty: return step_data.iloc[0].to_dict()
         return None
     
+    def _adim_tablosu(self):
+        """
+        AdımID indeksli paylaşılan adım tablosu [JobID, İş Adı, Adım Adı, İş İstasyonu]
+        (aynı ID birden çok satırdaysa sonuncusu). Is_Adimlari her yüklendiğinde bir kez kurulur.
+        Dönen DataFrame paylaşılır, üzerinde değişiklik YAPILMAMALIDIR.
+        """
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        surum = self._tablo_surumu(self.is_adimlari_path)
+        if self._adimlar is not None and surum is not None and self._adimlar[0] == surum:
+            return self._adimlar[1]
+
+        steps = df[df['AdımID'].notnull()].drop_duplicates('AdımID', keep='last')
+        tablo = steps[['JobID', 'İş Adı', 'Adım Adı', 'İş İstasyonu']].set_axis(
+            pd.Index(steps['AdımID'].astype('int64'), name='AdımID'))
+        self._adimlar = (surum, tablo)
+        return tablo
+
     def get_all_steps_map(self):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
-        steps_df = df[df['AdımID'].notnull()].copy()
-        if steps_df.empty:
-            return {}
-        return steps_df.set_index('AdımID')['Adım Adı'].to_dict()
+        tablo = self._adim_tablosu()
+        return dict(zip(tablo.index.tolist(), tablo['Adım Adı'].astype(object)))
     
     def get_unique_workstations(self):
         """Is_Adimlari.csv dosyasındaki tüm benzersiz iş istasyonu adlarını bir liste olarak döndürür."""
         try:
-            df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS)
+            df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
             # 'İş İstasyonu' sütununu al, boş olanları at, benzersiz olanları al ve sırala
             if 'İş İstasyonu' in df.columns:
-                workstations = df['İş İstasyonu'].dropna().unique()
-                return sorted(list(workstations))
+                return sorted(df['İş İstasyonu'].dropna().astype(str).unique().tolist())
             return []
         except Exception as e:
             print(f"İş istasyonları alınırken hata: {e}")
             return []
 
     def get_all_steps_with_job_info(self):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
-        steps_df = df[df['AdımID'].notnull()].copy()
-        result = {}
-        for index, row in steps_df.iterrows():
-            result[int(row['AdımID'])] = {
-                'job_name': row['İş Adı'],
-                'step_name': row['Adım Adı']
-            }
-        return result
+        tablo = self._adim_tablosu()
+        return {adim_id: {'job_name': job_name, 'step_name': step_name}
+                for adim_id, job_name, step_name in zip(tablo.index.tolist(),
+                                                        tablo['İş Adı'].astype(object),
+                                                        tablo['Adım Adı'].astype(object))}
+
+    def get_step_infos(self, step_ids=None):
+        """
+        Çok sayıda AdımID'yi tek çağrıda çözer: AdımID indeksli [JobID, İş Adı, Adım Adı, İş İstasyonu].
+        Bilinmeyen ID'lerin satırları NaN olur; step_ids=None ise tüm adımlar döner.
+        """
+        tablo = self._adim_tablosu()
+        if step_ids is None:
+            return tablo.copy()
+        ids = pd.Index([int(i) for i in step_ids], name='AdımID')
+        return tablo.reindex(ids)
 
     def create_job_step(self, job_id, step_name, predecessors,workstation):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
         job_name = self.get_job_list().get(job_id, "")
-        new_id = int(df['AdımID'].max() + 1) if not df.empty and not df['AdımID'].dropna().empty else 1
+        new_id = self._next_counter(
+            'AdımID', lambda: self._max_id(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, 'AdımID'))
         predecessors_str = ",".join(map(lambda p: str(int(p)), predecessors))
         new_row = {'JobID': job_id, 'AdımID': new_id, 'İş Adı': job_name, 'Adım Adı': step_name, 'Öncül Adım': predecessors_str, 'DegerTuru': '', 'İş İstasyonu': workstation}
-        df = self._append_row_to_df(df, new_row)
-        df.to_csv(self.is_adimlari_path, index=False)
+        graph = self._precedence_graph()
+        self._uygula([{'op': 'append', 'table': 'Is_Adimlari', 'rows': [new_row]}])
+        self._update_precedence(graph, new_id, self._parse_predecessor_ids(predecessors_str))
+        self._emit(STEP_CREATED, job_id, new_id, name=step_name)
         return new_id
 
     def update_job_step(self, step_id, new_name, predecessors, workstation): # workstation eklendi
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
         mask = df['AdımID'] == step_id
         if mask.any():
-            df.loc[mask, 'Adım Adı'] = new_name
-            df.loc[mask, 'Öncül Adım'] = ",".join(map(lambda p: str(int(p)), predecessors))
-            df.loc[mask, 'İş İstasyonu'] = workstation # Bu satır eklendi
-            df.to_csv(self.is_adimlari_path, index=False)
+            job_id = df.loc[mask, 'JobID'].iloc[0]
+            graph = self._precedence_graph()
+            predecessors_str = ",".join(map(lambda p: str(int(p)), predecessors))
+            self._uygula([{'op': 'update', 'table': 'Is_Adimlari', 'where': ['AdımID', step_id],
+                           'set': {'Adım Adı': new_name, 'Öncül Adım': predecessors_str,
+                                   'İş İstasyonu': workstation}}])
+            self._update_precedence(graph, int(step_id), self._parse_predecessor_ids(predecessors_str))
+            self._emit(STEP_UPDATED, job_id, step_id, name=new_name)
             
     def delete_job_step(self, step_id):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
-        df = df[df['AdımID'] != step_id]
-        df.to_csv(self.is_adimlari_path, index=False)
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        graph = self._precedence_graph()
+        mask = df['AdımID'] == step_id
+        job_id = df.loc[mask, 'JobID'].iloc[0] if mask.any() else None
+        self._uygula([{'op': 'delete', 'table': 'Is_Adimlari', 'where': ['AdımID', [step_id]]}])
+        self._update_precedence(graph, int(step_id), None)
+        self._emit(STEP_DELETED, job_id, step_id)
 
-    def is_step_a_predecessor(self, step_id_to_check):
+    # ------------ Öncül grafiği ------------
+
+    @staticmethod
+    def _parse_predecessor_ids(value):
+        """'1,2;3' gibi bir öncül metnini int ID kümesine çevirir; sayı olmayanları atlar."""
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return set()
+        ids = set()
+        for tok in str(value).replace(';', ',').split(','):
+            tok = tok.strip()
+            if not tok:
+                continue
+            try:
+                ids.add(int(float(tok)))
+            except (ValueError, TypeError):
+                continue
+        return ids
+
+    def _precedence_graph(self):
+        """(preds, succs) sözlüklerini döndürür; Is_Adimlari değiştiyse bir kez yeniden kurar."""
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        surum = self._tablo_surumu(self.is_adimlari_path)
+        if self._precedence is not None and surum is not None and self._precedence[0] == surum:
+            return self._precedence[1], self._precedence[2]
+
+        preds, succs = {}, {}
+        steps = df[df['AdımID'].notnull()]
+        for step_id, oncul in zip(steps['AdımID'].astype('int64'), steps['Öncül Adım']):
+            step_id = int(step_id)
+            pred_ids = self._parse_predecessor_ids(oncul)
+            preds.setdefault(step_id, set()).update(pred_ids)
+            for p in pred_ids:
+                succs.setdefault(p, set()).add(step_id)
+        self._precedence = (surum, preds, succs)
+        return preds, succs
+
+    def _update_precedence(self, graph, step_id, new_preds):
         """
-        Verilen bir adim ID'sinin, başka herhangi bir adımın
-        öncül listesinde olup olmadığını kontrol eder.
+        Tek bir adımın öncüllerini grafikte günceller (new_preds=None: adım silindi).
+        Yazmadan sonra çağrılır; grafik tablonun yeni bellek sürümüne bağlanır.
         """
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
-        all_steps = df[df['AdımID'].notnull()]
-        
-        step_id_to_check_str = str(step_id_to_check)
+        preds, succs = graph
+        for p in preds.pop(step_id, set()):
+            succs.get(p, set()).discard(step_id)
+        if new_preds is not None:
+            preds[step_id] = set(new_preds)
+            for p in new_preds:
+                succs.setdefault(p, set()).add(step_id)
+        surum = self._tablo_surumu(self.is_adimlari_path)
+        self._precedence = (surum, preds, succs) if surum is not None else None
 
-        for index, row in all_steps.iterrows():
-            # Kontrol ettiğimiz adımı atla
-            if row['AdımID'] == step_id_to_check:
-                continue
+    def get_predecessors(self, step_id):
+        """Adımın doğrudan öncüllerinin ID listesi."""
+        preds, _ = self._precedence_graph()
+        return sorted(preds.get(int(step_id), ()))
+
+    def get_successors(self, step_id):
+        """Adımı öncül olarak kullanan adımların (doğrudan ardılların) ID listesi."""
+        _, succs = self._precedence_graph()
+        return sorted(succs.get(int(step_id), ()))
 
-            predecessor_str = str(row.get('Öncül Adım', '')).strip()
-            if predecessor_str:
-                # Öncül ID'leri ayır ve temizle
-                predecessor_ids = [p.strip() for p in predecessor_str.split(',') if p.strip()]
-                if step_id_to_check_str in predecessor_ids:
-                    # Eğer aradığımız ID bu listeyse, bağımlılık var demektir.
-                    return True
-        # Döngü bitti ve bulunamadıysa, bağımlılık yoktur.
-        return False
+    def is_step_a_predecessor(self, step_id_to_check):
+        """
+        Verilen bir adim ID'sinin, başka herhangi bir adımın
+        öncül listesinde olup olmadığını kontrol eder (ters indeksten, O(1)).
+        """
+        _, succs = self._precedence_graph()
+        step_id = int(step_id_to_check)
+        return any(s != step_id for s in succs.get(step_id, ()))
     
     def set_step_value_type(self, step_id, value_type):
-        df = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
+        df = self._get_table(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
         mask = df['AdımID'] == step_id
         if mask.any():
-            df.loc[mask, 'DegerTuru'] = value_type
-            df.to_csv(self.is_adimlari_path, index=False)
+            job_id = df.loc[mask, 'JobID'].iloc[0]
+            self._uygula([{'op': 'update', 'table': 'Is_Adimlari', 'where': ['AdımID', step_id],
+                           'set': {'DegerTuru': value_type}}])
+            self._emit(STEP_VALUE_TYPE_CHANGED, job_id, step_id, value_type=value_type)
     
     def delete_job(self, job_id):
+        """İşi ve bağlı tüm kayıtları (ölçümler, analizler, analiz detayları) tek işlem grubu olarak siler."""
         job_id = int(job_id)
+        before = {path: self._tablo_surumu(path) for path in self._zaman_bolumleri([job_id])}
+        ops = []
+        for analiz_path, analiz_cols, detay_path in [
+            (self.basic_most_analizleri_path, self.BASIC_MOST_ANALIZLERI_COLUMNS, self.basic_most_detaylari_path),
+            (self.maxi_most_analizleri_path, self.MAXI_MOST_ANALIZLERI_COLUMNS, self.maxi_most_detaylari_path),
+            (self.mini_most_analizleri_path, self.MINI_MOST_ANALIZLERI_COLUMNS, self.mini_most_detaylari_path),
+        ]:
+            if self._depo is not None:
+                analiz_ids = self._depo.query(
+                    f'SELECT "AnalizID" FROM "{self._table_name(analiz_path)}" WHERE "JobID" = ?', (job_id,))['AnalizID']
+            else:
+                df_analiz = self._get_table(analiz_path, analiz_cols)
+                analiz_ids = df_analiz.loc[df_analiz['JobID'] == job_id, 'AnalizID']
+            analiz_ids = sorted({int(a) for a in analiz_ids.dropna()})
+            if analiz_ids:
+                ops.append({'op': 'delete', 'table': self._table_name(detay_path), 'where': ['AnalizID', analiz_ids]})
+            ops.append({'op': 'delete', 'table': self._table_name(analiz_path), 'where': ['JobID', [job_id]]})
+        for path in (self.westinghouse_path, self.zaman_etudu_path, self.is_adimlari_path):
+            ops.append({'op': 'delete', 'table': self._table_name(path), 'where': ['JobID', [job_id]]})
 
-        df_adımlar = self._read_csv(self.is_adimlari_path, self.IS_ADIMLARI_COLUMNS, dtypes=self.IS_ADIMLARI_DTYPES)
-        df_adımlar = df_adımlar[df_adımlar['JobID'] != job_id]
-        df_adımlar.to_csv(self.is_adimlari_path, index=False)
-        
-        df_zamanlar = self._read_csv(self.zaman_etudu_path, self.ZAMAN_ETUDU_COLUMNS)
-        if not df_zamanlar.empty:
-            df_zamanlar = df_zamanlar[df_zamanlar['JobID'] != job_id]
-            df_zamanlar.to_csv(self.zaman_etudu_path, index=False)
-
-        df_westinghouse = self._read_csv(self.westinghouse_path, self.WESTINGHOUSE_COLUMNS)
-        if not df_westinghouse.empty:
-            df_westinghouse = df_westinghouse[df_westinghouse['JobID'] != job_id]
-            df_westinghouse.to_csv(self.westinghouse_path, index=False)
-
-        df_basic_most = self._read_csv(self.basic_most_analizleri_path, self.BASIC_MOST_ANALIZLERI_COLUMNS)
-        if not df_basic_most.empty:
-            analiz_ids_to_delete = df_basic_most[df_basic_most['JobID'] == job_id]['AnalizID'].tolist()
-            if analiz_ids_to_delete:
-                df_most_detaylar = self._read_csv(self.basic_most_detaylari_path, self.BASIC_MOST_DETAYLARI_COLUMNS)
-                if not df_most_detaylar.empty: df_most_detaylar = df_most_detaylar[~df_most_detaylar['AnalizID'].isin(analiz_ids_to_delete)]; df_most_detaylar.to_csv(self.basic_most_detaylari_path, index=False)
-            df_basic_most = df_basic_most[df_basic_most['JobID'] != job_id]; df_basic_most.to_csv(self.basic_most_analizleri_path, index=False)
-        
-        df_maxi_most = self._read_csv(self.maxi_most_analizleri_path, self.MAXI_MOST_ANALIZLERI_COLUMNS)
-        if not df_maxi_most.empty:
-            analiz_ids_to_delete = df_maxi_most[df_maxi_most['JobID'] == job_id]['AnalizID'].tolist()
-
-            if analiz_ids_to_delete:
-                df_maxi_detaylar = self._read_csv(self.maxi_most_detaylari_path, self.MAXI_MOST_DETAYLARI_COLUMNS)
-                if not df_maxi_detaylar.empty:
-                    df_maxi_detaylar = df_maxi_detaylar[~df_maxi_detaylar['AnalizID'].isin(analiz_ids_to_delete)]
-                    df_maxi_detaylar.to_csv(self.maxi_most_detaylari_path, index=False)
-            
-            df_maxi_most = df_maxi_most[df_maxi_most['JobID'] != job_id]
-            df_maxi_most.to_csv(self.maxi_most_analizleri_path, index=False)
-
-        df_mini_most = self._read_csv(self.mini_most_analizleri_path, self.MINI_MOST_ANALIZLERI_COLUMNS)
-        if not df_mini_most.empty:
-            analiz_ids_to_delete = df_mini_most[df_mini_most['JobID'] == job_id]['AnalizID'].tolist()
-            if analiz_ids_to_delete:
-                df_mini_detaylar = self._read_csv(self.mini_most_detaylari_path, self.MINI_MOST_DETAYLARI_COLUMNS)
-                if not df_mini_detaylar.empty: df_mini_detaylar = df_mini_detaylar[~df_mini_detaylar['AnalizID'].isin(analiz_ids_to_delete)]; df_mini_detaylar.to_csv(self.mini_most_detaylari_path, index=False)
-            df_mini_most = df_mini_most[df_mini_most['JobID'] != job_id]; df_mini_most.to_csv(self.mini_most_analizleri_path, index=False)
+        # Eşleşmeyen silmeler CSV'de tabloyu yeniden yazdırmaz; ölçümler yalnızca işi içeren
+        # bölümlerden silinir (bkz. _uygula)
+        self._uygula(ops)
+        self._sure_ozet_is_sil(before, job_id)
+        self._emit(JOB_DELETED, job_id)
 
     # data_manager.py - Değişiklik
 
     def _kaydet_most_analizi_generic(self, job_id, step_id, model_tipi, toplam_tmu, toplam_saniye, kodlama, detaylar, analiz_path, detay_path, analiz_cols, detay_cols):
         """Tüm MOST analizlerini kaydetmek için kullanılan genel, özel metot."""
-        # 1. Ana Analiz Verisini Kaydet
-        df_analizler = self._read_csv(analiz_path, analiz_cols)
+        # 1. Ana Analiz Verisi
         yeni_analiz_id = self._get_next_global_analiz_id()
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
@@ -331,12 +1356,10 @@ class DataManager:
             'AnalizID': yeni_analiz_id, 'JobID': job_id, 'AdımID': step_id, 'ModelTipi': model_tipi,
             'ToplamTMU': toplam_tmu, 'ToplamSaniye': toplam_saniye, 'Kodlama': kodlama, 'Timestamp': timestamp
         }
-        df_analizler = self._append_row_to_df(df_analizler, yeni_analiz_satiri)
-        df_analizler.to_csv(analiz_path, index=False)
+        ops = [{'op': 'append', 'table': self._table_name(analiz_path), 'rows': [yeni_analiz_satiri]}]
 
-        # 2. Analiz Detaylarını Kaydet
-        df_detaylar = self._read_csv(detay_path, detay_cols)
-        yeni_detay_id_baslangic = int(df_detaylar['DetayID'].max() + 1) if not df_detaylar.empty and not df_detaylar['DetayID'].dropna().empty else 1
+        # 2. Analiz Detayları
+        yeni_detay_id_baslangic = self._next_counter('DetayID', self._scan_max_detay_id, adet=max(len(detaylar), 1))
         
         yeni_detay_satirlari = []
         for i, detay in enumerate(detaylar):
@@ -347,9 +1370,10 @@ class DataManager:
             yeni_detay_satirlari.append(detay_satiri)
         
         if yeni_detay_satirlari:
-            yeni_detaylar_df = pd.DataFrame(yeni_detay_satirlari)
-            df_detaylar = pd.concat([df_detaylar, yeni_detaylar_df], ignore_index=True)
-            df_detaylar.to_csv(detay_path, index=False)
+            ops.append({'op': 'append', 'table': self._table_name(detay_path), 'rows': yeni_detay_satirlari})
+        # Analiz ve detayları birlikte kaydedilir (biri yazılıp diğeri yarım kalmaz)
+        self._uygula(ops)
+        self._emit(ANALYSIS_SAVED, job_id, step_id, ModelTipi=model_tipi, AnalizID=yeni_analiz_id)
 
     def kaydet_most_analizi(self, job_id, step_id, model_tipi, toplam_tmu, toplam_saniye, kodlama, detaylar):
         """BasicMOST analiz sonucunu ve detaylarını kaydeder."""
@@ -370,29 +1394,299 @@ class DataManager:
                                           self.MINI_MOST_ANALIZLERI_COLUMNS, self.MINI_MOST_DETAYLARI_COLUMNS)
 
     def kaydet_zaman_olcumu(self, job_id, adim_id, duration):
-        df = self._read_csv(self.zaman_etudu_path, self.ZAMAN_ETUDU_COLUMNS)
-        new_id = int(df['OlcuID'].max() + 1) if not df.empty else 1
+        new_id = self._next_counter('OlcuID', self._scan_max_olcu_id)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         new_row = {'OlcuID': new_id, 'JobID': job_id, 'AdımID': adim_id, 'Sure': duration, 'Timestamp': timestamp}
-        new_row_df = pd.DataFrame([new_row])
-        df = pd.concat([df, new_row_df], ignore_index=True)
-        df.to_csv(self.zaman_etudu_path, index=False)
+        path = self._zaman_bolumu(timestamp)
+        before = self._tablo_surumu(path)
+
+        self._uygula([{'op': 'append', 'table': 'Zaman_Etudu', 'rows': [new_row]}])
+        self._sure_ozet_ekle(before, path, job_id, adim_id, duration)
+        self._appends_since_compact += 1
+        if self.zaman_etudu_compact_every and self._appends_since_compact >= self.zaman_etudu_compact_every:
+            self.compact_zaman_etudu()
+        self._emit(MEASUREMENT_ADDED, job_id, adim_id, OlcuID=new_id, Sure=duration)
+
+    def compact_zaman_etudu(self):
+        """
+        Zaman etüdü ölçümlerini sıkıştırır. CSV: içinde bulunulan ay dışındaki küçük bölümler, kronolojik
+        sırayla ve toplamı zaman_bolum_hedef_satiri'nı aşmayacak gruplar halinde tek dosyada birleştirilir
+        ('2026-01.csv' + '2026-02.csv' -> '2026-01_2026-02.csv'); içinde bulunulan ayın bölümünde tekrarlanan
+        OlcuID'ler (son kayıt kalır) temizlenir ve satırlar OlcuID'ye göre sıralanır. SQLite: tablonun
+        tamamı aynı şekilde temizlenip sıralanır.
+        """
+        if self._depo is not None:
+            self._olcumleri_duzenle(self.zaman_etudu_path)
+            self._appends_since_compact = 0
+            return
+
+        self.flush()
+        manifest = self._bolum_manifesti()
+        bu_ay = datetime.now().strftime('%Y-%m')
+        gruplar, grup, toplam = [], [], 0
+        for ad in sorted(manifest):
+            aralik = bolum_araligi(ad)
+            satir = manifest[ad]['satir']
+            if aralik is None or aralik[1] >= bu_ay or (grup and toplam + satir > self.zaman_bolum_hedef_satiri):
+                gruplar.append(grup)
+                grup, toplam = [], 0
+                if aralik is None or aralik[1] >= bu_ay:
+                    continue
+            grup.append(ad)
+            toplam += satir
+        gruplar.append(grup)
+
+        for grup in gruplar:
+            if len(grup) > 1:
+                self._bolumleri_birlestir(grup)
+        guncel = self._bolum_yolu(bu_ay)
+        if os.path.exists(guncel):
+            self._olcumleri_duzenle(guncel)
+        self._manifesti_kaydet()
+        self._appends_since_compact = 0
+
+    def _olcumleri_duzenle(self, file_path):
+        """Tablodaki tekrarlanan OlcuID'leri temizler (son kayıt kalır) ve satırları OlcuID'ye göre sıralar."""
+        # Tablo kilidi altında okunur: başka süreçlerin o ana kadarki eklemeleri de kapsanır
+        with self._tablo_kilidi(file_path):
+            df = self._read_csv(file_path, self.ZAMAN_ETUDU_COLUMNS)
+            if not df.empty and 'OlcuID' in df.columns:
+                df = df.drop_duplicates(subset='OlcuID', keep='last').sort_values('OlcuID', kind='stable')
+            self._write_csv(df, file_path)
+
+    def _bolumleri_birlestir(self, adlar):
+        """Kronolojik sıradaki bölümleri ilkinin başından sonuncunun sonuna uzanan tek bölümde birleştirir."""
+        paths = [os.path.join(self.zaman_etudu_klasoru, ad + '.csv') for ad in adlar]
+        hedef = os.path.join(self.zaman_etudu_klasoru,
+                             f"{bolum_araligi(adlar[0])[0]}_{bolum_araligi(adlar[-1])[1]}.csv")
+        with ExitStack() as stack:
+            # Kilitler her süreçte aynı sırayla alınır
+            for path in sorted(set(paths + [hedef])):
+                stack.enter_context(self._tablo_kilidi(path))
+            frames = [self._read_csv_from_disk(path, self.ZAMAN_ETUDU_COLUMNS)
+                      for path in dict.fromkeys([hedef] + paths) if os.path.exists(path)]
+            frames = [df for df in frames if not df.empty]
+            if not frames:
+                return
+            df = pd.concat(frames, ignore_index=True)
+            df = df.drop_duplicates(subset='OlcuID', keep='last').sort_values('OlcuID', kind='stable')
+            # Önce birleşik bölüm yazılır, sonra eskiler silinir: yarıda kalırsa satırlar kaybolmaz,
+            # eski bölümler bir sonraki sıkıştırmada yeniden birleştirilir
+            self._write_csv(df, hedef)
+            for path in paths:
+                if path == hedef:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                self._set_cache(path, None, None, None)
+                self._sure_ozet.pop(path, None)
+
+    # ------------ Zaman etüdü bölümleri ------------
+
+    def _bolum_yolu(self, ay):
+        """Ayın ('2026-10' veya 'tarihsiz') ölçümlerinin yazılacağı bölüm dosyası (bkz. kapsayan_bolum)."""
+        with self._yazma_kilidi:
+            bekleyen = [p for p in itertools.chain(self._bekleyen, self._yaziliyor) if self._bolum_mu(p)]
+        adlar = set(bolum_adlari(self.zaman_etudu_klasoru))
+        adlar.update(os.path.splitext(os.path.basename(p))[0] for p in bekleyen)
+        return os.path.join(self.zaman_etudu_klasoru, kapsayan_bolum(adlar, ay) + '.csv')
+
+    def _zaman_bolumu(self, timestamp):
+        """Ölçümün yazılacağı tablo yolu: CSV'de Timestamp ayının bölümü, SQLite'ta tek tablo."""
+        if self._depo is not None:
+            return self.zaman_etudu_path
+        return self._bolum_yolu(ay_anahtari(timestamp))
+
+    def _zaman_bolumleri(self, job_ids=None):
+        """
+        Zaman etüdü bölümlerinin yolları (SQLite'ta tek tablo). job_ids verilirse yalnızca manifestte bu
+        işlerden birini içeren bölümler; bu süreçte diske yazılmayı bekleyen bölümler her durumda dahildir.
+        """
+        if self._depo is not None:
+            return [self.zaman_etudu_path]
+        with self._yazma_kilidi:
+            bekleyen = {p for p in itertools.chain(self._bekleyen, self._yaziliyor) if self._bolum_mu(p)}
+        adlar = ilgili_bolumler(self.zaman_etudu_klasoru, job_ids,
+                                self._bolum_manifesti() if job_ids is not None else None)
+        paths = {os.path.join(self.zaman_etudu_klasoru, ad + '.csv') for ad in adlar}
+        return sorted(paths | bekleyen)
+
+    def _bolum_manifesti(self):
+        """
+        Bölüm manifesti {ad: {'dosya', 'baslangic', 'bitis', 'satir', 'JobID', 'imza'}}. Girdisi olmayan veya
+        dosyası girdiden sonra değişmiş (imzası tutmayan) bölümler yeniden özetlenir; tabloları genellikle
+        zaten önbellektedir. Diske yazılmayı bekleyen bölümler dosyaları yazılınca özetlenir.
+        """
+        eski = self._manifest if self._manifest is not None else manifest_oku(self.zaman_etudu_klasoru)
+        with self._yazma_kilidi:
+            bekleyen = set(self._bekleyen) | self._yaziliyor
+        yeni = {}
+        for ad in bolum_adlari(self.zaman_etudu_klasoru):
+            path = os.path.join(self.zaman_etudu_klasoru, ad + '.csv')
+            girdi = eski.get(ad)
+            if path in bekleyen or (girdi is not None and girdi.get('imza') == dosya_imzasi(path)):
+                if girdi is not None:
+                    yeni[ad] = girdi
+                continue
+            df = self._get_table(path, self.ZAMAN_ETUDU_COLUMNS)
+            cached = self._table_cache.get(path)
+            if cached is None or cached[0] is _YAZILMADI:
+                continue
+            yeni[ad] = bolum_ozeti(ad, df, cached[0])
+        if yeni != eski:
+            self._manifest_kirli = True
+        self._manifest = yeni
+        return yeni
+
+    def _manifesti_kaydet(self):
+        """Manifest değiştiyse diske yazar (flush'ta); rapor ve diğer süreçler bölüm seçerken okur."""
+        manifest = self._bolum_manifesti()
+        if self._manifest_kirli:
+            manifest_yaz(self.zaman_etudu_klasoru, manifest)
+            self._manifest_kirli = False
+
+    def _zaman_etudunu_bolumle(self):
+        """
+        Tek seferlik geçiş: eski Zaman_Etudu.csv'yi aylık bölümlere ayırır ve siler. Bölümlerde aynı
+        OlcuID'li satır varsa eski dosyadaki hali yazılır; yarıda kalırsa sonraki açılışta tekrarlanabilir.
+        """
+        with self._tablo_kilidi(self.zaman_etudu_path):
+            if not os.path.exists(self.zaman_etudu_path):
+                return  # başka bir süreç bu arada taşıdı
+            df = self._read_csv_from_disk(self.zaman_etudu_path, self.ZAMAN_ETUDU_COLUMNS)
+            for ay, grup in aylara_ayir(df).items():
+                path = self._bolum_yolu(ay)
+                with self._tablo_kilidi(path):
+                    bolum = self._read_csv_from_disk(path, self.ZAMAN_ETUDU_COLUMNS)
+                    bolum = islemi_uygula(bolum, {'op': 'append', 'rows': grup.to_dict('records')},
+                                          list(bolum.columns), ANAHTAR_KOLONLARI[KLASOR_ADI])
+                    tablolari_atomik_yaz({path: bolum})
+            os.remove(self.zaman_etudu_path)
+        if len(df):
+            print(f"Zaman_Etudu.csv: {len(df)} ölçüm aylık bölümlere taşındı ({self.zaman_etudu_klasoru}).")
+
+    def _scan_max_olcu_id(self):
+        """Tüm bölümlerdeki en büyük OlcuID (sayaç yeniden kurulurken)."""
+        return max([self._max_id(path, self.ZAMAN_ETUDU_COLUMNS, 'OlcuID') for path in self._zaman_bolumleri()],
+                   default=0)
+
+    # ------------ Süre özetleri ------------
+
+    def _bolum_sure_ozeti(self, file_path):
+        """{JobID: {AdımID: [adet, ortalama, M2]}}; bölüm dışarıdan değiştiyse bir kez yeniden kurar."""
+        df = self._get_table(file_path, self.ZAMAN_ETUDU_COLUMNS)
+        surum = self._tablo_surumu(file_path)
+        kayit = self._sure_ozet.get(file_path)
+        if kayit is not None and surum is not None and kayit[0] == surum:
+            return kayit[1]
+
+        ozet = {}
+        if not df.empty:
+            gecerli = df[df['JobID'].notnull() & df['AdımID'].notnull() & df['Sure'].notnull()]
+            grup = pd.DataFrame({'JobID': gecerli['JobID'].astype('int64'),
+                                 'AdımID': gecerli['AdımID'].astype('int64'),
+                                 's': pd.to_numeric(gecerli['Sure'], errors='coerce').astype('float64')}
+                                ).dropna(subset=['s'])
+            # İki geçiş: önce grup ortalaması, sonra ortalamadan sapmaların kareleri (M2)
+            gruplar = grup.groupby(['JobID', 'AdımID'])['s']
+            sapma = grup['s'] - gruplar.transform('mean')
+            ozetler = pd.DataFrame({'n': gruplar.count(), 'ort': gruplar.mean(),
+                                    'm2': (sapma * sapma).groupby([grup['JobID'], grup['AdımID']]).sum()})
+            for (j, a), n, ort, m2 in zip(ozetler.index, ozetler['n'], ozetler['ort'], ozetler['m2']):
+                ozet.setdefault(int(j), {})[int(a)] = [int(n), float(ort), float(m2)]
+        self._sure_ozet[file_path] = (surum, ozet)
+        return ozet
+
+    @staticmethod
+    def _ozet_birlestir(kayit, n, ortalama, m2):
+        """[adet, ortalama, M2] kaydına başka bir kümenin özetini ekler (Chan; n=1, m2=0 ise Welford adımı)."""
+        toplam_n = kayit[0] + n
+        if toplam_n == 0:
+            return
+        fark = ortalama - kayit[1]
+        kayit[1] += fark * n / toplam_n
+        kayit[2] += m2 + fark * fark * kayit[0] * n / toplam_n
+        kayit[0] = toplam_n
+
+    def _sure_ozetleri(self, job_id, adim_id=None):
+        """
+        İşin adım özetleri {AdımID: [adet, ortalama, M2]}. CSV'de yalnızca işi içeren bölümlerin önbellekteki
+        özetleri birleştirilir; SQLite'ta (JobID, AdımID) indeksli tek bir toplama sorgusu çalışır.
+        """
+        job_id = int(job_id)
+        if self._depo is not None:
+            return self._sure_ozetleri_sql(job_id, adim_id)
+        toplam = {}
+        for path in self._zaman_bolumleri([job_id]):
+            for adim, (n, ort, m2) in self._bolum_sure_ozeti(path).get(job_id, {}).items():
+                self._ozet_birlestir(toplam.setdefault(adim, [0, 0.0, 0.0]), n, ort, m2)
+        return toplam
+
+    def _sure_ozetleri_sql(self, job_id, adim_id=None):
+        """_sure_ozetleri'nin SQLite karşılığı; M2 ortalamadan sapmalarla iki geçişte hesaplanır."""
+        kosul, params = '"JobID" = ? AND "Sure" IS NOT NULL', [job_id]
+        if adim_id is not None:
+            kosul += ' AND "AdımID" = ?'
+            params.append(int(adim_id))
+        df = self._depo.query(
+            f'SELECT z."AdımID" AS "AdımID", COUNT(*) AS n, o.ort AS ort, '
+            f'SUM((z."Sure" - o.ort) * (z."Sure" - o.ort)) AS m2 '
+            f'FROM (SELECT "AdımID", "Sure" FROM "Zaman_Etudu" WHERE {kosul}) z '
+            f'JOIN (SELECT "AdımID", AVG("Sure") AS ort FROM "Zaman_Etudu" WHERE {kosul} GROUP BY "AdımID") o '
+            f'ON z."AdımID" = o."AdımID" GROUP BY z."AdımID"',
+            tuple(params) * 2)
+        return {int(a): [int(n), float(ort), float(m2)]
+                for a, n, ort, m2 in zip(df['AdımID'], df['n'], df['ort'], df['m2']) if pd.notna(a)}
+
+    def _sure_ozet_ekle(self, before, file_path, job_id, adim_id, duration):
+        """Yeni ölçümü bölümün özetine ekler; özet yazmadan önceki tabloya ait değilse bir sonraki okumada kurulur."""
+        kayit = self._sure_ozet.get(file_path)
+        if before is None or kayit is None or kayit[0] != before:
+            return
+        ozet = kayit[1]
+        try:
+            sure = float(duration)
+        except (TypeError, ValueError):
+            sure = float('nan')
+        if job_id is not None and adim_id is not None and not np.isnan(sure):
+            self._ozet_birlestir(ozet.setdefault(int(job_id), {}).setdefault(int(adim_id), [0, 0.0, 0.0]),
+                                 1, sure, 0.0)
+        self._sure_ozet[file_path] = (self._tablo_surumu(file_path), ozet)
+
+    def _sure_ozet_is_sil(self, before, job_id):
+        """Silinen işin özetlerini düşer; before: {bölüm_yolu: silmeden önceki tablo sürümü} (bkz. delete_job)."""
+        for file_path, surum in before.items():
+            kayit = self._sure_ozet.get(file_path)
+            if surum is None or kayit is None or kayit[0] != surum:
+                continue
+            ozet = {j: v for j, v in kayit[1].items() if j != job_id}
+            self._sure_ozet[file_path] = (self._tablo_surumu(file_path), ozet)
+
+    def get_adim_sure_istatistigi(self, job_id, adim_id):
+        """Adımın ölçüm istatistiği: {'adet', 'ortalama', 'std'} (std örneklem std'si, n < 2 ise 0)."""
+        kayit = None
+        if job_id is not None and adim_id is not None:
+            kayit = self._sure_ozetleri(job_id, adim_id).get(int(adim_id))
+        if not kayit or kayit[0] == 0:
+            return {'adet': 0, 'ortalama': 0.0, 'std': 0.0}
+        n, ortalama, m2 = kayit
+        std = float(np.sqrt(m2 / (n - 1))) if n > 1 else 0.0
+        return {'adet': n, 'ortalama': ortalama, 'std': std}
 
     def get_ortalama_adim_zamani(self, job_id, adim_id):
         if job_id is None or adim_id is None: return 0.0
-        df = self._read_csv(self.zaman_etudu_path, self.ZAMAN_ETUDU_COLUMNS)
-        measurements = df[(df['JobID'] == job_id) & (df['AdımID'] == adim_id)]['Sure']
-        return measurements.mean() if not measurements.empty else 0.0
+        return self.get_adim_sure_istatistigi(job_id, adim_id)['ortalama']
 
     def load_westinghouse_analysis(self, job_id, step_id):
-        df = self._read_csv(self.westinghouse_path, self.WESTINGHOUSE_COLUMNS)
+        df = self._get_table(self.westinghouse_path, self.WESTINGHOUSE_COLUMNS)
         analysis_data = df[(df['JobID'] == job_id) & (df['AdımID'] == step_id)]
         if not analysis_data.empty:
             return analysis_data.iloc[-1].to_dict()
         return None
 
     def save_westinghouse_analysis(self, job_id, step_id, analysis_data):
-        df = self._read_csv(self.westinghouse_path, self.WESTINGHOUSE_COLUMNS)
         new_id = self._get_next_global_analiz_id()
         timestamp = datetime.now().isoformat(timespec="seconds")
         new_row_data = {
@@ -402,5 +1696,25 @@ class DataManager:
             **analysis_data,
             'Timestamp': timestamp
         }
-        df = pd.concat([df, pd.DataFrame([new_row_data])], ignore_index=True)
-        df.to_csv(self.westinghouse_path, index=False)
\ No newline at end of file
+        self._uygula([{'op': 'append', 'table': 'Westinghouse_Analizleri', 'rows': [new_row_data]}])
+        self._emit(ANALYSIS_SAVED, job_id, step_id, ModelTipi='Westinghouse', AnalizID=new_id)
+
+
+def _islem_satirlari(args, sonuc):
+    """_uygula'nın dokunduğu satırlar: eklenen satırlar + silinen anahtarlar + güncellemeler."""
+    toplam = 0
+    for op in args[1]:
+        if op['op'] == 'append':
+            toplam += len(op['rows'])
+        elif op['op'] == 'delete':
+            toplam += len(op['where'][1])
+        else:
+            toplam += 1
+    return toplam
+
+
+# İsteğe bağlı süre ölçümü (bkz. izleme; ENTEGRE_IS_ETUDU_IZLEME ayarlı değilse etkisiz):
+# açık metotlar, açılış, tablo okuma ve yazma çekirdeği
+izleme.sinifi_olc(DataManager)
+izleme.sinifi_olc(DataManager, ['__init__', '_get_table', '_yazma_isle'])
+izleme.sinifi_olc(DataManager, ['_uygula'], satir=_islem_satirlari)
@@ -0,0 +1,238 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+# Yeniden oynatmada eklenen satırların "zaten var mı" kontrolü için tablo anahtarları
+ANAHTAR_KOLONLARI = {
+    'Is_Adimlari': ['JobID', 'AdımID'],
+    'Zaman_Etudu': ['OlcuID'],
+    'Westinghouse_Analizleri': ['AnalizID'],
+    'Basic_Most_Analizleri': ['AnalizID'],
+    'Maxi_Most_Analizleri': ['AnalizID'],
+    'Mini_Most_Analizleri': ['AnalizID'],
+    'Basic_Most_Detaylari': ['DetayID'],
+    'Maxi_Most_Detaylari': ['DetayID'],
+    'Mini_Most_Detaylari': ['DetayID'],
+}
+
+
+def _json_deger(v):
+    """numpy/pandas skalerlerini JSON'a uygun hale getirir; NaN/NA -> null."""
+    if v is None:
+        return None
+    if isinstance(v, np.generic):
+        v = v.item()
+    try:
+        if pd.isna(v):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return v
+
+
+def _json_islem(op: dict) -> dict:
+    out = dict(op)
+    if 'rows' in out:
+        out['rows'] = [{k: _json_deger(v) for k, v in row.items()} for row in out['rows']]
+    if 'set' in out:
+        out['set'] = {k: _json_deger(v) for k, v in out['set'].items()}
+    if 'where' in out:
+        col, value = out['where']
+        if isinstance(value, (list, tuple, set)):
+            value = [_json_deger(v) for v in value]
+        else:
+            value = _json_deger(value)
+        out['where'] = [col, value]
+    return out
+
+
+def _anahtar(df: pd.DataFrame, columns: List[str]) -> pd.MultiIndex:
+    """Anahtar kolonlarını karşılaştırılabilir hale getirir (sayı olmayan/boş değerler -1)."""
+    return pd.MultiIndex.from_arrays(
+        [pd.to_numeric(df[c], errors='coerce').astype('float64').fillna(-1).to_numpy() for c in columns])
+
+
+def islemi_uygula(df: pd.DataFrame, op: dict, columns: List[str] = None, anahtar: List[str] = None) -> pd.DataFrame:
+    """
+    Tek bir mantıksal işlemi DataFrame'e uygular ve yeni DataFrame döndürür (girdi değişmez).
+      {'op': 'append', 'rows': [...]}                      — satır ekle
+      {'op': 'update', 'where': [kolon, değer], 'set': {}} — eşleşen satırlarda kolonları değiştir
+      {'op': 'delete', 'where': [kolon, [değerler]]}       — eşleşen satırları sil
+    anahtar verilirse eklemede aynı anahtarlı eski satırlar önce silinir (yeniden oynatma için).
+    """
+    kind = op['op']
+    if kind == 'append':
+        new_rows = pd.DataFrame(op['rows'], columns=columns if columns else None)
+        if anahtar and not df.empty and all(k in df.columns for k in anahtar):
+            # Dosyada zaten olan satırlar (yazılmış ama checkpoint'i düşülmemiş, belki yarım kalmış)
+            # günlükteki tam halleriyle değiştirilir
+            df = df[~_anahtar(df, anahtar).isin(_anahtar(new_rows, anahtar))]
+        if df.empty:
+            return new_rows.reset_index(drop=True)
+        return pd.concat([df, new_rows], ignore_index=True)
+
+    col, value = op['where']
+    if kind == 'update':
+        mask = df[col] == value
+        if not mask.any():
+            return df
+        df = df.copy()
+        for c, v in op['set'].items():
+            # category/boş float kolonlara yeni metin atanabilsin
+            df[c] = df[c].astype(object) if c in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+            df.loc[mask, c] = v
+        return df
+    if kind == 'delete':
+        mask = df[col].isin(list(value))
+        return df[~mask].reset_index(drop=True) if mask.any() else df
+    raise ValueError(f"Bilinmeyen işlem: {kind}")
+
+
+def kuyrugu_onar(path: str) -> bool:
+    """
+    Eklemenin ortasında çökme olduysa son satır yarım kalır; satır sonu ile bitmeyen
+    son satırı keser. Kesme yapıldıysa True döner.
+    """
+    try:
+        with open(path, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b'\n':
+                return False
+            # Geriye doğru son satır sonunu bul
+            pos = size
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                idx = chunk.rfind(b'\n')
+                if idx != -1:
+                    f.truncate(pos + idx + 1)
+                    return True
+            f.truncate(0)
+            return True
+    except FileNotFoundError:
+        return False
+
+
+def _yerine_koy(tmp_path: str, file_path: str, timeout: float = 2.0):
+    """
+    os.replace; Windows'ta hedef o an başka bir süreçte okunmak üzere açıksa PermissionError
+    verir, okuma bitene kadar kısa aralıklarla yeniden dener.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.replace(tmp_path, file_path)
+            return
+        except PermissionError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.02)
+
+
+def tablolari_atomik_yaz(frames: Dict[str, pd.DataFrame]):
+    """
+    Tabloları {dosya_yolu: DataFrame} geçici dosyaya yazıp fsync eder ve os.replace ile asıl
+    dosyanın yerine koyar. Okuyucular her an ya eski ya da yeni dosyayı tam olarak görür.
+    Birden çok tablo arasındaki bütünlüğü günlük sağlar: yerine koyma yarıda kalırsa işlemler
+    açılışta günlükten tamamlanır.
+    """
+    staged = []
+    try:
+        for file_path, df in frames.items():
+            # Aynı klasörü kullanan başka yazıcılarla çakışmasın diye süreç/iş parçacığına özel ad
+            tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            staged.append((file_path, tmp_path))
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                df.to_csv(f, index=False)
+                f.flush()
+                os.fsync(f.fileno())
+        for file_path, tmp_path in staged:
+            _yerine_koy(tmp_path, file_path)
+    finally:
+        for _, tmp_path in staged:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class IslemGunlugu:
+    """
+    CSV tabloları için önden yazmalı (write-ahead) mantıksal işlem günlüğü.
+    Her kayıt tek bir JSON satırıdır ve yazıldıktan sonra fsync edilir:
+      {"seq": n, "ops": [{"op": ..., "table": ...}, ...]}  — birlikte uygulanacak işlemler
+      {"seq": n, "checkpoint": "Tablo"}                     — tablonun n'e kadarki işlemleri dosyada
+    Kayıt maliyeti değişikliğin boyutuyla orantılıdır; tablo dosyaları ayrıca (checkpoint) yazılır.
+    Yarım kalmış son satır (çökme) okunurken yok sayılır.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self.seq = max((rec.get('seq', 0) for rec in self.kayitlar()), default=0)
+
+    def kayitlar(self) -> List[dict]:
+        records = []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        break  # yarım kalmış son kayıt
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _ekle(self, record: dict):
+        with open(self.path, 'a', encoding='utf-8', newline='\n') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def yaz(self, ops: List[dict]) -> int:
+        """İşlemleri tek kayıt olarak kalıcı hale getirir ve sıra numarasını döndürür."""
+        with self._lock:
+            self.seq += 1
+            self._ekle({'seq': self.seq, 'ops': [_json_islem(op) for op in ops]})
+            return self.seq
+
+    def checkpoint(self, table: str, seq: int):
+        with self._lock:
+            self._ekle({'seq': seq, 'checkpoint': table})
+
+    def temizle(self):
+        """Tüm tablolar dosyalarıyla aynıyken günlüğü boşaltır (sıra numarası devam eder)."""
+        with self._lock:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def oynatilacaklar(self) -> List[dict]:
+        """Henüz tablo dosyasına yazıldığı kesin olmayan işlemler (sırasıyla)."""
+        records = self.kayitlar()
+        checkpoints = {}
+        for rec in records:
+            if 'checkpoint' in rec:
+                table = rec['checkpoint']
+                checkpoints[table] = max(checkpoints.get(table, 0), rec['seq'])
+        ops = []
+        for rec in records:
+            for op in rec.get('ops', ()):
+                if rec['seq'] > checkpoints.get(op['table'], 0):
+                    ops.append(op)
+        return ops
@@ -0,0 +1,218 @@
+import atexit
+import functools
+import inspect
+import json
+import os
+import socket
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# İsteğe bağlı süre ölçümü. ENTEGRE_IS_ETUDU_IZLEME ayarlı değilse hiçbir metot sarılmaz
+# (ek maliyet yoktur). Değer:
+#   1 / true / evet  — kayıtlar %LOCALAPPDATA%/.Entegre_Is_Etudu/Izleme klasörüne
+#   başka bir değer  — kayıtların yazılacağı klasör
+# Süreç başına iki dosya yazılır:
+#   iz-<makine>-<pid>.json    — Chrome izi (chrome://tracing veya ui.perfetto.dev ile açılır)
+#   ozet-<makine>-<pid>.log   — ENTEGRE_IS_ETUDU_IZLEME_ARALIK saniyede bir (varsayılan 60)
+#                               eklenen özet: çağrı sayısı, toplam/ortalama/en uzun süre,
+#                               işlenen satır ve süre histogramı
+ORTAM_DEGISKENI = 'ENTEGRE_IS_ETUDU_IZLEME'
+ARALIK_DEGISKENI = 'ENTEGRE_IS_ETUDU_IZLEME_ARALIK'
+
+# Histogram kova üst sınırları (ms); sonuncusu bunlardan uzun çağrılar
+KOVALAR_MS = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000]
+
+# İzde tutulacak en fazla olay; sonrası yalnızca özete sayılır (bellek sınırlı kalsın)
+EN_FAZLA_OLAY = 200000
+
+_kilit = threading.Lock()
+_istatistik: Dict[str, dict] = {}
+_olaylar: List[dict] = []
+_atlanan_olay = 0
+_t0 = time.perf_counter()
+_klasor: Optional[str] = None
+_yazici: Optional[threading.Thread] = None
+
+
+def _klasoru_bul() -> Optional[str]:
+    deger = os.getenv(ORTAM_DEGISKENI, '').strip()
+    if not deger or deger.lower() in ('0', 'false', 'hayir', 'hayır'):
+        return None
+    if deger.lower() in ('1', 'true', 'evet'):
+        return os.path.join(os.getenv('LOCALAPPDATA') or os.path.expanduser('~'), '.Entegre_Is_Etudu', 'Izleme')
+    return deger
+
+
+def etkin() -> bool:
+    return _klasor is not None
+
+
+def _satir_sayisi(args, sonuc) -> Optional[int]:
+    """İşlenen satır: sonuç bir tablo/liste/sözlükse boyu, değilse ilk DataFrame argümanının boyu."""
+    if sonuc is not None and not isinstance(sonuc, (str, bytes)) and hasattr(sonuc, '__len__'):
+        try:
+            return len(sonuc)
+        except TypeError:
+            pass
+    for arg in args:
+        if type(arg).__name__ == 'DataFrame':
+            return len(arg)
+    return None
+
+
+def kaydet(ad: str, baslangic: float, bitis: float, satir: Optional[int] = None, kategori: str = ''):
+    """Bir çağrıyı özete ve ize ekler (baslangic/bitis: time.perf_counter)."""
+    global _atlanan_olay
+    sure_ms = (bitis - baslangic) * 1000
+    with _kilit:
+        ist = _istatistik.get(ad)
+        if ist is None:
+            ist = _istatistik[ad] = {'adet': 0, 'toplam_ms': 0.0, 'en_uzun_ms': 0.0, 'satir': 0,
+                                     'histogram': [0] * (len(KOVALAR_MS) + 1)}
+        ist['adet'] += 1
+        ist['toplam_ms'] += sure_ms
+        ist['en_uzun_ms'] = max(ist['en_uzun_ms'], sure_ms)
+        if satir:
+            ist['satir'] += satir
+        kova = next((i for i, ust in enumerate(KOVALAR_MS) if sure_ms <= ust), len(KOVALAR_MS))
+        ist['histogram'][kova] += 1
+
+        if len(_olaylar) < EN_FAZLA_OLAY:
+            olay = {'name': ad, 'cat': kategori, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                    'ts': round((baslangic - _t0) * 1e6, 1), 'dur': round(sure_ms * 1000, 1)}
+            if satir is not None:
+                olay['args'] = {'satir': satir}
+            _olaylar.append(olay)
+        else:
+            _atlanan_olay += 1
+
+
+def olc(fn=None, *, ad: str = None, kategori: str = '', satir: Callable = None):
+    """
+    Fonksiyonu/metodu süre ölçümüyle sarar; izleme kapalıysa fonksiyonu olduğu gibi döndürür.
+        @olc                       veya   olc(fn, ad='Sinif.metot')
+    satir(args, sonuc) -> int: işlenen satır sayısı (varsayılan: bkz. _satir_sayisi).
+    Hata veren çağrılar da süreleriyle kaydedilir.
+    """
+    if fn is None:
+        return lambda f: olc(f, ad=ad, kategori=kategori, satir=satir)
+    if not etkin():
+        return fn
+    ad = ad or fn.__qualname__
+    satir = satir or _satir_sayisi
+
+    @functools.wraps(fn)
+    def sarili(*args, **kwargs):
+        baslangic = time.perf_counter()
+        sonuc = None
+        try:
+            sonuc = fn(*args, **kwargs)
+            return sonuc
+        finally:
+            kaydet(ad, baslangic, time.perf_counter(), satir(args, sonuc), kategori)
+
+    sarili.__izleme__ = True
+    return sarili
+
+
+def sinifi_olc(cls, metotlar: Iterable[str] = None, kategori: str = None, satir: Callable = None):
+    """
+    Sınıfın metotlarını yerinde sarar (metotlar verilmezse '_' ile başlamayan tüm metotlar).
+    İzleme kapalıysa hiçbir şey yapmaz.
+    """
+    if not etkin():
+        return cls
+    if metotlar is None:
+        metotlar = [n for n, v in vars(cls).items() if not n.startswith('_') and inspect.isfunction(v)]
+    for ad in metotlar:
+        fn = vars(cls).get(ad)
+        if inspect.isfunction(fn) and not getattr(fn, '__izleme__', False):
+            setattr(cls, ad, olc(fn, ad=f"{cls.__name__}.{ad}", kategori=kategori or cls.__module__, satir=satir))
+    return cls
+
+
+# ------------ Dışa aktarma ------------
+
+def ozet() -> Dict[str, dict]:
+    """{ad: {'adet', 'toplam_ms', 'ortalama_ms', 'en_uzun_ms', 'satir', 'histogram'}}"""
+    with _kilit:
+        sonuc = {ad: dict(ist, histogram=list(ist['histogram'])) for ad, ist in _istatistik.items()}
+    for ist in sonuc.values():
+        ist['ortalama_ms'] = ist['toplam_ms'] / ist['adet'] if ist['adet'] else 0.0
+    return sonuc
+
+
+def ozet_metni() -> str:
+    etiketler = [f"≤{k:g}" for k in KOVALAR_MS] + [f">{KOVALAR_MS[-1]:g}"]
+    satirlar = [f"{'işlem':<48}{'adet':>8}{'toplam ms':>12}{'ort. ms':>10}{'en uzun':>10}{'satır':>10}  histogram (ms)"]
+    for ad, ist in sorted(ozet().items(), key=lambda kv: -kv[1]['toplam_ms']):
+        histogram = ' '.join(f"{e}:{n}" for e, n in zip(etiketler, ist['histogram']) if n)
+        satirlar.append(f"{ad:<48}{ist['adet']:>8}{ist['toplam_ms']:>12.1f}{ist['ortalama_ms']:>10.2f}"
+                        f"{ist['en_uzun_ms']:>10.1f}{ist['satir']:>10}  {histogram}")
+    return '\n'.join(satirlar)
+
+
+def _dosya_adi(onek: str, uzanti: str) -> str:
+    return os.path.join(_klasor, f"{onek}-{socket.gethostname()}-{os.getpid()}.{uzanti}")
+
+
+def izi_yaz(path: str = None) -> Optional[str]:
+    """Chrome izi (Trace Event biçimi) olarak yazar; yazılan dosyanın yolunu döndürür."""
+    if path is None:
+        if not etkin():
+            return None
+        os.makedirs(_klasor, exist_ok=True)
+        path = _dosya_adi('iz', 'json')
+    with _kilit:
+        olaylar = list(_olaylar)
+        atlanan = _atlanan_olay
+    pid = os.getpid()
+    meta = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': f"Entegre İş Etüdü ({pid})"}}]
+    for t in threading.enumerate():
+        meta.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': t.ident, 'args': {'name': t.name}})
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': meta + olaylar, 'displayTimeUnit': 'ms',
+                   'otherData': {'atlanan_olay': atlanan}}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def ozeti_yaz():
+    """Özeti günlük dosyasının sonuna ekler ve izi günceller."""
+    if not etkin():
+        return
+    os.makedirs(_klasor, exist_ok=True)
+    with open(_dosya_adi('ozet', 'log'), 'a', encoding='utf-8') as f:
+        f.write(f"=== {time.strftime('%Y-%m-%d %H:%M:%S')} (açılıştan {time.perf_counter() - _t0:.0f} sn) ===\n")
+        f.write(ozet_metni() + '\n\n')
+    izi_yaz()
+
+
+def _periyodik(aralik: float):
+    while True:
+        time.sleep(aralik)
+        try:
+            ozeti_yaz()
+        except OSError as e:
+            print(f"İzleme özeti yazılamadı: {e}")
+
+
+def _baslat():
+    global _klasor, _yazici
+    _klasor = _klasoru_bul()
+    if _klasor is None:
+        return
+    try:
+        aralik = float(os.getenv(ARALIK_DEGISKENI) or 60)
+    except ValueError:
+        aralik = 60.0
+    if aralik > 0:
+        _yazici = threading.Thread(target=_periyodik, args=(aralik,), name='izleme-ozeti', daemon=True)
+        _yazici.start()
+    atexit.register(ozeti_yaz)
+
+
+_baslat()
@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 
+from data_manager import STEP_UPDATED, STEP_DELETED, JOB_DELETED
+
 class BasicMostModule(QWidget):
     """
     Sadece kullanılan BasicMOST modülünü içeren, arayüzü MaxiMOST'a benzetilmiş sınıf.
@@ -17,6 +19,7 @@ class BasicMostModule(QWidget):
         self.data_manager = data_manager
         self.current_job_id = None
         self.current_step_id = None
+        self.data_manager.subscribe(self.on_data_changed, [STEP_UPDATED, STEP_DELETED, JOB_DELETED])
 
         # BasicMOST için kullanılan parametre sözlükleri
         self.A_PARAMS = { "Uzanma mesafesi içinde": 1, "Kolay uzanma mesafesi dışında": 3, "Zor uzanma mesafesi dışında": 6 }
@@ -236,6 +239,14 @@ class BasicMostModule(QWidget):
             self.job_info_label.setText("İş/Adım bilgileri yüklenirken bir hata oluştu.")
             print(f"Hata: {e}")
 
+    def on_data_changed(self, olay):
+        """Seçili adım yeniden adlandırıldıysa etiketi, silindiyse formu güncelle."""
+        if olay.tur == STEP_UPDATED and olay.step_id == self.current_step_id:
+            self.load_step_data(self.current_job_id, self.current_step_id)
+        elif ((olay.tur == STEP_DELETED and olay.step_id == self.current_step_id)
+              or (olay.tur == JOB_DELETED and olay.job_id == self.current_job_id)):
+            self.load_step_data(None, None)
+
     def _kaydet_analiz(self):
         if self.current_job_id is None or self.current_step_id is None:
             QMessageBox.warning(self, "Uyarı", "Kaydetmek için bir iş ve adım seçilmelidir.")
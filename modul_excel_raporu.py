@@ -1,101 +1,375 @@
+import hashlib
+import json
+import os
+import pickle
 import re
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill, Border, Side
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.utils import get_column_letter
 # Series ve ChartLines buraya eklendi
 from openpyxl.chart import BarChart, Reference, Series
 from openpyxl.chart.axis import ChartLines, TextAxis
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
 from openpyxl.worksheet.hyperlink import Hyperlink
 from openpyxl.chart.label import DataLabelList
 from openpyxl.chart.series import SeriesLabel
 
+import izleme
+from rapor_modeli import IsModeli, ReportModel
 
 
 
-# ------------------------- Yardımcı Fonksiyonlar -------------------------
 
-def _read_csv_safe(path: str) -> pd.DataFrame:
-    try:
-        return pd.read_csv(path)
-    except Exception:
-        return pd.DataFrame()
-
-def _ensure_cols(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
-    for c in cols:
-        if c not in df.columns:
-            df[c] = pd.NA
-    return df
-
-def _is_genel_tekrar(param_code) -> bool:
-    if pd.isna(param_code):
-        return False
-    x = str(param_code).strip().lower().replace(" ", "")
-    return x.startswith("geneltekrar")
-
-def _extract_indis(param_code) -> str:
-    """ParametreKodu başı: harf(ler) + bitişik rakam(lar) (örn. A, A1, B)."""
-    if pd.isna(param_code):
-        return ""
-    s = str(param_code).strip()
-    m = re.match(r'^([A-Za-zÇĞİÖŞÜçğıöşü]+[0-9]*)', s)
-    return m.group(1) if m else ""
-def _parse_predecessors(value) -> List[int]:
+# ------------------------- Akış (write-only) Kipi -------------------------
+#
+# Normal kipte tüm sayfalar bellekte bir openpyxl Workbook'ta tutulur; her stil ataması
+# çalışma kitabının stil listelerinde aranır, _autosize da en sonda bütün hücreleri yeniden
+# gezer. Akış kipinde yazıcı metotlar aynı kalır, ancak sayfa hafif bir tampona yazılır
+# (stiller düz öznitelik, sütun genişlikleri değerler yazılırken tutulur). Sayfa bitince
+# (bir sonraki create_sheet'te veya save'de) satırlar sırayla write-only sayfaya akıtılır ve
+# tampon bırakılır; bellekte aynı anda tek bir iş sayfası bulunur.
+
+_VARSAYILAN_KENARLIK = DEFAULT_BORDER  # openpyxl'de kenarlığı atanmamış hücrenin kenarlığı
+
+
+class _TamponHucre:
+    __slots__ = ('sayfa', 'row', 'column', '_value', 'font', 'fill', '_border',
+                 'alignment', 'number_format', '_style', 'hyperlink')
+
+    def __init__(self, sayfa, row, column):
+        self.sayfa = sayfa
+        self.row = row
+        self.column = column
+        self._value = None
+        self.font = self.fill = self._border = self.alignment = self.number_format = None
+        self._style = None
+        self.hyperlink = None
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        if value is not None:
+            self.sayfa._uzunluk_kaydet(self.column, len(str(value)))
+
+    @property
+    def border(self):
+        return self._border if self._border is not None else _VARSAYILAN_KENARLIK
+
+    @border.setter
+    def border(self, value):
+        self._border = value
+
+    @property
+    def style(self):
+        return self._style
+
+    @style.setter
+    def style(self, value):
+        # openpyxl'deki gibi: adlandırılmış stil önceki biçimleri ezer
+        self._style = value
+        self.font = self.fill = self._border = self.alignment = self.number_format = None
+
+    @property
+    def coordinate(self):
+        return f"{get_column_letter(self.column)}{self.row}"
+
+    def bicimli(self) -> bool:
+        return (self._style is not None or self.font is not None or self.fill is not None
+                or self._border is not None or self.alignment is not None or self.number_format is not None)
+
+
+class _SutunBoyutu:
+    __slots__ = ('width',)
+
+    def __init__(self):
+        self.width = None
+
+
+class _AkisSayfasi:
+    """
+    Rapor yazıcılarının kullandığı Worksheet alt kümesi (cell, merge_cells, title,
+    column_dimensions, add_chart). Hücreler tamponda tutulur; akit(ws) ile write-only
+    sayfaya satır satır yazılır. Çalışma kitabına bağlı olmadığından pickle ile başka
+    bir süreçten de gönderilebilir (bkz. _is_sayfasi_ciz).
     """
-    '1', '1,2', '1 2', '1;2' gibi yazılmış öncül listelerini
-    [1, 2] şeklinde int listesine çevirir.
+
+    def __init__(self, title: str):
+        self.title = title
+        self.column_dimensions: Dict[str, _SutunBoyutu] = defaultdict(_SutunBoyutu)
+        self._hucreler: Dict[Tuple[int, int], _TamponHucre] = {}
+        self._uzunluklar: Dict[int, int] = {}
+        self._birlesikler: Dict[str, None] = {}
+        self._grafikler: List[tuple] = []
+        # Kenarlık toplamları: aynı kenarlık çiftleri için tek nesne (stiller id ile eşlenir)
+        self._toplamlar: Dict[tuple, tuple] = {}
+        self.min_column = self.max_column = self.max_row = 0
+
+    def add_chart(self, chart, anchor=None):
+        self._grafikler.append((chart, anchor))
+
+    def _uzunluk_kaydet(self, column: int, uzunluk: int):
+        if uzunluk > self._uzunluklar.get(column, 0):
+            self._uzunluklar[column] = uzunluk
+
+    def cell(self, row: int, column: int, value=None) -> _TamponHucre:
+        c = self._hucreler.get((row, column))
+        if c is None:
+            c = self._hucreler[row, column] = _TamponHucre(self, row, column)
+            if self.min_column == 0 or column < self.min_column:
+                self.min_column = column
+            self.max_column = max(self.max_column, column)
+            self.max_row = max(self.max_row, row)
+        if value is not None:
+            c.value = value
+        return c
+
+    def merge_cells(self, start_row, start_column, end_row, end_column):
+        """Worksheet.merge_cells ile aynı sonuç: sol üst dışındaki hücreler boşaltılır, kenarlıklar taşınır."""
+        self._birlesikler[CellRange(min_col=start_column, min_row=start_row,
+                                    max_col=end_column, max_row=end_row).coord] = None
+        bas = self.cell(start_row, start_column)
+        son = self._hucreler.get((end_row, end_column))
+        if son is not None and son is not bas:
+            bas.border = self._kenarlik_topla(bas.border, Border(right=son.border.right, bottom=son.border.bottom))
+        for r in range(start_row, end_row + 1):
+            for c in range(start_column, end_column + 1):
+                if (r, c) != (start_row, start_column):
+                    self._hucreler[r, c] = _TamponHucre(self, r, c)
+                    self.max_row = max(self.max_row, r)
+                    self.max_column = max(self.max_column, c)
+
+        kenarlar = {
+            'top': [(start_row, c) for c in range(start_column, end_column + 1)],
+            'left': [(r, start_column) for r in range(start_row, end_row + 1)],
+            'right': [(r, end_column) for r in range(start_row, end_row + 1)],
+            'bottom': [(end_row, c) for c in range(start_column, end_column + 1)],
+        }
+        for ad, hucreler in kenarlar.items():
+            side = getattr(bas.border, ad)
+            if side and side.style is None:
+                continue
+            ek = self._kenar(ad, side)
+            for rc in hucreler:
+                h = self._hucreler[rc]
+                h.border = self._kenarlik_topla(h.border, ek)
+
+    def _kenar(self, ad: str, side) -> Border:
+        anahtar = (ad, id(side))
+        if anahtar not in self._toplamlar:
+            self._toplamlar[anahtar] = (Border(**{ad: side}), side)
+        return self._toplamlar[anahtar][0]
+
+    def _kenarlik_topla(self, a: Border, b: Border) -> Border:
+        anahtar = (id(a), id(b))
+        if anahtar not in self._toplamlar:
+            self._toplamlar[anahtar] = (a + b, a, b)
+        return self._toplamlar[anahtar][0]
+
+    def sutun_uzunlugu(self, column: int) -> int:
+        return self._uzunluklar.get(column, 0)
+
+    def akit(self, ws):
+        """Tamponu write-only sayfaya yazar (önce sütun genişlikleri, sonra satırlar sırayla)."""
+        stiller = {}
+
+        def _stil(h: _TamponHucre):
+            anahtar = (h._style, id(h.font), id(h.fill), id(h._border), id(h.alignment), h.number_format)
+            if anahtar not in stiller:
+                ornek = WriteOnlyCell(ws)
+                if h._style is not None:
+                    ornek.style = h._style
+                for ad in ('font', 'fill', 'alignment', 'number_format'):
+                    v = getattr(h, ad)
+                    if v is not None:
+                        setattr(ornek, ad, v)
+                if h._border is not None:
+                    ornek.border = h._border
+                # hücre de tutulur: anahtardaki id'ler akıtma bitene kadar başka nesneye geçmesin
+                stiller[anahtar] = (ornek._style, h)
+            return stiller[anahtar][0]
+
+        # Genişlikler ilk satırdan önce verilmeli (write-only sayfa <cols>'u ilk satırla yazar)
+        for harf, boyut in self.column_dimensions.items():
+            if boyut.width is not None:
+                ws.column_dimensions[harf].width = boyut.width
+        ws.merged_cells = MultiCellRange([CellRange(k) for k in self._birlesikler])
+        for chart, anchor in self._grafikler:
+            ws.add_chart(chart, anchor)
+        self._birlesikler, self._grafikler, self._toplamlar = {}, [], {}
+
+        satirlar: Dict[int, Dict[int, _TamponHucre]] = {}
+        for (r, c), h in self._hucreler.items():
+            satirlar.setdefault(r, {})[c] = h
+        self._hucreler = {}
+
+        for r in range(1, self.max_row + 1):
+            satir = satirlar.pop(r, None)
+            if not satir:
+                ws.append([])
+                continue
+            degerler = [None] * max(satir)
+            for c, h in satir.items():
+                if h._value is None and h.hyperlink is None and not h.bicimli():
+                    continue
+                hucre = WriteOnlyCell(ws, h._value)
+                if h.bicimli():
+                    hucre._style = StyleArray(_stil(h))
+                if h.hyperlink is not None:
+                    hucre.hyperlink = h.hyperlink
+                degerler[c - 1] = hucre
+            ws.append(degerler)
+
+
+class _AkisKitabi:
     """
-    if pd.isna(value):
-        return []
-    s = str(value).strip()
-    if not s:
-        return []
-    # ; / boşluk gibi ayraçları virgüna çevir
-    s = s.replace(";", ",").replace("/", ",")
-    tokens = re.split(r"[,\s]+", s)
-    result = []
-    for t in tokens:
-        t = t.strip()
-        if not t:
-            continue
-        try:
-            result.append(int(t))
-        except ValueError:
-            # sayı değilse yok say
-            pass
-    return result
-
-def _split_model_and_sekans(model_tipi: str) -> Tuple[str, str]:
-    """'AAA-BBB' -> ('AAA','BBB'); '-' yoksa sekans boş kalır."""
-    if pd.isna(model_tipi):
-        return "", ""
-    s = str(model_tipi)
-    if "-" in s:
-        left, right = s.split("-", 1)
-        return left.strip(), right.strip()
-    return s.strip(), ""
-
-def _pick_label(row: pd.Series, choices):
-    """choices = [(kolon_adı, görünen_etiket), ...] -> ilk TRUE olanı döndür."""
-    for col, lbl in choices:
-        try:
-            v = row.get(col, 0)
-        except Exception:
-            v = 0
-        if pd.notna(v) and str(v).strip() not in ["0", "0.0", "", "False", "NaN"]:
-            return lbl
-    return "-"
-
-def _multi_labels(row: pd.Series, choices):
-    labels = []
-    for col, lbl in choices:
-        v = row.get(col, 0)
-        if pd.notna(v) and str(v).strip() not in ["0", "0.0", "", "False", "NaN"]:
-            labels.append(lbl)
-    return labels if labels else ["-"]
+    Workbook(write_only=True) sarmalayıcısı: create_sheet bir _AkisSayfasi döndürür ve
+    açık olan önceki sayfayı diske akıtır.
+    """
+
+    def __init__(self):
+        self.wb = Workbook(write_only=True)
+        self._acik = None
+
+    def create_sheet(self, title=None, index=None) -> _AkisSayfasi:
+        ws = self.bos_sayfa(title, index)
+        self._acik = (_AkisSayfasi(ws.title), ws)
+        return self._acik[0]
+
+    def bos_sayfa(self, title=None, index=None):
+        """Açık sayfayı akıtır ve boş bir write-only sayfa ekler (adı çakışırsa openpyxl değiştirir)."""
+        self._kapat()
+        return self.wb.create_sheet(title, index)
+
+    def _kapat(self):
+        if self._acik is not None:
+            tampon, ws = self._acik
+            tampon.akit(ws)
+            self._acik = None
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return self.wb.sheetnames
+
+    def save(self, path: str):
+        self._kapat()
+        self.wb.save(path)
+
+
+# ------------------------- Paralel Kip -------------------------
+#
+# İş sayfaları birbirinden bağımsızdır (SOP bantları, CPM+Gantt, Westinghouse ve MOST
+# blokları yalnızca o işin verisini kullanır). Paralel kipte sayfa adları ana süreçte
+# belirlenir, her iş bir işçi süreçte _AkisSayfasi tamponuna çizilir ve tampon pickle ile
+# geri gönderilir; ana süreç tamponları iş sırasıyla write-only sayfalara akıtır.
+
+_ISCI_RAPORU = None
+
+
+class _TekSayfaKitabi:
+    """İşçide _write_sheet_for_job'a verilen kitap: adı önceden belirlenmiş tek sayfa açar."""
+
+    def __init__(self, title: str):
+        self.title = title
+        self.sayfa = None
+
+    def create_sheet(self, title=None, index=None) -> _AkisSayfasi:
+        self.sayfa = _AkisSayfasi(self.title)
+        return self.sayfa
+
+
+def _isci_baslat(rapor):
+    # Yüklenmiş tablolar işçi başına bir kez gönderilir; görevlerde yalnızca işin satırları gider
+    global _ISCI_RAPORU
+    _ISCI_RAPORU = rapor
+
+
+def _is_sayfasi_ciz(gorev) -> _AkisSayfasi:
+    job_name, job_df, title = gorev
+    wb = _TekSayfaKitabi(title)
+    _ISCI_RAPORU._write_sheet_for_job(wb, job_name, job_df)
+    return wb.sayfa
+
+
+# ------------------------- Artımlı Kip -------------------------
+#
+# Her rapor yolu için uygulama veri klasöründe bir önbellek klasörü tutulur
+# (Rapor_Onbellegi/<rapor yolunun özeti>/). İçinde parmakizi.json: iş başına, o işin sayfasını
+# belirleyen satırların (Is_Adimlari, ölçümler, MOST analiz/detayları, Westinghouse) özeti ve
+# sayfa adı; ve her iş sayfasının çizilmiş _AkisSayfasi tamponu (parmak izi adıyla, pickle).
+# Tamponlar pickle ile okunduğundan önbellek raporun yanına (paylaşılan bir ağ sürücüsüne
+# olabilir) değil, yalnızca kullanıcının yazabildiği yerel veri klasörüne konur. Yeniden üretimde rapor akış kipinde baştan
+# yazılır: parmak izi ve sayfa adı değişmemiş işlerin tamponları diskten okunup akıtılır,
+# yalnızca değişen/yeni işler çizilir (isci_sayisi > 1 ise süreç havuzunda). Önceki xlsx hiç
+# açılmaz; Ana Sayfa tüm işleri özetlediğinden her seferinde yeniden yazılır.
+#
+# Maliyet (benchmarks/calistir.py, orta ölçek, hiçbir iş değişmemişken): tam üretim ~14.1 s,
+# akış kipi ~8.8 s, artımlı ~6.8 s (önceki xlsx'i load_workbook ile açan sürümde ~14.3 s).
+# Kalan sürenin ~%80'i tamponların write-only sayfalara akıtılması (openpyxl XML yazımı),
+# ~%6'sı tamponların okunması, ~%9'u xlsx'in kaydedilmesidir; değişen her iş buna akış
+# kipindeki çizim maliyetini ekler.
+
+# Sayfa çizimi değiştiğinde artırılır: eski parmak izleri geçersiz olur, rapor baştan üretilir
+_PARMAK_SURUMU = 3
+
+
+def _onbellek_klasoru(output_path: str, veri_klasoru: str) -> str:
+    """output_path raporunun artımlı önbelleği: veri_klasoru altında, rapor yolunun özetiyle adlandırılmış."""
+    ozet = hashlib.sha1(os.path.normcase(os.path.abspath(output_path)).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(veri_klasoru, "Rapor_Onbellegi", ozet)
+
+
+def _parmak_dosyasi(klasor: str) -> str:
+    return os.path.join(klasor, "parmakizi.json")
+
+
+def _tampon_oku(path: str) -> Optional[_AkisSayfasi]:
+    """Saklanmış sayfa tamponu; yoksa veya okunamıyorsa None (iş yeniden çizilir)."""
+    try:
+        with open(path, "rb") as f:
+            tampon = pickle.load(f)
+    except Exception:
+        return None
+    return tampon if isinstance(tampon, _AkisSayfasi) else None
+
+
+def _tampon_yaz(path: str, tampon: _AkisSayfasi):
+    # Akıtılmadan önce yazılır: akit tamponu boşaltır
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(tampon, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _parmak_oku(path: str) -> dict:
+    """Parmak izi dosyası; yoksa, bozuksa veya başka bir sürüme aitse boş sözlük."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            veri = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(veri, dict) or veri.get("surum") != _PARMAK_SURUMU:
+        return {}
+    return veri
+
+
+def _parmak_yaz(path: str, veri: dict):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(veri, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
 
 
 # ------------------------- Raporlayıcı Sınıf -------------------------
@@ -127,40 +401,27 @@ class MostExcelJobReport:
     """
 
     # MOST başlıkları
-    MOST_HEADERS = ["Adım Adı", "Model", "Sekans", "Genel Tekrar İndis",
-                    "İndis", "İndis Tekrarı", "Açıklama"]
+    MOST_HEADERS = ReportModel.MOST_HEADERS
 
     # Westinghouse başlıkları (blok üst satırı)
     WH_HEADERS = ["Performans Faktörleri", "Performans Faktörleri Değerleri",
                   "İşin Zorluk Faktörleri", "Zorluk Faktörleri Değerleri",
                   "Genel Koşullar", "Koruyucu Ekipmanlar"]
 
-    # Sabit satır sıraları
-    WH_PF_NAMES = ["Yetenek", "Çaba", "Çalışma Koşulları", "Tutarlılık"]
-    WH_ZF_NAMES = ["Kişisel Gereksinimler", "Fiziksel Çaba", "Düşünsel Çaba",
-                   "Çalışma Pozisyonu", "Atmosfer", "Isı", "Gürültü"]
-
-    def __init__(self, paths: Dict[str, str], selected_job_ids=None):
+    def __init__(self, paths: Dict[str, str], selected_job_ids=None, model: ReportModel = None):
         """
-        paths:
-            {
-              "is_adimlari": ".../Is_Adimlari.csv",
-              "basic_analiz": ".../Basic_Most_Analizleri.csv",
-              "basic_detay":  ".../Basic_Most_Detaylari.csv",
-              "maxi_analiz":  ".../Maxi_Most_Analizleri.csv",
-              "maxi_detay":   ".../Maxi_Most_Detaylari.csv",
-              "mini_analiz":  ".../Mini_Most_Analizleri.csv",
-              "mini_detay":   ".../Mini_Most_Detaylari.csv",
-              "westinghouse": ".../Westinghouse_Analizleri.csv",
-            }
+        paths: bkz. ReportModel
+        model: önceden kurulmuş rapor modeli (yoksa build sırasında paths'ten kurulur)
         """
         self.paths = paths
         self.selected_job_ids = [int(j) for j in selected_job_ids] if selected_job_ids else []
+        self.model = model
 
 
         # Stil
         self.header_fill = PatternFill("solid", fgColor="D9E1F2")
         self.header_font = Font(bold=True)
+        self.kritik_fill = PatternFill("solid", fgColor="FCE4D6")  # CPM kritik adımlar
         self.center = Alignment(horizontal="center", vertical="center", wrap_text=True)
         self.left = Alignment(horizontal="left", vertical="center", wrap_text=True)
         self.thin_border = Border(
@@ -168,102 +429,16 @@ class MostExcelJobReport:
             top=Side(style="thin"), bottom=Side(style="thin")
         )
 
-
-        # Veri setleri
-        self.is_adimlari = pd.DataFrame()
-        self.analiz_all = pd.DataFrame(columns=["AnalizID", "AdımID", "ModelTipi"])
-        self.detay_all  = pd.DataFrame(columns=["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"])
-        self.west       = pd.DataFrame()
         self.job_to_sheet: Dict[str, str] = {}
 
-
-    # ------------ Yardımcı: WH kolonlarını normalize et ------------
-    def _normalize_west_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df is None or df.empty:
-            return df
-
-        # Beklediğimiz ana kolonlar
-        required = ["AnalizID", "JobID", "AdımID", "NormalZaman", "StandartZaman"]
-        for col in required:
-            if col not in df.columns:
-                df[col] = pd.NA
-
-        # AnalizID / AdımID sayısal olsun
-        for col in ["AnalizID", "AdımID"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        # Zaman kolonlarını float'a çevir
-        for col in ["NormalZaman", "StandartZaman"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        return df
-
-        # ------------ Veri Yükleme ------------
-
-    def _load(self):
-        dfs = {k: _read_csv_safe(v) for k, v in self.paths.items()}
-
-        # İş tablosu
-        # DataManager'ın oluşturduğu kolonlarla hizalıyoruz:
-        # ['JobID', 'AdımID', 'İş Adı', 'Adım Adı', 'Öncül Adım', 'DegerTuru', 'İş İstasyonu']
-        self.is_adimlari = _ensure_cols(
-            dfs.get("is_adimlari", pd.DataFrame()),
-            ["JobID", "İş Adı", "AdımID", "Adım Adı", "Öncül Adım", "DegerTuru", "İş İstasyonu"]
-        )
-
-        # Zaman etüdü (opsiyonel) – Timestamp'i de alalım, Ana Sayfa'da kullanacağız
-        self.zaman_etudu = _ensure_cols(
-            dfs.get("zaman_etudu", pd.DataFrame()),
-            ["JobID", "AdımID", "Sure", "Timestamp"]
-        )
-
-        # (Bundan sonrası – analiz_all, detay_all, west – olduğu gibi kalsın)
-
-        # Analizler (Basic/Maxi/Mini birleştirme) – ToplamSaniye'yi de alıyoruz
-        analiz_frames = []
-        for k in ["basic_analiz", "maxi_analiz", "mini_analiz"]:
-            df = dfs.get(k, pd.DataFrame()).copy()
-            if df.empty:
-                continue
-            df = _ensure_cols(df, ["AnalizID", "AdımID", "ModelTipi", "ToplamSaniye"])
-            if df["ModelTipi"].isna().all():
-                fallback = {"basic_analiz": "BasicMOST",
-                            "maxi_analiz": "MaxiMOST",
-                            "mini_analiz": "MiniMOST"}[k]
-                df["ModelTipi"] = fallback
-            analiz_frames.append(df[["AnalizID", "AdımID", "ModelTipi", "ToplamSaniye"]])
-
-        self.analiz_all = (pd.concat(analiz_frames, ignore_index=True)
-                           if analiz_frames else
-                           pd.DataFrame(columns=["AnalizID", "AdımID", "ModelTipi", "ToplamSaniye"]))
-
-        # Detaylar (Basic/Maxi/Mini birleştirme)
-        detay_frames = []
-        for k in ["basic_detay", "maxi_detay", "mini_detay"]:
-            df = dfs.get(k, pd.DataFrame()).copy()
-            if df.empty:
-                continue
-            df = _ensure_cols(df, ["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"])
-            detay_frames.append(df[["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"]])
-
-        self.detay_all = (pd.concat(detay_frames, ignore_index=True)
-                          if detay_frames else
-                          pd.DataFrame(columns=["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"]))
-
-        # Westinghouse
-        self.west = dfs.get("westinghouse", pd.DataFrame()).copy()
-        if not self.west.empty:
-            self.west = self._normalize_west_columns(self.west)
-            # AnalizID/AdımID sayısal — güvenli eşleşme
-            for col in ["AnalizID", "AdımID"]:
-                if col in self.west.columns:
-                    self.west[col] = pd.to_numeric(self.west[col], errors="coerce")
-
     # ------------ Excel Yardımcıları ------------
 
     def _autosize(self, ws):
+        if isinstance(ws, _AkisSayfasi):
+            # Akış kipinde uzunluklar değerler yazılırken tutuldu; hücreler yeniden gezilmez
+            for col_idx in range(ws.min_column, ws.max_column + 1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = min(ws.sutun_uzunlugu(col_idx) + 2, 60)
+            return
         for col in ws.columns:
             max_len = 0
             col_letter = get_column_letter(col[0].column)
@@ -630,25 +805,16 @@ class MostExcelJobReport:
 
 
 
-    def _fill_zaman_sop_from_time_study(
-        self,
-        ws,
-        start_row: int,
-        adim_sayisi: int,
-        job_df: pd.DataFrame,
-        zaman_map: Dict
-    ) -> None:
+    def _fill_sop_band(self, ws, start_row: int, start_col: int, adim_sayisi: int,
+                       satirlar: List[Dict], cevrim_hucreleri: bool = True) -> None:
         """
-        Sadece SOL taraftaki (Zaman Etüdü) SOP tablosunu doldurur.
-        Kaynaklar:
-          - Is_Adimlari.csv  -> AdımID, Adım Adı, Öncül Adım, DegerTuru
-          - Zaman_Etudu.csv  -> AdımID bazında Sure (ortalama süre)
+        _write_sop_band ile çizilmiş bir SOP bandının tablosunu doldurur:
+          No | ID | OPERASYON ADIMLARI | ÖNCÜL | VA | NVAN | NVA
+        satirlar: IsModeli.sop[kaynak]. Altına TOPLAM SÜRE formülleri yazılır;
+        cevrim_hucreleri ise ÇEVRİM SÜRESİ (CT) formülü ve boş TAKT ZAMANI (TT) hücresi de.
         """
-
-        # SOP bandının konumu (sol blok)
-        sc = 1                    # başlangıç sütunu
+        sc = start_col            # başlangıç sütunu
         sr = start_row            # SOP'un başladığı satır (bizde 2)
-        ec = sc + 8
 
         # _write_sop_band içindeki aynı hesaplar:
         h = sr + 11               # tablo başlık satırı (No, ID, ...)
@@ -657,497 +823,58 @@ class MostExcelJobReport:
         data_end = h + n          # son operasyon satırı
         toplam_row = h + 1 + n    # "TOPLAM SÜRE" satırı
 
-        # İş adımlarını hazırlayalım
-        steps = job_df.dropna(subset=["AdımID"]).copy()
-        if steps.empty:
+        if not satirlar:
             return
 
-        # AdımID int olsun ve sıralı gidelim
-        steps["AdımID"] = steps["AdımID"].astype(int)
-        steps = steps.sort_values("AdımID")
-
-        # DegerTuru -> VA / NVAN / NVA sınıflaması
-        def _classify(deger):
-            if not isinstance(deger, str):
-                return ""
-            d = deger.strip().upper()
-            if d in ("KD", "VA"):
-                return "VA"
-            if d in ("ZGK", "NVAN", "NVAA", "NV-AN"):
-                return "NVAN"
-            if d in ("KDZ", "NVA"):
-                return "NVA"
-            return ""
-
         current_row = data_start
-        no = 1
-
-        for _, r in steps.iterrows():
+        for r in satirlar:
             if current_row > data_end:
                 break  # güvenlik
 
-            adim_id = r.get("AdımID")
-            op_name = r.get("Adım Adı")
-            oncul = r.get("Öncül Adım")
-            cat = _classify(r.get("DegerTuru"))
-
-            # Zaman Etüdü'nden süre (yoksa 0)
-            sure = float(zaman_map.get(adim_id, 0.0) or 0.0)
-
-            va = nv_an = nva = 0.0
-            if cat == "VA":
-                va = sure
-            elif cat == "NVAN":
-                nv_an = sure
-            elif cat == "NVA":
-                nva = sure
-
             # Hücrelere yaz
-            ws.cell(row=current_row, column=sc,     value=no).alignment = self.center    # No
-            ws.cell(row=current_row, column=sc + 1, value=adim_id).alignment = self.center
-            ws.cell(row=current_row, column=sc + 2, value=op_name).alignment = self.left
-            ws.cell(row=current_row, column=sc + 4, value=oncul).alignment = self.center
-            ws.cell(row=current_row, column=sc + 5, value=round(va, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 6, value=round(nv_an, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 7, value=round(nva, 4)).alignment = self.center
-
-            # Kenarlık
-            for col in range(sc, sc + 8):
-                ws.cell(row=current_row, column=col).border = self.thin_border
-
-            no += 1
-            current_row += 1
-
-        # --- TOPLAM SÜRE satırı için formüller ---
-        # (VA, NVAN, NVA sütunlarının toplamı)
-        if data_start <= data_end:
-            # VA toplamı
-           # VA toplamı
-            first_va = ws.cell(row=data_start, column=sc + 5).coordinate
-            last_va  = ws.cell(row=data_end,   column=sc + 5).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 5,
-                value=f"=SUM({first_va}:{last_va})"
-            ).alignment = self.center
-
-            # NVAN toplamı
-            first_nv = ws.cell(row=data_start, column=sc + 6).coordinate
-            last_nv  = ws.cell(row=data_end,   column=sc + 6).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 6,
-                value=f"=SUM({first_nv}:{last_nv})"
-            ).alignment = self.center
-
-            # NVA toplamı
-            first_nva = ws.cell(row=data_start, column=sc + 7).coordinate
-            last_nva  = ws.cell(row=data_end,   column=sc + 7).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 7,
-                value=f"=SUM({first_nva}:{last_nva})"
-            ).alignment = self.center
-            # --- ÇEVRİM SÜRESİ (CT) hücresini doldur ---
-            ct_row = sr + 8          # CT satırı
-            ct_col = sc + 3          # CT değer hücresi (sn yazan hücrenin solu)
-
-            va_total_addr   = ws.cell(row=toplam_row, column=sc + 5).coordinate
-            nvan_total_addr = ws.cell(row=toplam_row, column=sc + 6).coordinate
-            nva_total_addr  = ws.cell(row=toplam_row, column=sc + 7).coordinate
-
-            ct_cell = ws.cell(
-                row=ct_row,
-                column=ct_col,
-                value=f"=SUM({va_total_addr},{nvan_total_addr},{nva_total_addr})"
-            )
-            ct_cell.alignment = self.center
-
-            # --- TAKT ZAMANI (TT) hücresini hazırla ---
-            tt_row = ct_row
-            tt_col = sc + 7          # TT değer hücresi (sn yazan hücrenin solu)
-
-            tt_cell = ws.cell(row=tt_row, column=tt_col)
-            # Burayı istersen sabit yapabilirsin, örn:
-            # tt_cell.value = 60    # 60 sn gibi
-            # Şimdilik boş bırakıyorum, kullanıcı Excel'den girsin:
-            tt_cell.value = None
-            tt_cell.alignment = self.center
-
-    def _fill_west_sop_from_westhouse(
-        self,
-        ws,
-        start_row: int,
-        adim_sayisi: int,
-        job_df: pd.DataFrame,
-        west_map: Dict
-    ) -> None:
-        """
-        Ortadaki (Westinghouse) SOP tablosunu doldurur.
-        Kaynaklar:
-          - Is_Adimlari.csv  -> AdımID, Adım Adı, Öncül Adım, DegerTuru
-          - Westinghouse_Analizleri.csv -> AdımID bazında Standart Süre (west_map)
-        """
-
-        # Westinghouse SOP bandı orta blok: start_col = 11
-        sc = 11                   # başlangıç sütunu (Westinghouse SOP)
-        sr = start_row            # SOP'un başladığı satır (bizde 2)
-        ec = sc + 8
-
-        # _write_sop_band içindeki aynı hesaplar:
-        h = sr + 11               # tablo başlık satırı (No, ID, ...)
-        n = max(10, adim_sayisi)  # en az 10 satır
-        data_start = h + 1        # ilk operasyon satırı
-        data_end = h + n          # son operasyon satırı
-        toplam_row = h + 1 + n    # "TOPLAM SÜRE" satırı
-
-        # İş adımlarını hazırlayalım
-        steps = job_df.dropna(subset=["AdımID"]).copy()
-        if steps.empty:
-            return
-
-        # AdımID int olsun ve sıralı gidelim
-        steps["AdımID"] = steps["AdımID"].astype(int)
-        steps = steps.sort_values("AdımID")
-
-        # DegerTuru -> VA / NVAN / NVA sınıflaması (Zaman Etüdü ile bire bir aynı)
-        def _classify(deger):
-            if not isinstance(deger, str):
-                return ""
-            d = deger.strip().upper()
-            if d in ("KD", "VA"):
-                return "VA"
-            if d in ("ZGK", "NVAN", "NVAA", "NV-AN"):
-                return "NVAN"
-            if d in ("KDZ", "NVA"):
-                return "NVA"
-            return ""
-
-        current_row = data_start
-        no = 1
-
-        for _, r in steps.iterrows():
-            if current_row > data_end:
-                break  # güvenlik
-
-            adim_id = r.get("AdımID")
-            op_name = r.get("Adım Adı")
-            oncul = r.get("Öncül Adım")
-            cat = _classify(r.get("DegerTuru"))
-
-            # Westinghouse analizinden standart süre (yoksa 0)
-            sure = float(west_map.get(adim_id, 0.0) or 0.0)
-
-            va = nv_an = nva = 0.0
-            if cat == "VA":
-                va = sure
-            elif cat == "NVAN":
-                nv_an = sure
-            elif cat == "NVA":
-                nva = sure
-
-            # Hücrelere yaz (ortadaki SOP bandı)
-            ws.cell(row=current_row, column=sc,     value=no).alignment = self.center    # No
-            ws.cell(row=current_row, column=sc + 1, value=adim_id).alignment = self.center
-            ws.cell(row=current_row, column=sc + 2, value=op_name).alignment = self.left
-            ws.cell(row=current_row, column=sc + 4, value=oncul).alignment = self.center
-            ws.cell(row=current_row, column=sc + 5, value=round(va, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 6, value=round(nv_an, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 7, value=round(nva, 4)).alignment = self.center
-
-            # Kenarlık
-            for col in range(sc, sc + 8):
-                ws.cell(row=current_row, column=col).border = self.thin_border
-
-            no += 1
-            current_row += 1
-
-        # --- TOPLAM SÜRE satırı için formüller (VA / NVAN / NVA) ---
-        if data_start <= data_end:
-            # VA toplamı
-            first_va = ws.cell(row=data_start, column=sc + 5).coordinate
-            last_va  = ws.cell(row=data_end,   column=sc + 5).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 5,
-                value=f"=SUM({first_va}:{last_va})"
-            ).alignment = self.center
-
-            # NVAN toplamı
-            first_nv = ws.cell(row=data_start, column=sc + 6).coordinate
-            last_nv  = ws.cell(row=data_end,   column=sc + 6).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 6,
-                value=f"=SUM({first_nv}:{last_nv})"
-            ).alignment = self.center
-
-            # NVA toplamı
-            first_nva = ws.cell(row=data_start, column=sc + 7).coordinate
-            last_nva  = ws.cell(row=data_end,   column=sc + 7).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 7,
-                value=f"=SUM({first_nva}:{last_nva})"
-            ).alignment = self.center
-            # --- ÇEVRİM SÜRESİ (CT) hücresini doldur ---
-            ct_row = sr + 8
-            ct_col = sc + 3
-
-            va_total_addr   = ws.cell(row=toplam_row, column=sc + 5).coordinate
-            nvan_total_addr = ws.cell(row=toplam_row, column=sc + 6).coordinate
-            nva_total_addr  = ws.cell(row=toplam_row, column=sc + 7).coordinate
-
-            ct_cell = ws.cell(
-                row=ct_row,
-                column=ct_col,
-                value=f"=SUM({va_total_addr},{nvan_total_addr},{nva_total_addr})"
-            )
-            ct_cell.alignment = self.center
-
-            # --- TAKT ZAMANI (TT) hücresini hazırla ---
-            tt_row = ct_row
-            tt_col = sc + 7
-
-            tt_cell = ws.cell(row=tt_row, column=tt_col)
-            # İstersen sabit yaz:
-            # tt_cell.value = 60
-            tt_cell.value = None
-            tt_cell.alignment = self.center
-
-
-
-    
-        """
-        ORTA bloktaki (Westinghouse) SOP tablosunu doldurur.
-        Layout, Zaman Etüdü SOP ile aynı:
-          No | ID | OPERASYON ADIMLARI | ÖNCÜL | VA | NVAN | NVA
-        Süre kaynağı: west_map (Westinghouse için kullandığımız süre haritası).
-        """
-
-        # Bu sefer SOL değil, ORTA blok → başlangıç sütunu = 11
-        sc = 11                   # Westinghouse SOP bandının başlangıç sütunu
-        sr = start_row            # SOP'un başladığı satır (bizde 2)
-        ec = sc + 8
-
-        # _write_sop_band içindeki aynı satır hesapları:
-        h = sr + 11               # tablo başlık satırı (No, ID, ...)
-        n = max(10, adim_sayisi)  # en az 10 satır
-        data_start = h + 1        # ilk operasyon satırı
-        data_end = h + n          # son operasyon satırı
-        toplam_row = h + 1 + n    # "TOPLAM SÜRE" satırı
-
-        # İş adımlarını hazırlayalım
-        steps = job_df.dropna(subset=["AdımID"]).copy()
-        if steps.empty:
-            return
-
-        steps["AdımID"] = steps["AdımID"].astype(int)
-        steps = steps.sort_values("AdımID")
-
-        # DegerTuru -> VA / NVAN / NVA sınıflaması (Zaman Etüdü ile aynı mantık)
-        def _classify(deger):
-            if not isinstance(deger, str):
-                return ""
-            d = deger.strip().upper()
-            if d in ("KD", "VA"):
-                return "VA"
-            if d in ("ZGK", "NVAN", "NVAA", "NV-AN"):
-                return "NVAN"
-            if d in ("KDZ", "NVA"):
-                return "NVA"
-            return ""
-
-        current_row = data_start
-        no = 1
-
-        for _, r in steps.iterrows():
-            if current_row > data_end:
-                break
-
-            adim_id = r.get("AdımID")
-            op_name = r.get("Adım Adı")
-            oncul = r.get("Öncül Adım")
-            cat = _classify(r.get("DegerTuru"))
-
-            # Westinghouse için süre kaynağı: west_map
-            sure = float(west_map.get(adim_id, 0.0) or 0.0)
-
-            va = nv_an = nva = 0.0
-            if cat == "VA":
-                va = sure
-            elif cat == "NVAN":
-                nv_an = sure
-            elif cat == "NVA":
-                nva = sure
-
-            # Hücrelere yaz (ORTA blok, sc=11'den başlıyor)
-            ws.cell(row=current_row, column=sc,     value=no).alignment = self.center    # No
-            ws.cell(row=current_row, column=sc + 1, value=adim_id).alignment = self.center
-            ws.cell(row=current_row, column=sc + 2, value=op_name).alignment = self.left
-            ws.cell(row=current_row, column=sc + 4, value=oncul).alignment = self.center
-            ws.cell(row=current_row, column=sc + 5, value=round(va, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 6, value=round(nv_an, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 7, value=round(nva, 4)).alignment = self.center
+            ws.cell(row=current_row, column=sc,     value=r["No"]).alignment = self.center
+            ws.cell(row=current_row, column=sc + 1, value=r["AdımID"]).alignment = self.center
+            ws.cell(row=current_row, column=sc + 2, value=r["Adım Adı"]).alignment = self.left
+            ws.cell(row=current_row, column=sc + 4, value=r["Öncül Adım"]).alignment = self.center
+            ws.cell(row=current_row, column=sc + 5, value=r["VA"]).alignment = self.center
+            ws.cell(row=current_row, column=sc + 6, value=r["NVAN"]).alignment = self.center
+            ws.cell(row=current_row, column=sc + 7, value=r["NVA"]).alignment = self.center
 
             # Kenarlık
             for col in range(sc, sc + 8):
                 ws.cell(row=current_row, column=col).border = self.thin_border
 
-            no += 1
             current_row += 1
 
-        # --- TOPLAM SÜRE satırı için formüller (VA / NVAN / NVA) ---
-        if data_start <= data_end:
-            # VA toplamı
-            first_va = ws.cell(row=data_start, column=sc + 5).coordinate
-            last_va  = ws.cell(row=data_end,   column=sc + 5).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 5,
-                value=f"=SUM({first_va}:{last_va})"
-            ).alignment = self.center
-
-            # NVAN toplamı
-            first_nv = ws.cell(row=data_start, column=sc + 6).coordinate
-            last_nv  = ws.cell(row=data_end,   column=sc + 6).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 6,
-                value=f"=SUM({first_nv}:{last_nv})"
-            ).alignment = self.center
-
-            # NVA toplamı
-            first_nva = ws.cell(row=data_start, column=sc + 7).coordinate
-            last_nva  = ws.cell(row=data_end,   column=sc + 7).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 7,
-                value=f"=SUM({first_nva}:{last_nva})"
-            ).alignment = self.center
-
-    def _fill_most_sop_from_most(
-        self,
-        ws,
-        start_row: int,
-        adim_sayisi: int,
-        job_df: pd.DataFrame,
-        most_map: Dict
-    ) -> None:
-        """
-        Sağdaki (MOST) SOP tablosunu doldurur.
-        Kaynaklar:
-          - Is_Adimlari.csv  -> AdımID, Adım Adı, Öncül Adım, DegerTuru
-          - Basic/Mini/Maxi_Most_Analizleri.csv -> AdımID bazında ToplamSaniye (most_map)
-        """
-
-        # MOST SOP bandı sağ blok: start_col = 21
-        sc = 21                  # başlangıç sütunu (MOST)
-        sr = start_row           # SOP'un başladığı satır (bizde 2)
-        ec = sc + 8
+        # --- TOPLAM SÜRE satırı için formüller (VA / NVAN / NVA sütunlarının toplamı) ---
+        for col in (sc + 5, sc + 6, sc + 7):
+            first = ws.cell(row=data_start, column=col).coordinate
+            last  = ws.cell(row=data_end,   column=col).coordinate
+            ws.cell(row=toplam_row, column=col, value=f"=SUM({first}:{last})").alignment = self.center
 
-        # _write_sop_band içindeki aynı hesaplar:
-        h = sr + 11              # tablo başlık satırı (No, ID, ...)
-        n = max(10, adim_sayisi) # en az 10 satır
-        data_start = h + 1       # ilk operasyon satırı
-        data_end = h + n         # son operasyon satırı
-        toplam_row = h + 1 + n   # "TOPLAM SÜRE" satırı
-
-        # İş adımlarını hazırlayalım
-        steps = job_df.dropna(subset=["AdımID"]).copy()
-        if steps.empty:
+        if not cevrim_hucreleri:
             return
 
-        # AdımID int olsun ve sıralı gidelim
-        steps["AdımID"] = steps["AdımID"].astype(int)
-        steps = steps.sort_values("AdımID")
-
-        # DegerTuru -> VA / NVAN / NVA sınıflaması (diğer SOP'larla aynı)
-        def _classify(deger):
-            if not isinstance(deger, str):
-                return ""
-            d = deger.strip().upper()
-            if d in ("KD", "VA"):
-                return "VA"
-            if d in ("ZGK", "NVAN", "NVAA", "NV-AN"):
-                return "NVAN"
-            if d in ("KDZ", "NVA"):
-                return "NVA"
-            return ""
-
-        no = 1
-        current_row = data_start
-
-        for _, row in steps.iterrows():
-            if current_row > data_end:
-                break
-
-            adim_id = int(row["AdımID"])
-            op_name = row.get("Adım Adı", "")
-            oncul   = row.get("Öncül Adım", "")
-
-            cat = _classify(row.get("DegerTuru", ""))
-
-            # MOST süresi (sn) – ToplamSaniye haritasından
-            sure = float(most_map.get(adim_id, 0.0) or 0.0)
-
-            # DegerTuru'na göre VA / NVAN / NVA dağıt
-            va = nv_an = nva = 0.0
-            if cat == "VA":
-                va = sure
-            elif cat == "NVAN":
-                nv_an = sure
-            elif cat == "NVA":
-                nva = sure
-
-            # Hücrelere yaz (sağdaki SOP bandı)
-            ws.cell(row=current_row, column=sc,     value=no).alignment = self.center    # No
-            ws.cell(row=current_row, column=sc + 1, value=adim_id).alignment = self.center
-            ws.cell(row=current_row, column=sc + 2, value=op_name).alignment = self.left
-            ws.cell(row=current_row, column=sc + 4, value=oncul).alignment = self.center
-            ws.cell(row=current_row, column=sc + 5, value=round(va, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 6, value=round(nv_an, 4)).alignment = self.center
-            ws.cell(row=current_row, column=sc + 7, value=round(nva, 4)).alignment = self.center
-
-            # Kenarlık
-            for col in range(sc, sc + 8):
-                ws.cell(row=current_row, column=col).border = self.thin_border
-
-            no += 1
-            current_row += 1
-
-        # --- TOPLAM SÜRE satırı için formüller (VA / NVAN / NVA) ---
-        if data_start <= data_end:
-            # VA toplamı
-            first_va = ws.cell(row=data_start, column=sc + 5).coordinate
-            last_va  = ws.cell(row=data_end,   column=sc + 5).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 5,
-                value=f"=SUM({first_va}:{last_va})"
-            ).alignment = self.center
-
-            # NVAN toplamı
-            first_nv = ws.cell(row=data_start, column=sc + 6).coordinate
-            last_nv  = ws.cell(row=data_end,   column=sc + 6).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 6,
-                value=f"=SUM({first_nv}:{last_nv})"
-            ).alignment = self.center
-
-            # NVA toplamı
-            first_nva = ws.cell(row=data_start, column=sc + 7).coordinate
-            last_nva  = ws.cell(row=data_end,   column=sc + 7).coordinate
-            ws.cell(
-                row=toplam_row,
-                column=sc + 7,
-                value=f"=SUM({first_nva}:{last_nva})"
-            ).alignment = self.center
-
+        # --- ÇEVRİM SÜRESİ (CT) hücresini doldur ---
+        ct_row = sr + 8          # CT satırı
+        ct_col = sc + 3          # CT değer hücresi (sn yazan hücrenin solu)
 
+        va_total_addr   = ws.cell(row=toplam_row, column=sc + 5).coordinate
+        nvan_total_addr = ws.cell(row=toplam_row, column=sc + 6).coordinate
+        nva_total_addr  = ws.cell(row=toplam_row, column=sc + 7).coordinate
 
+        ct_cell = ws.cell(
+            row=ct_row,
+            column=ct_col,
+            value=f"=SUM({va_total_addr},{nvan_total_addr},{nva_total_addr})"
+        )
+        ct_cell.alignment = self.center
 
+        # --- TAKT ZAMANI (TT) hücresini hazırla ---
+        tt_cell = ws.cell(row=ct_row, column=sc + 7)   # TT değer hücresi (sn yazan hücrenin solu)
+        # Şimdilik boş bırakıyorum, kullanıcı Excel'den girsin (örn. 60 sn)
+        tt_cell.value = None
+        tt_cell.alignment = self.center
 
     def _write_sop_triplet(self, ws, start_row, adim_sayisi):
         end1 = self._write_sop_band(ws, start_row, 1,  "Zaman Etüdü",  adim_sayisi)
@@ -1171,15 +898,7 @@ class MostExcelJobReport:
         """
         ws = wb.create_sheet("Ana Sayfa", 0)  # En başa ekle
 
-        headers = [
-            "İstasyon",
-            "Operasyon Adı",
-            "VA (sn)",
-            "NVAN (sn)",
-            "NVA (sn)",
-            "Ortalama Süre (sn)",
-            "Analiz Zamanı",
-        ]
+        headers = ReportModel.ANA_HEADERS
 
                 # Başlık satırı
         from openpyxl.styles import PatternFill  # dosyanın başında zaten import varsa tekrar gerek yok
@@ -1202,114 +921,14 @@ class MostExcelJobReport:
             c.border = self.thin_border
 
 
-        # Zaman etüdü: JobID–AdımID bazında ortalama süre
-        step_avg = pd.DataFrame(columns=["JobID", "AdımID", "Sure"])
-        if hasattr(self, "zaman_etudu") and not self.zaman_etudu.empty:
-            zdf = self.zaman_etudu.copy()
-            if "JobID" in zdf.columns and "AdımID" in zdf.columns:
-                step_avg = (
-                    zdf.groupby(["JobID", "AdımID"])["Sure"]
-                    .mean()
-                    .reset_index()
-                )
-
         current_row = 2
 
-        # Her İş (Operasyon) için bir satır
-        for job_name, job_df in self.is_adimlari.groupby("İş Adı"):
-            # JobID
-            job_id = None
-            if "JobID" in job_df.columns:
-                s = job_df["JobID"].dropna()
-                if not s.empty:
-                    job_id = int(s.iloc[0])
-
-            # Bu işe ait adımlar
-            steps = job_df.dropna(subset=["AdımID"]).copy()
-            if steps.empty:
-                continue
-
-            # İstasyon = en sık geçen İş İstasyonu
-            istasyon = ""
-            if "İş İstasyonu" in steps.columns:
-                ist_ser = steps["İş İstasyonu"].dropna()
-                if not ist_ser.empty:
-                    istasyon = ist_ser.value_counts().idxmax()
-
-            # Adım ortalamalarını bu iş ile birleştir
-            merged = steps.copy()
-            merged["Sure"] = 0.0
-
-            if job_id is not None and not step_avg.empty:
-                m = merged.merge(
-                    step_avg,
-                    on=["JobID", "AdımID"],
-                    how="left",
-                    suffixes=("", "_avg"),
-                )
-                merged["Sure"] = m["Sure_avg"].fillna(0.0)
-            elif not step_avg.empty:
-                # JobID kullanılamıyorsa sadece AdımID üzerinden dener
-                m = merged.merge(
-                    step_avg[["AdımID", "Sure"]],
-                    on="AdımID",
-                    how="left",
-                )
-                merged["Sure"] = m["Sure"].fillna(0.0)
-
-            # VA / NVAN / NVA toplamları
-            va = nv_an = nva = 0.0
-
-            def _classify(deger_turu: str):
-                dt = str(deger_turu or "").strip().upper()
-                if dt in ("KD", "VA"):
-                    return "VA"
-                if dt in ("ZGK", "KDG", "NVAN"):
-                    return "NVAN"
-                if dt in ("KDZ", "KDS", "NVA"):
-                    return "NVA"
-                return None
-
-            for _, r in merged.iterrows():
-                sure = float(r.get("Sure") or 0.0)
-                cat = _classify(r.get("DegerTuru"))
-                if cat == "VA":
-                    va += sure
-                elif cat == "NVAN":
-                    nv_an += sure
-                elif cat == "NVA":
-                    nva += sure
-
-            toplam = va + nv_an + nva
-
-            # Analiz Zamanı: Zaman Etüdü veya Westinghouse içindeki en güncel Timestamp
-            analiz_zamani = ""
-            timestamps = []
-
-            if job_id is not None and hasattr(self, "zaman_etudu") and not self.zaman_etudu.empty:
-                ts = self.zaman_etudu[self.zaman_etudu["JobID"] == job_id]["Timestamp"].dropna()
-                timestamps.extend(ts.tolist())
-
-            if job_id is not None and not self.west.empty and "Timestamp" in self.west.columns:
-                ts = self.west[self.west["JobID"] == job_id]["Timestamp"].dropna()
-                timestamps.extend(ts.tolist())
-
-            if timestamps:
-                # ISO tarih formatı olduğu için string max en yeni zamana denk gelir
-                analiz_zamani = max(timestamps)
-
-            row_vals = [
-                istasyon,
-                job_name,
-                round(va, 4) if va else 0,
-                round(nv_an, 4) if nv_an else 0,
-                round(nva, 4) if nva else 0,
-                round(toplam, 4) if toplam else 0,
-                analiz_zamani,
-            ]
+        # Her İş (Operasyon) için bir satır (bkz. ReportModel.ana_satirlar)
+        for satir in self.model.ana_satirlar():
+            job_name = satir["Operasyon Adı"]
 
-            for col, val in enumerate(row_vals, start=1):
-                c = ws.cell(row=current_row, column=col, value=val)
+            for col, h in enumerate(headers, start=1):
+                c = ws.cell(row=current_row, column=col, value=satir[h])
                 c.border = self.thin_border
                 if col in (3, 4, 5, 6):
                     c.alignment = self.center
@@ -1317,12 +936,10 @@ class MostExcelJobReport:
                     c.alignment = self.left
 
             # Operasyon Adı hücresine hyperlink ekle (ilgili iş sayfasına gider)
-                    # Operasyon Adı hücresine hyperlink ekle (ilgili iş sayfasına gider)
-        # job_to_sheet'ten gerçek sheet adını al, yoksa safe name'e düş
+            # job_to_sheet'ten gerçek sheet adını al, yoksa safe name'e düş
             sheet_name = self.job_to_sheet.get(job_name, self._safe_sheet_name(job_name))
 
             op_cell = ws.cell(row=current_row, column=2)
-            op_cell.value = job_name  # zaten row_vals içinde yazıldı ama garanti olsun
 
             # Excel içi hyperlink: location = "'Sayfa Adı'!A1" formatında olmalı
             location = f"'{sheet_name}'!A1"
@@ -1337,9 +954,9 @@ class MostExcelJobReport:
 
     # ------------ Westinghouse Bloğu (SOL) ------------
 
-    def _write_west_block(self, ws, start_row: int, step_name: str, wh_row: pd.Series) -> int:
+    def _write_west_block(self, ws, start_row: int, blok: Dict) -> int:
         """
-        Westinghouse bloğunu A..G sütunlarında yazar.
+        Westinghouse bloğunu (IsModeli.west_bloklari) A..G sütunlarında yazar.
         A: Adım Adı (13 satır merge)
         B..G: başlıklar ve içerik
         Geri dönüş: bir sonraki blok için başlangıç satırı (araya 1 boş satırla)
@@ -1352,7 +969,7 @@ class MostExcelJobReport:
         # Adım Adı hücresi: 13 satır birleşik (A sütunu)
         ws.merge_cells(start_row=start_row, start_column=col_start, end_row=start_row + 12, end_column=col_start)
         c_adim = ws.cell(row=start_row, column=col_start)
-        c_adim.value = step_name
+        c_adim.value = blok["Adım Adı"]
         c_adim.alignment = self.center
         c_adim.border = self.thin_border
 
@@ -1366,76 +983,25 @@ class MostExcelJobReport:
             cell.border = self.thin_border
 
         # Performans Faktörleri (4 satır) – başlığın altından itibaren
-        for i, nm in enumerate(self.WH_PF_NAMES):
+        for i, (nm, deger) in enumerate(blok["Performans Faktörleri"]):
             r = start_row + 1 + i
             ws.cell(row=r, column=col_start + 1, value=nm).alignment = self.left
             ws.cell(row=r, column=col_start + 1).border = self.thin_border
-            ws.cell(row=r, column=col_start + 2, value=str(wh_row.get(nm, "-")) if pd.notna(wh_row.get(nm, None)) else "-").alignment = self.left
+            ws.cell(row=r, column=col_start + 2, value=deger).alignment = self.left
             ws.cell(row=r, column=col_start + 2).border = self.thin_border
 
         # Zorluk Faktörleri (7 satır) – başlığın altından itibaren
-        zf_map = {
-            "Kişisel Gereksinimler": str(wh_row.get("Kisisel_Gereksinimler", "-")) if pd.notna(wh_row.get("Kisisel_Gereksinimler", None)) else "-",
-            "Fiziksel Çaba": _pick_label(wh_row, [
-                ("Fiziksel_Caba_Cok_Hafif", "Çok Hafif"),
-                ("Fiziksel_Caba_Hafif", "Hafif"),
-                ("Fiziksel_Caba_Orta", "Orta"),
-                ("Fiziksel_Caba_Agir", "Ağır"),
-                ("Fiziksel_Caba_Cok_Agir", "Çok Ağır"),
-            ]),
-            "Düşünsel Çaba": _pick_label(wh_row, [
-                ("Dusunsel_Caba_Plan_Normal", "Plan/Normal"),
-                ("Dusunsel_Caba_Karisik_Normal", "Karışık/Normal"),
-                ("Dusunsel_Caba_Plan_Yogun", "Plan/Yoğun"),
-                ("Dusunsel_Caba_Karisik_Yogun", "Karışık/Yoğun"),
-            ]),
-            "Çalışma Pozisyonu": _pick_label(wh_row, [
-                ("Poz_Serbest", "Serbest"),
-                ("Poz_Sabit_Durus", "Sabit Duruş"),
-                ("Poz_Sabit_Ayakta", "Sabit Ayakta"),
-                ("Poz_Cokme_Egilme", "Çökme/Eğilme"),
-                ("Poz_Uzanma_ve_Omuz", "Uzanma/Omuz"),
-            ]),
-            "Atmosfer": _pick_label(wh_row, [
-                ("Atmosfer_Temiz", "Temiz"),
-                ("Atmosfer_Kotu_Koku", "Kötü Koku"),
-                ("Atmosfer_Zararlı_Toz_Gaz", "Zararlı Toz/Gaz"),
-            ]),
-            "Isı": _pick_label(wh_row, [
-                ("Isı_Soguk", "Soğuk"),
-                ("Isı_Normal", "Normal"),
-                ("Isı_Sicak", "Sıcak"),
-            ]),
-            "Gürültü": _pick_label(wh_row, [
-                ("Gurultu_Normal_Is", "Normal (İş)"),
-                ("Gurultu_Normal_Makine", "Normal (Makine)"),
-                ("Gurultu_Yuksek_Sabit", "Yüksek (Sabit)"),
-                ("Gurultu_Yuksek_Frekans", "Yüksek (Frekans)"),
-            ]),
-        }
-
         base = start_row + 1
-        for i, nm in enumerate(self.WH_ZF_NAMES):
+        for i, (nm, deger) in enumerate(blok["Zorluk Faktörleri"]):
             r = base + i
             ws.cell(row=r, column=col_start + 3, value=nm).alignment = self.left
             ws.cell(row=r, column=col_start + 3).border = self.thin_border
-            ws.cell(row=r, column=col_start + 4, value=zf_map.get(nm, "-")).alignment = self.left
+            ws.cell(row=r, column=col_start + 4, value=deger).alignment = self.left
             ws.cell(row=r, column=col_start + 4).border = self.thin_border
 
         # Genel Koşullar / Koruyucu Ekipmanlar – başlığın altından itibaren
-        gk_list = _multi_labels(wh_row, [
-            ("Genel_Kirli", "Kirli"),
-            ("Genel_Islak_Doseme", "Islak Döşeme"),
-            ("Genel_Titresim", "Titreşim"),
-            ("Genel_Monotonluk", "Monotonluk"),
-            ("Genel_Dusunsel_Yorgunluk", "Düşünsel Yorgunluk"),
-        ])
-        ke_list = _multi_labels(wh_row, [
-            ("Koruyucu_Elbise_Takım", "Takım"),
-            ("Koruyucu_Elbise_Eldiven", "Eldiven"),
-            ("Koruyucu_Elbise_Agır_ve_Ozel_Yelek", "Ağır/Özel Yelek"),
-            ("Koruyucu_Elbise_Maske", "Maske"),
-        ])
+        gk_list = blok["Genel Koşullar"]
+        ke_list = blok["Koruyucu Ekipmanlar"]
 
         # Başlığın altındaki ilk hücreden başlayarak her birini alt alta yaz
         gk_start = start_row + 1
@@ -1465,8 +1031,8 @@ class MostExcelJobReport:
 
         # ------------ MOST (SAĞ) ------------
 
-    def _write_most_table(self, ws, start_row: int, merged: pd.DataFrame) -> None:
-        """MOST tablosunu J..P aralığında yazar."""
+    def _write_most_table(self, ws, start_row: int, gruplar: List[List[List]]) -> None:
+        """MOST tablosunu (IsModeli.most_gruplari) J..P aralığında yazar."""
         col_start = 10  # J
 
         header_row = start_row
@@ -1479,43 +1045,12 @@ class MostExcelJobReport:
             cell.alignment = self.center
             cell.border = self.thin_border
 
-        # Genel tekrar haritası
-        genel_tekrar_map = (
-            merged[merged["ParametreKodu"].apply(_is_genel_tekrar)]
-            .groupby("AnalizID")["TekrarSayisi"]
-            .max()
-            .to_dict()
-        )
-
-        # İçerik
-        out_rows: List[List] = []
-        group_sizes: List[int] = []
-
-        for analiz_id, grp in merged.groupby("AnalizID", sort=False):
-            grp_eff = grp[~grp["ParametreKodu"].apply(_is_genel_tekrar)].copy()
-            gsize = len(grp_eff) if len(grp_eff) > 0 else 1
-            group_sizes.append(gsize)
-
-            genel_tekrar = int(genel_tekrar_map.get(analiz_id, 1))
-            first = grp_eff.iloc[0] if not grp_eff.empty else grp.iloc[0]
-            step_name = first.get("Adım Adı", "") or ""
-            model_left, sekans = _split_model_and_sekans(first.get("ModelTipi", "") or "")
-
-            if grp_eff.empty:
-                out_rows.append([step_name, model_left, sekans, genel_tekrar, "", "", ""])
-            else:
-                for _, r in grp_eff.iterrows():
-                    indis = _extract_indis(r.get("ParametreKodu", ""))
-                    indis_tekrari = r.get("TekrarSayisi", "")
-                    aciklama = r.get("SecilenDeger", "")
-                    out_rows.append([step_name, model_left, sekans, genel_tekrar, indis, indis_tekrari, aciklama])
-
         # Yaz ve birleştir (AnalizID bloğu kadar)
         pointer = header_row + 1
-        idx = 0
-        for gsize in group_sizes:
+        for grup in gruplar:
+            gsize = len(grup)
             # satırları yaz
-            for row in out_rows[idx: idx + gsize]:
+            for row in grup:
                 for j, v in enumerate(row, start=col_start):
                     c = ws.cell(row=pointer, column=j)
                     c.value = v
@@ -1530,135 +1065,16 @@ class MostExcelJobReport:
                                    end_row=pointer - 1, end_column=col_start + off)
                     ws.cell(row=pointer - gsize, column=col_start + off).alignment = self.center
 
-            idx += gsize
-
-        # Otomatik genişlik
-        for col_idx in range(col_start, col_start + len(self.MOST_HEADERS)):
-            max_len = 0
-            for r in range(1, ws.max_row + 1):
-                val = ws.cell(row=r, column=col_idx).value
-                val = "" if val is None else str(val)
-                max_len = max(max_len, len(val))
-            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 2, 60)
+        # Sütun genişlikleri sayfanın sonunda _autosize ile (tüm sütunlar için) ayarlanır
 
     # ------------ CPM + Gantt Yardımcıları ------------
 
-    def _build_cpm_rows_linear(self, steps_df: pd.DataFrame, durations_map: Dict) -> List[Dict]:
-        """
-        CPM tablosunu hesaplar ve 'DegerTuru' bilgisini de içerir.
-        Sonuçları Erken Başlama (ES) süresine göre sıralar (Gantt şelalesi için).
-        """
-        from collections import deque
-
-        steps = steps_df.dropna(subset=["AdımID"]).copy()
-        if steps.empty:
-            return []
-
-        steps["AdımID"] = steps["AdımID"].astype(int)
-        ids = steps["AdımID"].tolist()
-
-        # Süre haritası
-        duration = {aid: float(durations_map.get(aid, 0.0) or 0.0) for aid in ids}
-
-        # Öncelik ve ardıllar
-        preds: Dict[int, List[int]] = {}
-        succs: Dict[int, List[int]] = {aid: [] for aid in ids}
-        indegree: Dict[int, int] = {aid: 0 for aid in ids}
-
-        for _, row in steps.iterrows():
-            aid = int(row["AdımID"])
-            raw_pred = row.get("Öncül Adım", "")
-            plist = _parse_predecessors(raw_pred)
-            plist = [p for p in plist if p in ids]
-            preds[aid] = plist
-
-        for aid in ids:
-            for p in preds.get(aid, []):
-                succs.setdefault(p, []).append(aid)
-                indegree[aid] += 1
-
-        # Topolojik sıralama
-        q = deque([aid for aid in ids if indegree[aid] == 0])
-        topo: List[int] = []
-        while q:
-            n = q.popleft()
-            topo.append(n)
-            for s in succs.get(n, []):
-                indegree[s] -= 1
-                if indegree[s] == 0:
-                    q.append(s)
-
-        for aid in ids:
-            if aid not in topo: topo.append(aid)
-
-        # İleri geçiş (ES / EF)
-        ES: Dict[int, float] = {aid: 0.0 for aid in ids}
-        EF: Dict[int, float] = {}
-
-        for aid in topo:
-            pl = preds.get(aid, [])
-            if pl:
-                ES[aid] = max(EF[p] for p in pl if p in EF)
-            else:
-                ES.setdefault(aid, 0.0)
-            EF[aid] = ES[aid] + duration[aid]
-
-        project_duration = max(EF.values()) if EF else 0.0
-
-        # Geri geçiş (LS / LF)
-        LS: Dict[int, float] = {}
-        LF: Dict[int, float] = {}
-        
-        last_activities = [aid for aid in ids if not succs.get(aid)]
-        for aid in last_activities:
-            LF[aid] = project_duration
-            LS[aid] = project_duration - duration[aid]
-
-        for aid in reversed(topo):
-            if aid in LS: continue
-            succ_list = succs.get(aid, [])
-            if succ_list:
-                ls_candidates = [LS[s] for s in succ_list if s in LS]
-                lf_val = min(ls_candidates) if ls_candidates else project_duration
-            else:
-                lf_val = project_duration
-            LF[aid] = lf_val
-            LS[aid] = lf_val - duration[aid]
-
-        rows: List[Dict] = []
-        for _, row in steps.iterrows():
-            aid = int(row["AdımID"])
-            
-            # --- DÜZELTME BURADA YAPILDI ---
-            # Değerleri önce değişkenlere alıp, undefined hatasını önlüyoruz.
-            current_es = ES.get(aid, 0.0)
-            current_ef = EF.get(aid, current_es + duration[aid])
-            current_ls = LS.get(aid, current_es)
-            current_lf = LF.get(aid, current_ef)
-            current_slack = current_ls - current_es
-            
-            rows.append({
-                "AdımID": aid,
-                "Adım Adı": row.get("Adım Adı", "") or "",
-                "Öncül": ",".join(str(p) for p in preds.get(aid, [])),
-                "Süre": duration[aid],
-                "ES": current_es,
-                "EF": current_ef,
-                "LS": current_ls,
-                "LF": current_lf,
-                "Bolluk": current_slack,
-                "DegerTuru": str(row.get("DegerTuru", "")).strip().upper()
-            })
-
-        # Listeyi Erken Başlama (ES) zamanına göre sırala -> Gantt'ta şelale görünümü için
-        rows.sort(key=lambda x: (x["ES"], x["AdımID"]))
-        
-        return rows
-
     def _write_cpm_and_gantt_block(self, ws, start_row: int, col_start: int,
-                                   title: str, cpm_rows: List[Dict]) -> int:
+                                   title: str, cpm_rows: List[Dict],
+                                   donguler: Optional[List[List[int]]] = None) -> int:
         """
         Üstte CPM verileri, altta GANTT Şeması oluşturur.
+        Kritik adımların satırları boyanır; öncül döngüleri tablonun altına not düşülür.
         Excel'in dosya yapısını bozmadan (corrupt hatası vermeden)
         iş adlarını solda gösteren düzeltilmiş versiyon.
         """
@@ -1697,6 +1113,8 @@ class MostExcelJobReport:
             for off, v in enumerate(vals):
                 cc = ws.cell(row=rr, column=col_start + off, value=v)
                 cc.border = self.thin_border
+                if row.get("Kritik"):
+                    cc.fill = self.kritik_fill
                 if off in (0, 3, 4, 5, 6, 7, 8):
                     cc.alignment = self.center
                 else:
@@ -1704,6 +1122,12 @@ class MostExcelJobReport:
 
         last_cpm_row = data_start + len(cpm_rows) - 1
 
+        if donguler:
+            # Döngüdeki adımlar (ve ardılları) planlanamaz; ES..Bolluk boş kalır
+            metin = " | ".join(", ".join(str(aid) for aid in d) for d in donguler)
+            ws.cell(row=last_cpm_row + 1, column=col_start,
+                    value=f"Öncül döngüsü (AdımID): {metin}").font = Font(bold=True, color="C00000")
+
         # --- 2. GANTT VERİ HAZIRLIĞI ---
         gantt_data_start_row = last_cpm_row + 3
         data_rows_count = len(cpm_rows)  # Eksik değişken tanımlandı
@@ -1726,20 +1150,10 @@ class MostExcelJobReport:
             # Başlangıç Zamanı
             ws.cell(row=rr, column=col_start + 1, value=row["ES"])
             
-            # Süre Değerleri
-            sure = row["Süre"]
-            d_turu = row["DegerTuru"]
-            
-            va_val = sure if d_turu in ("VA", "KD") else 0
-            nvan_val = sure if d_turu in ("NVAN", "ZGK", "NVAA") else 0
-            nva_val = sure if d_turu in ("NVA", "KDZ", "KDS") else 0
-            
-            if va_val == 0 and nvan_val == 0 and nva_val == 0:
-                nva_val = sure
-
-            ws.cell(row=rr, column=col_start + 2, value=va_val)
-            ws.cell(row=rr, column=col_start + 3, value=nvan_val)
-            ws.cell(row=rr, column=col_start + 4, value=nva_val)
+            # Süre Değerleri (bkz. rapor_modeli.gantt_parcalari)
+            ws.cell(row=rr, column=col_start + 2, value=row["VA"])
+            ws.cell(row=rr, column=col_start + 3, value=row["NVAN"])
+            ws.cell(row=rr, column=col_start + 4, value=row["NVA"])
 
 
         data_rows_count = len(step_labels)
@@ -1824,226 +1238,60 @@ class MostExcelJobReport:
 
     def _write_sheet_for_job(self, wb: Workbook, job_name: str, job_df: pd.DataFrame):
         ws = wb.create_sheet(self._safe_sheet_name(job_name))
-        
-        # Bu işe ait adımlar
-        adim_ids = job_df["AdımID"].dropna().unique().tolist()
-        if not adim_ids:
-            return
-
-        # Adım listesi (CPM için) – Öncül Adım ve DegerTuru kolonlarını al
-        steps_df = (
-            job_df[["AdımID", "Adım Adı", "Öncül Adım", "DegerTuru"]]
-            .dropna(subset=["AdımID"])
-            .drop_duplicates()
-        )
-
-
-        # Bu işe ait MOST analizleri
-        ilgili_analizler = self.analiz_all[self.analiz_all["AdımID"].isin(adim_ids)].copy()
-
-        # MOST detaylarını birleştir (mevcut MOST tablosu için)
-        merged = self.detay_all.merge(ilgili_analizler, on="AnalizID", how="right")
-        merged = merged.merge(job_df[["AdımID", "Adım Adı"]].drop_duplicates(),
-                              on="AdımID", how="left")
-
-        # -------- CPM için süre haritaları --------
-        # Zaman Etüdü süreleri
-        zaman_map: Dict = {}
-        if hasattr(self, "zaman_etudu") and not self.zaman_etudu.empty:
-            job_id = None
-            if "JobID" in job_df.columns:
-                s = job_df["JobID"].dropna()
-                if not s.empty:
-                    job_id = s.iloc[0]
-
-            zdf = self.zaman_etudu.copy()
-            if job_id is not None and "JobID" in zdf.columns:
-                zdf = zdf[zdf["JobID"] == job_id]
-            if not zdf.empty:
-                zaman_map = zdf.groupby("AdımID")["Sure"].mean().to_dict()
-
-        # MOST süreleri (ToplamSaniye)
-        df_most = (
-            self.analiz_all
-            .dropna(subset=["ToplamSaniye"])
-            .copy()
-        )
-
-        if "AnalizID" in df_most.columns:
-            # AnalizID varsa: en büyük AnalizID = en son yapılan analiz
-            df_most = df_most.sort_values(["AdımID", "AnalizID"])
-            last_rows = df_most.groupby("AdımID").tail(1)
-        else:
-            # AnalizID yoksa: aynı AdımID'lerde en son satırı kabul et
-            df_most = df_most.sort_values(["AdımID"])
-            last_rows = df_most.groupby("AdımID").tail(1)
-
-        most_map = (
-            last_rows
-            .set_index("AdımID")["ToplamSaniye"]
-            .astype(float)
-            .to_dict()
-        )
-
-
-       
-       # -------- CPM için süre haritaları --------
-
-        # 1) Zaman Etüdü haritası (mevcut kodun kalsın)
-
-        # 2) MOST haritası (mevcut kodun kalsın)
-
-        # 3) Westinghouse haritası – ÖNCE StandartZaman, yoksa eskisi gibi fallback
-        west_map: Dict[int, float] = {}
-
-        if not self.west.empty and "StandartZaman" in self.west.columns:
-            # Bu işe ait adımlar:
-            adim_ids = steps_df["AdımID"].dropna().astype(int).unique().tolist()
-            wdf = self.west[self.west["AdımID"].isin(adim_ids)].copy()
-            if not wdf.empty:
-                # Her adım için en son yapılan analizi al
-                wdf = wdf.sort_values(["AdımID", "AnalizID"])
-                last = wdf.groupby("AdımID").tail(1)
-                west_map = last.set_index("AdımID")["StandartZaman"].dropna().astype(float).to_dict()
-
-        # Eğer hâlâ boşsa, eskisi gibi Zaman Etüdü / MOST fallback kullan
-        if not west_map:
-            if zaman_map:
-                west_map = zaman_map
-            elif most_map:
-                west_map = most_map
-
-
-       
-        
-
-        # -------- Zaman Etüdü ve MOST için fallback mantığı --------
 
-        # Zaman Etüdü haritası boşsa, en azından MOST'tan doldur
-        if not zaman_map and most_map:
-            zaman_map = most_map
-
-        # Hâlâ boşsa, tüm adımlar için 0 ver (grafikler bozulmasın)
-        if not zaman_map:
-            zaman_map = {aid: 0.0 for aid in steps_df["AdımID"]}
-
-        # MOST boşsa, Zaman Etüdü'ne yaslansın
-        if not most_map:
-            most_map = zaman_map
-
-
-        # -------- Üstte 3 CPM + 3 Gantt (yan yana) --------
-               # Bu iş için toplam adım sayısı (SOP satır sayısını belirleyecek)
-        adim_sayisi = len(steps_df)
+        # İşin verisi (süre haritaları, SOP/CPM satırları, MOST ve Westinghouse blokları)
+        im: IsModeli = self.model.is_modeli(job_name, job_df)
+        if not im.adim_sayisi:
+            return
 
         # -------- Üstte 3 SOP + altında 3 CPM + 3 Gantt --------
+        # Bu iş için toplam adım sayısı (SOP satır sayısını belirleyecek)
+        adim_sayisi = im.adim_sayisi
         sop_bottom = self._write_sop_triplet(ws, start_row=2, adim_sayisi=adim_sayisi)
 
-
-               # Zaman Etüdü SOP tablosu
-        self._fill_zaman_sop_from_time_study(
-            ws=ws,
-            start_row=2,
-            adim_sayisi=adim_sayisi,
-            job_df=job_df,
-            zaman_map=zaman_map
-        )
-
-               # Westinghouse SOP tablosu -> SADECE west_map doluysa doldur
-        if west_map:
-            self._fill_west_sop_from_westhouse(
-                ws=ws,
-                start_row=2,
-                adim_sayisi=adim_sayisi,
-                job_df=job_df,
-                west_map=west_map
-            )
-        # west_map boşsa: Westinghouse SOP satırları boş kalacak (süre yazmayacağız)
-            # MOST SOP tablosu -> most_map doluysa doldur
-        if most_map:
-            self._fill_most_sop_from_most(
-                ws=ws,
-                start_row=2,
-                adim_sayisi=adim_sayisi,
-                job_df=job_df,
-                most_map=most_map
-            )
+        # SOP tabloları: Westinghouse / MOST süresi yoksa satırları boş kalır (bkz. IsModeli.sop)
+        self._fill_sop_band(ws, 2, 1, adim_sayisi, im.sop["Zaman Etüdü"])
+        self._fill_sop_band(ws, 2, 11, adim_sayisi, im.sop["Westinghouse"])
+        self._fill_sop_band(ws, 2, 21, adim_sayisi, im.sop["MOST"], cevrim_hucreleri=False)
 
         # SOP tabloları doldurulduktan sonra, her bandın yanına
         # VA–NVAN–NVA yüzde dağılım grafiklerini ekle
         self._add_sop_percent_charts(ws, start_row=2, adim_sayisi=adim_sayisi)
 
-
-
-
-
         # CPM + Gantt blokları SOP'tan sonra başlasın
         top_row = sop_bottom + 2
         left_col = 1     # Zaman Etüdü
         mid_col = 11     # Westinghouse
         right_col = 21   # MOST
 
-
-        cpm_time = self._build_cpm_rows_linear(steps_df, zaman_map)
-        cpm_most = self._build_cpm_rows_linear(steps_df, most_map)
-
-        if west_map:
-            cpm_west = self._build_cpm_rows_linear(steps_df, west_map)
-        else:
-            cpm_west = []  # Westinghouse verisi yoksa CPM+Gantt çizme
-
         end1 = self._write_cpm_and_gantt_block(
             ws, start_row=top_row, col_start=left_col,
-            title="Zaman Etüdü - CPM + Gantt", cpm_rows=cpm_time
+            title="Zaman Etüdü - CPM + Gantt", cpm_rows=im.cpm["Zaman Etüdü"],
+            donguler=im.donguler
         )
         end2 = self._write_cpm_and_gantt_block(
             ws, start_row=top_row, col_start=mid_col,
-            title="Westinghouse - CPM + Gantt", cpm_rows=cpm_west
+            title="Westinghouse - CPM + Gantt", cpm_rows=im.cpm["Westinghouse"],
+            donguler=im.donguler
         )
         end3 = self._write_cpm_and_gantt_block(
             ws, start_row=top_row, col_start=right_col,
-            title="MOST - CPM + Gantt", cpm_rows=cpm_most
+            title="MOST - CPM + Gantt", cpm_rows=im.cpm["MOST"],
+            donguler=im.donguler
         )
 
         base_row = max(end1, end2, end3) + 25
 
         # -------- Altta MEVCUT ÇIKTILAR (başlıklar aynı) --------
 
-        # SOL: Westinghouse blokları (A..G) – sadece başlangıç satırını aşağı alıyoruz
+        # SOL: Westinghouse blokları (A..G)
         wh_start_row = base_row
-        west_for_job = pd.DataFrame()
-        if not self.west.empty:
-            # Önce AdımID ile eşle (daha güvenli)
-            if "AdımID" in self.west.columns:
-                west_for_job = self.west[self.west["AdımID"].isin(adim_ids)].copy()
-            # Hâlâ boşsa MOST AnalizID kesişimini dene
-            if west_for_job.empty and "AnalizID" in self.west.columns:
-                analiz_ids = ilgili_analizler["AnalizID"].dropna().unique().tolist()
-                west_for_job = self.west[self.west["AnalizID"].isin(analiz_ids)].copy()
-
-        if not west_for_job.empty:
-            for aid, g in west_for_job.groupby("AnalizID", sort=False):
-                # Adım adını bul (önce MOST'tan, yoksa iş adımlarından)
-                step_nm = ""
-                if (merged["AnalizID"] == aid).any():
-                    s = merged.loc[merged["AnalizID"] == aid, "Adım Adı"].dropna()
-                    if not s.empty:
-                        step_nm = s.iloc[0]
-                if not step_nm:
-                    if "AdımID" in g.columns:
-                        gid = g.iloc[0].get("AdımID")
-                        if pd.notna(gid):
-                            s2 = job_df.loc[job_df["AdımID"] == gid, "Adım Adı"]
-                            if not s2.empty:
-                                step_nm = s2.iloc[0]
-                if not step_nm and not job_df.empty:
-                    step_nm = job_df["Adım Adı"].dropna().iloc[0]
-
-                wh_start_row = self._write_west_block(ws, wh_start_row, step_nm, g.iloc[0])
-
-        # SAĞ: MOST tablosu (J..P) – başlıklar aynı, sadece daha aşağıdan başlıyor
-        if not ilgili_analizler.empty:
-            self._write_most_table(ws, start_row=base_row, merged=merged)
+        for blok in im.west_bloklari:
+            wh_start_row = self._write_west_block(ws, wh_start_row, blok)
+
+        # SAĞ: MOST tablosu (J..P)
+        if im.most_gruplari:
+            self._write_most_table(ws, start_row=base_row, gruplar=im.most_gruplari)
 
         # Otomatik genişlik
         self._autosize(ws)
@@ -2051,27 +1299,95 @@ class MostExcelJobReport:
 
     # ------------ Dışa Açık: Raporu Oluştur ------------
 
-    from pathlib import Path
-    from openpyxl import Workbook
+    def _is_tamponlari(self, gorevler, isci_sayisi: int):
+        """(İş Adı, iş adımları, sayfa adı) görevlerini _AkisSayfasi tamponlarına çizer, sırayla üretir."""
+        if isci_sayisi > 1:
+            with ProcessPoolExecutor(max_workers=isci_sayisi, initializer=_isci_baslat, initargs=(self,)) as havuz:
+                yield from havuz.map(_is_sayfasi_ciz, gorevler)
+        else:
+            for job_name, job_df, title in gorevler:
+                wb = _TekSayfaKitabi(title)
+                self._write_sheet_for_job(wb, job_name, job_df)
+                yield wb.sayfa
+
+    def _write_job_sheets_parallel(self, wb: _AkisKitabi, isler, isci_sayisi: int):
+        """İş sayfalarını isci_sayisi süreçte çizer, iş sırasıyla wb'ye akıtır."""
+        # Sayfalar önceden açılır: ad çakışmalarını openpyxl çözer, işçiler kesin adla çizer
+        # (SOP başlığı ve grafik referansları sayfa adını içerir)
+        sayfalar = [wb.bos_sayfa(self._safe_sheet_name(job_name)) for job_name, _ in isler]
+        gorevler = [(job_name, job_df, ws.title) for (job_name, job_df), ws in zip(isler, sayfalar)]
+        for ws, tampon in zip(sayfalar, self._is_tamponlari(gorevler, isci_sayisi)):
+            tampon.akit(ws)
+
+    def _write_job_sheets_incremental(self, wb: _AkisKitabi, isler, parmaklar: Dict[str, str], onceki: dict,
+                                      klasor: str, isci_sayisi: int):
+        """
+        İş sayfalarını iş sırasıyla wb'ye akıtır: parmak izi ve sayfa adı önceki üretimdekiyle aynı
+        olan işlerin tamponları klasor'den okunur, diğerleri çizilip klasor'e yazılır.
+        """
+        eski_isler = onceki.get("isler", {})
+        sayfalar = [wb.bos_sayfa(self._safe_sheet_name(job_name)) for job_name, _ in isler]
+        plan, gorevler = [], []
+        for (job_name, job_df), ws in zip(isler, sayfalar):
+            girdi = eski_isler.get(job_name) or {}
+            yol = os.path.join(klasor, parmaklar[job_name] + ".pkl")
+            # Sayfa adı grafik referanslarında ve SOP başlığında geçer; değiştiyse yeniden çizilir
+            hazir = girdi.get("parmak") == parmaklar[job_name] and girdi.get("sayfa") == ws.title
+            plan.append((job_name, job_df, ws, yol, hazir and os.path.exists(yol)))
+            if not plan[-1][-1]:
+                gorevler.append((job_name, job_df, ws.title))
+
+        # Tamponlar tek tek okunur/çizilir ve hemen akıtılır: bellekte tüm işler birden tutulmaz
+        cizilen = self._is_tamponlari(gorevler, isci_sayisi)
+        for job_name, job_df, ws, yol, hazir in plan:
+            if hazir:
+                tampon = _tampon_oku(yol)
+                if tampon is None:  # bozuk tampon: bu iş burada çizilir
+                    tampon = next(self._is_tamponlari([(job_name, job_df, ws.title)], 1))
+                    _tampon_yaz(yol, tampon)
+            else:
+                tampon = next(cizilen)
+                _tampon_yaz(yol, tampon)
+            tampon.akit(ws)
 
-    def build(self, output_path: str) -> str:
+    def build(self, output_path: str, akis: bool = False, isci_sayisi: int = 1, artimli: bool = False,
+              veri_klasoru: Optional[str] = None) -> str:
         """
         output_path: üretilecek xlsx dosya yolu
+        akis: True ise write-only akış kipi (bkz. _AkisKitabi): sayfalar sırayla diske
+              yazılır, bellek kullanımı iş sayısından bağımsız kalır; çıktı görünümü aynıdır
+        isci_sayisi: 1'den büyükse iş sayfaları bu kadar süreçte paralel çizilir (akış kipini
+              de açar); 0/None: işlemci sayısı. İş sayısından fazla süreç açılmaz.
+        artimli: True ise iş başına parmak izleri ve sayfa tamponları raporun yanına yazılır
+              (bkz. Artımlı Kip); yalnızca değişen işler çizilir, diğerleri saklanan tamponlardan
+              akıtılır. Akış kipini de açar; isci_sayisi değişen işlerin çizimine uygulanır.
+        veri_klasoru: artımlı önbelleğin tutulacağı yerel klasör (varsayılan: uygulama veri klasörü,
+              bkz. data_manager.uygulama_veri_klasoru)
         """
-        # 1) CSV'leri yükle
-        self._load()
-
-        # 2) Eğer sadece belirli JobID'ler seçildiyse, İş tablosunu filtrele
-        if self.selected_job_ids and "JobID" in self.is_adimlari.columns:
-            self.is_adimlari = self.is_adimlari[
-                self.is_adimlari["JobID"].isin(self.selected_job_ids)
-            ]
-
-        wb = Workbook()
-        # Varsayılan boş sayfayı kaldır
-        wb.remove(wb.active)
+        # CSV'leri yükle (seçili JobID'lere göre filtrelenmiş rapor modeli)
+        if self.model is None:
+            self.model = ReportModel(self.paths, selected_job_ids=self.selected_job_ids)
+
+        isler = self.model.isler()
+        isci_sayisi = min(isci_sayisi or os.cpu_count() or 1, len(isler))
+
+        if artimli:
+            if veri_klasoru is None:
+                from data_manager import uygulama_veri_klasoru
+                veri_klasoru = uygulama_veri_klasoru()
+            klasor = _onbellek_klasoru(output_path, veri_klasoru)
+            parmak_path = _parmak_dosyasi(klasor)
+        parmaklar = ({job_name: self.model.is_parmak_izi(job_name, job_df, surum=_PARMAK_SURUMU)
+                      for job_name, job_df in isler} if artimli else {})
+
+        if akis or artimli or isci_sayisi > 1:
+            wb = _AkisKitabi()
+        else:
+            wb = Workbook()
+            # Varsayılan boş sayfayı kaldır
+            wb.remove(wb.active)
 
-        if self.is_adimlari.empty:
+        if self.model.is_adimlari.empty:
             ws = wb.create_sheet("Rapor")
             ws.cell(row=1, column=1, value="Veri bulunamadı.")
         else:
@@ -2080,11 +1396,37 @@ class MostExcelJobReport:
                 self._write_main_sheet(wb)
 
             # Sonra sadece filtrelenmiş İşler için sayfa oluştur
-            for job_name, job_df in self.is_adimlari.groupby("İş Adı"):
-                self._write_sheet_for_job(wb, job_name, job_df)
+            if artimli:
+                os.makedirs(klasor, exist_ok=True)
+                self._write_job_sheets_incremental(wb, isler, parmaklar, _parmak_oku(parmak_path),
+                                                   klasor, isci_sayisi)
+            elif isci_sayisi > 1:
+                self._write_job_sheets_parallel(wb, isler, isci_sayisi)
+            else:
+                for job_name, job_df in isler:
+                    self._write_sheet_for_job(wb, job_name, job_df)
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         wb.save(output_path)
+
+        if artimli:
+            # Ana Sayfa ilk sayfadır, iş sayfaları onu iş sırasıyla izler
+            sayfa_adlari = wb.sheetnames[1:] if isler else []
+            os.makedirs(klasor, exist_ok=True)
+            _parmak_yaz(parmak_path, {
+                "surum": _PARMAK_SURUMU,
+                "isler": {job_name: {"parmak": parmaklar[job_name], "sayfa": sayfa}
+                          for (job_name, _), sayfa in zip(isler, sayfa_adlari)},
+            })
+            # Artık hiçbir işe ait olmayan tamponlar silinir; başka bir üretimin yazmakta
+            # olduğu .tmp dosyalarına ve klasördeki diğer dosyalara dokunulmaz
+            gecerli = {parmak + ".pkl" for parmak in parmaklar.values()}
+            for ad in os.listdir(klasor) if os.path.isdir(klasor) else []:
+                if ad.endswith(".pkl") and ad not in gecerli:
+                    try:
+                        os.remove(os.path.join(klasor, ad))
+                    except OSError:
+                        pass
         return output_path
 
 
@@ -2094,13 +1436,17 @@ class MostExcelJobReport:
 def create_most_report_job_based(
     output_path: str,
     paths: Dict[str, str],
-    selected_job_ids=None
+    selected_job_ids=None,
+    akis: bool = False,
+    isci_sayisi: int = 1,
+    artimli: bool = False,
+    veri_klasoru: Optional[str] = None
 ) -> str:
     """
-    Uygulama içinden tek satırla çağır:
+    Uygulama içinden tek satırla çağır (csv/json/parquet çıktıları için bkz. rapor_modeli.raporu_disa_aktar):
         create_most_report_job_based("cikti/Most_Rapor_IsBazli.xlsx", {
             "is_adimlari": ".../Is_Adimlari.csv",
-            "zaman_etudu": ".../Zaman_Etudu.csv",
+            "zaman_etudu": ".../Zaman_Etudu",  # aylık bölüm klasörü (veya tek CSV)
             "basic_analiz": ".../Basic_Most_Analizleri.csv",
             "basic_detay":  ".../Basic_Most_Detaylari.csv",
             "maxi_analiz":  ".../Maxi_Most_Analizleri.csv",
@@ -2109,7 +1455,17 @@ def create_most_report_job_based(
             "mini_detay":   ".../Mini_Most_Detaylari.csv",
             "westinghouse": ".../Westinghouse_Analizleri.csv",
         }, selected_job_ids=[1, 3])
+    akis=True: büyük raporlar için write-only akış kipi (bkz. MostExcelJobReport.build)
+    isci_sayisi>1: iş sayfaları süreç havuzunda paralel çizilir (0/None: işlemci sayısı)
+    artimli=True: yalnızca verisi değişen işlerin sayfaları yeniden çizilir, diğerleri saklanan
+                  sayfa tamponlarından akıtılır (parmak izleri ve tamponlar veri_klasoru'nde,
+                  varsayılan olarak uygulama veri klasöründe tutulur; bkz. Artımlı Kip)
     """
     reporter = MostExcelJobReport(paths, selected_job_ids=selected_job_ids)
-    return reporter.build(output_path)
+    return reporter.build(output_path, akis=akis, isci_sayisi=isci_sayisi, artimli=artimli,
+                          veri_klasoru=veri_klasoru)
+
 
+# İsteğe bağlı süre ölçümü (bkz. izleme): raporun aşamaları
+izleme.sinifi_olc(MostExcelJobReport, ['_write_main_sheet', '_write_sheet_for_job', '_autosize', 'build'])
+izleme.sinifi_olc(_AkisSayfasi, ['akit'])
@@ -6,6 +6,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal, QLocale
 from PyQt5.QtGui import QDoubleValidator
 
+from data_manager import STEP_UPDATED, STEP_DELETED, JOB_DELETED
+
 class ASelectionScreen(QWidget):
     """A parametresi seçimi için widget (Eski Asecim.py'den uyarlandı)."""
     def __init__(self, parent=None):
@@ -1153,6 +1155,7 @@ class MaxiMostModule(QWidget):
         self.current_step_id = None
         self.initUI()
         self.set_enabled_state(False)
+        self.data_manager.subscribe(self.on_data_changed, [STEP_UPDATED, STEP_DELETED, JOB_DELETED])
 
     def initUI(self):
         main_layout = QVBoxLayout(self)
@@ -1182,6 +1185,14 @@ class MaxiMostModule(QWidget):
     def set_enabled_state(self, enabled):
         self.tabs.setEnabled(enabled)
 
+    def on_data_changed(self, olay):
+        """Seçili adım yeniden adlandırıldıysa etiketi, silindiyse formu güncelle."""
+        if olay.tur == STEP_UPDATED and olay.step_id == self.current_step_id:
+            self.load_step_data(self.current_job_id, self.current_step_id)
+        elif ((olay.tur == STEP_DELETED and olay.step_id == self.current_step_id)
+              or (olay.tur == JOB_DELETED and olay.job_id == self.current_job_id)):
+            self.load_step_data(None, None)
+
     def load_step_data(self, job_id, step_id):
         self.current_job_id = job_id
         self.current_step_id = step_id
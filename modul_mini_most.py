@@ -5,6 +5,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 
+from data_manager import STEP_UPDATED, STEP_DELETED, JOB_DELETED
+
 # =============================================================================
 # === BİLEŞEN WIDGET'LARI (Seçim Ekranları) ====================================
 # =============================================================================
@@ -523,6 +525,7 @@ class MiniMostModule(QWidget):
         super().__init__(parent); self.data_manager = data_manager
         self.current_job_id = None; self.current_step_id = None
         self.initUI(); self.set_enabled_state(False)
+        self.data_manager.subscribe(self.on_data_changed, [STEP_UPDATED, STEP_DELETED, JOB_DELETED])
     def initUI(self):
         L = QVBoxLayout(self)
         H = QHBoxLayout(); btn = QPushButton("← Analiz Menüsüne Dön"); btn.clicked.connect(self.back_button_pressed.emit)
@@ -533,6 +536,13 @@ class MiniMostModule(QWidget):
         self.tabs.addTab(GeneralMoveTab(self.data_manager), "Genel Hareket")
         self.tabs.addTab(ControlledMoveTab(self.data_manager), "Kontrollü Hareket")
     def set_enabled_state(self, enabled): self.tabs.setEnabled(enabled)
+    def on_data_changed(self, olay):
+        # Seçili adım yeniden adlandırıldıysa etiketi, silindiyse formu güncelle
+        if olay.tur == STEP_UPDATED and olay.step_id == self.current_step_id:
+            self.load_step_data(self.current_job_id, self.current_step_id)
+        elif ((olay.tur == STEP_DELETED and olay.step_id == self.current_step_id)
+              or (olay.tur == JOB_DELETED and olay.job_id == self.current_job_id)):
+            self.load_step_data(None, None)
     def load_step_data(self, job_id, step_id):
         self.current_job_id = job_id; self.current_step_id = step_id
         for i in range(self.tabs.count()):
@@ -5,9 +5,15 @@ from PyQt5.QtWidgets import (QWidget, QLabel, QPushButton, QComboBox, QFileDialo
                              QStyle, QGridLayout, QHeaderView)
 from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-import cv2
 import pandas as pd
 
+import izleme
+from data_manager import MEASUREMENT_ADDED, STEP_UPDATED
+
+# OpenCV ilk video açılırken yüklenir (açılış süresini uzatmasın); cv2 kullanan diğer metotlar
+# ancak bir video açıldıktan sonra çalışır (bkz. VideoPlayerPanel.open_video_file)
+cv2 = None
+
 # Sabit değerler
 VALUE_TYPE_LABELS = {'': '—', 'VA': 'Katma değerli iş', 'NVAN': 'Katma değersiz ama gerekli', 'NVA': 'Katma değersiz iş'}
 VALUE_TYPE_ORDER = ['', 'VA', 'NVAN', 'NVA']
@@ -51,24 +57,15 @@ class StepEditorDialog(QDialog):
 
         all_steps_with_jobs = self.data_manager.get_all_steps_with_job_info()
 
-        df_all = self.data_manager._read_csv(self.data_manager.is_adimlari_path, self.data_manager.IS_ADIMLARI_COLUMNS, dtypes=self.data_manager.IS_ADIMLARI_DTYPES)
-        reverse_dependencies = {}
-        for _, row in df_all.iterrows():
-            if pd.isna(row.get("AdımID")): continue
-            oncul_str = str(row.get("Öncül Adım", "")).strip()
-            if not oncul_str: continue
-            try:
-                preds = [int(float(p.strip())) for p in oncul_str.split(",") if p.strip()]
-                step_id_val = int(row["AdımID"])
-                for p in preds:
-                    reverse_dependencies.setdefault(p, set()).add(step_id_val)
-            except (ValueError, TypeError): pass
+        # Düzenlenen adımın doğrudan ardılları öncül olarak seçilemez (döngü oluşur)
+        successors = set()
+        if step_data:
+            current_id = int(float(step_data.get('AdımID')))
+            successors = set(self.data_manager.get_successors(current_id))
 
         for adim_id, step_info in all_steps_with_jobs.items():
             if step_data and str(step_data.get('AdımID')) == str(adim_id): continue
-            if step_data:
-                current_id = int(float(step_data.get('AdımID')))
-                if adim_id in reverse_dependencies.get(current_id, set()): continue
+            if adim_id in successors: continue
             display_text = f"[{step_info['job_name']}] - {step_info['step_name']}"
             item = QListWidgetItem(display_text)
             item.setData(Qt.UserRole, adim_id)
@@ -98,6 +95,8 @@ class JobManagementPanel(QWidget):
         self.data_manager = data_manager
         self.initUI()
         self.refresh_job_list()
+        # Ölçüm kaydı veya adım düzenlemesinde tüm tabloyu değil, sadece etkilenen satırları güncelle
+        self.data_manager.subscribe(self.on_data_changed, [MEASUREMENT_ADDED, STEP_UPDATED])
 
     def initUI(self):
         layout = QVBoxLayout(self)
@@ -222,41 +221,26 @@ class JobManagementPanel(QWidget):
         self.steps_table.setRowCount(0)
 
         if current_job_id and current_job_id != "new":
-            all_steps_map = self.data_manager.get_all_steps_map()
-            steps = self.data_manager.get_steps_for_job(current_job_id)
-            for i, (adim_id, adim_adi) in enumerate(steps.items()):
+            # Tüm satırlar tek sorguda: ad, istasyon, ortalama süre, öncül adları, değer türü
+            step_view = self.data_manager.get_step_view(current_job_id)
+            for i, step in enumerate(step_view.to_dict('records')):
                 self.steps_table.insertRow(i)
-                avg_time = self.data_manager.get_ortalama_adim_zamani(current_job_id, adim_id)
-                step_details = self.data_manager.get_step_details(adim_id) or {}
-
-                predecessor_ids_str = str(step_details.get('Öncül Adım', '') or '').strip()
-                predecessor_names = []
-                if predecessor_ids_str:
-                    tokens = predecessor_ids_str.replace(';', ',').split(',')
-                    valid_ids = []
-                    for tok in tokens:
-                        tok = tok.strip()
-                        if not tok: continue
-                        try:
-                            pid = int(float(tok))
-                            valid_ids.append(pid)
-                        except (ValueError, TypeError): continue
-                    predecessor_names = [all_steps_map.get(pid, f"ID:{pid}") for pid in valid_ids]
-                predecessors_display = ", ".join(predecessor_names)
+                adim_id = int(step['AdımID'])
+                avg_time = step['Ortalama Süre']
+                workstation = step['İş İstasyonu']
 
                 self.steps_table.setItem(i, 0, QTableWidgetItem(str(adim_id)))
-                self.steps_table.setItem(i, 1, QTableWidgetItem(adim_adi))
-                self.steps_table.setItem(i, 2, QTableWidgetItem(str(step_details.get('İş İstasyonu', ''))))
+                self.steps_table.setItem(i, 1, QTableWidgetItem(str(step['Adım Adı'])))
+                self.steps_table.setItem(i, 2, QTableWidgetItem('' if pd.isna(workstation) else str(workstation)))
                 self.steps_table.setItem(i, 3, QTableWidgetItem(f"{avg_time:.2f}" if avg_time else "N/A"))
-                self.steps_table.setItem(i, 4, QTableWidgetItem(predecessors_display))
+                self.steps_table.setItem(i, 4, QTableWidgetItem(step['Öncül Adları']))
 
                 combo = QComboBox(self.steps_table)
                 for key in VALUE_TYPE_ORDER: combo.addItem(VALUE_TYPE_LABELS[key], key)
-                current_key = str(step_details.get('DegerTuru', ''))
+                current_key = str(step['DegerTuru'])
                 idx = combo.findData(current_key if current_key in VALUE_TYPE_LABELS else '')
                 combo.setCurrentIndex(idx if idx >= 0 else 0)
-                step_id_int = int(adim_id)
-                combo.currentIndexChanged.connect(lambda _, sid=step_id_int, c=combo: self.data_manager.set_step_value_type(sid, c.currentData()))
+                combo.currentIndexChanged.connect(lambda _, sid=adim_id, c=combo: self.data_manager.set_step_value_type(sid, c.currentData()))
                 self.steps_table.setCellWidget(i, 5, combo)
 
         # Hafızadaki adımı yeniden seç
@@ -319,9 +303,9 @@ class JobManagementPanel(QWidget):
             data = dialog.get_data()
             if not data['name'].strip(): QMessageBox.warning(self, "Geçersiz Ad", "Adım adı boş olamaz."); return
             if edit_mode:
-                self.data_manager.update_job_step(step_data_to_edit['AdımID'], data['name'], data['predecessors'], data['workstation'])
                 self.current_step_id = step_data_to_edit['AdımID'] # Seçimi hafızaya al
-                self.refresh_steps_table() # Tabloyu yenile (kendisi doğru adımı seçecek)
+                # Satırlar STEP_UPDATED bildirimiyle güncellenir (bkz. on_data_changed)
+                self.data_manager.update_job_step(step_data_to_edit['AdımID'], data['name'], data['predecessors'], data['workstation'])
             else:
                 new_id = self.data_manager.create_job_step(current_job_id, data['name'], data['predecessors'], data['workstation'])
                 self.current_step_id = new_id # Yeni oluşturulan adımı hafızaya al
@@ -365,6 +349,36 @@ class JobManagementPanel(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"İş silinirken bir hata oluştu: {e}")
 
+    def on_data_changed(self, olay):
+        """DataManager değişiklik bildirimi; sadece seçili işin etkilenen satırları güncellenir."""
+        if olay.job_id is None or olay.job_id != self.job_combo.currentData():
+            return
+        if olay.tur == MEASUREMENT_ADDED:
+            avg_time = self.data_manager.get_ortalama_adim_zamani(olay.job_id, olay.step_id)
+            row = self._row_of_step(olay.step_id)
+            if row is not None:
+                self.steps_table.item(row, 3).setText(f"{avg_time:.2f}" if avg_time else "N/A")
+        elif olay.tur == STEP_UPDATED:
+            # Adın kendisi ve onu öncül olarak gösteren satırların "Öncül Adları"
+            affected = {olay.step_id, *self.data_manager.get_successors(olay.step_id)}
+            step_view = self.data_manager.get_step_view(olay.job_id).set_index('AdımID')
+            for adim_id in affected:
+                row = self._row_of_step(adim_id)
+                if row is None or adim_id not in step_view.index:
+                    continue
+                step = step_view.loc[adim_id]
+                workstation = step['İş İstasyonu']
+                self.steps_table.item(row, 1).setText(str(step['Adım Adı']))
+                self.steps_table.item(row, 2).setText('' if pd.isna(workstation) else str(workstation))
+                self.steps_table.item(row, 4).setText(step['Öncül Adları'])
+
+    def _row_of_step(self, step_id):
+        for i in range(self.steps_table.rowCount()):
+            item = self.steps_table.item(i, 0)
+            if item and item.text() == str(step_id):
+                return i
+        return None
+
     def update_view(self, new_job_id, new_step_id):
         """Ana pencereden gelen bilgiyle tüm görünümü günceller."""
         # 1. Hafızadaki ID'leri güncelle
@@ -448,8 +462,11 @@ class VideoPlayerPanel(QWidget):
         self.current_step_id = step_id
 
     def open_video_file(self):
+        global cv2
         filepath, _ = QFileDialog.getOpenFileName(self, "Video Seç", "", "Video Dosyaları (*.mp4 *.avi *.mov)")
         if not filepath: return
+        if cv2 is None:
+            import cv2
         if self.capture: self.capture.release()
         self.capture = cv2.VideoCapture(filepath)
         if not self.capture.isOpened():
@@ -531,4 +548,8 @@ class VideoPlayerPanel(QWidget):
                     self.data_manager.kaydet_zaman_olcumu(self.current_job_id, self.current_step_id, duration)
                     self.measurement_saved.emit()
             self.measurement_start_frame = -1
-            self.measure_button.setText("Ölçümü Başlat"); self.measure_button.setStyleSheet("")
\ No newline at end of file
+            self.measure_button.setText("Ölçümü Başlat"); self.measure_button.setStyleSheet("")
+
+
+# İsteğe bağlı süre ölçümü (bkz. izleme): oynatma döngüsünün kare başına maliyeti
+izleme.sinifi_olc(VideoPlayerPanel, ['next_frame'])
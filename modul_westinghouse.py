@@ -4,6 +4,8 @@ from PyQt5.QtWidgets import (QWidget, QLabel, QPushButton, QComboBox,
                              QTabWidget, QGridLayout, QGroupBox, QLineEdit, QSpinBox)
 from PyQt5.QtCore import Qt, pyqtSignal
 
+from data_manager import MEASUREMENT_ADDED, STEP_UPDATED, STEP_DELETED, JOB_DELETED
+
 class WestinghouseModule(QWidget):
     """Westinghouse Analiz Modülü."""
     back_button_pressed = pyqtSignal()
@@ -16,6 +18,8 @@ class WestinghouseModule(QWidget):
         self.initUI()
         self.setup_tolerance_mapping()
         self.set_enabled_state(False)
+        self.data_manager.subscribe(self.on_data_changed,
+                                    [MEASUREMENT_ADDED, STEP_UPDATED, STEP_DELETED, JOB_DELETED])
 
     def initUI(self):
         main_layout = QVBoxLayout(self)
@@ -219,6 +223,22 @@ class WestinghouseModule(QWidget):
             QMessageBox.critical(self, "Kritik Hata", f"Veri yüklenirken beklenmedik bir hata oluştu:\n{e}")
             self.set_enabled_state(False)
 
+    def on_data_changed(self, olay):
+        """Seçili adıma yeni ölçüm gelirse süre etiketlerini, ad değişirse başlığı günceller; form korunur."""
+        if olay.tur == MEASUREMENT_ADDED:
+            if (olay.job_id, olay.step_id) != (self.current_job_id, self.current_step_id):
+                return
+            avg_time = self.data_manager.get_ortalama_adim_zamani(self.current_job_id, self.current_step_id)
+            self.ortalama_zaman_label.setText(f"Ortalama Süre (Videodan): {avg_time:.4f} sn")
+            self.set_enabled_state(avg_time > 0)
+            self._guncelle_sonuclari()
+        elif olay.tur == STEP_UPDATED and olay.step_id == self.current_step_id:
+            info = self.data_manager.get_step_infos([olay.step_id]).iloc[0]
+            self.job_info_label.setText(f"Seçili İş: {info['İş Adı']}  |  Seçili Adım: {info['Adım Adı']}")
+        elif ((olay.tur == STEP_DELETED and olay.step_id == self.current_step_id)
+              or (olay.tur == JOB_DELETED and olay.job_id == self.current_job_id)):
+            self.load_step_data(None, None)
+
     def setup_tolerance_mapping(self):
         self.TOLERANCE_MAP = {
             "Fiziksel Çaba": {"Çok hafif (0-1kg)": ("Fiziksel_Caba_Cok_Hafif", 0), "Hafif (1-5kg)": ("Fiziksel_Caba_Hafif", 3), "Orta (5-15kg)": ("Fiziksel_Caba_Orta", 6), "Ağır (15-25kg)": ("Fiziksel_Caba_Agir", 9), "Çok ağır (>25kg)": ("Fiziksel_Caba_Cok_Agir", 12)},
@@ -0,0 +1,861 @@
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import izleme
+from cpm_motoru import CpmGrafigi
+from zaman_bolumleri import bolumleri_oku
+
+
+# İş bazlı raporun veri modeli. CSV'ler bir kez okunur; Ana Sayfa satırları ve her işin
+# SOP / CPM / MOST / Westinghouse verileri buradan hesaplanır. Çıktılar (bkz. CIKTI_BICIMLERI)
+# yalnızca bu modeli okur: modul_excel_raporu biçimli xlsx üretir, csv/json/parquet ise
+# aynı sayıları openpyxl'e hiç dokunmadan düz tablolar olarak yazar.
+
+
+# ------------------------- Yardımcı Fonksiyonlar -------------------------
+
+def _read_csv_safe(path: str, job_ids=None) -> pd.DataFrame:
+    """CSV'yi okur; path bir klasörse (Zaman_Etudu bölümleri) yalnızca job_ids'i içeren bölümler okunur."""
+    try:
+        if os.path.isdir(path):
+            return bolumleri_oku(path, job_ids)
+        return pd.read_csv(path)
+    except Exception:
+        return pd.DataFrame()
+
+def _ensure_cols(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    for c in cols:
+        if c not in df.columns:
+            df[c] = pd.NA
+    return df
+
+def _is_genel_tekrar(param_code) -> bool:
+    if pd.isna(param_code):
+        return False
+    x = str(param_code).strip().lower().replace(" ", "")
+    return x.startswith("geneltekrar")
+
+def _extract_indis(param_code) -> str:
+    """ParametreKodu başı: harf(ler) + bitişik rakam(lar) (örn. A, A1, B)."""
+    if pd.isna(param_code):
+        return ""
+    s = str(param_code).strip()
+    m = re.match(r'^([A-Za-zÇĞİÖŞÜçğıöşü]+[0-9]*)', s)
+    return m.group(1) if m else ""
+def _split_model_and_sekans(model_tipi: str) -> Tuple[str, str]:
+    """'AAA-BBB' -> ('AAA','BBB'); '-' yoksa sekans boş kalır."""
+    if pd.isna(model_tipi):
+        return "", ""
+    s = str(model_tipi)
+    if "-" in s:
+        left, right = s.split("-", 1)
+        return left.strip(), right.strip()
+    return s.strip(), ""
+
+def _pick_label(row: pd.Series, choices):
+    """choices = [(kolon_adı, görünen_etiket), ...] -> ilk TRUE olanı döndür."""
+    for col, lbl in choices:
+        try:
+            v = row.get(col, 0)
+        except Exception:
+            v = 0
+        if pd.notna(v) and str(v).strip() not in ["0", "0.0", "", "False", "NaN"]:
+            return lbl
+    return "-"
+
+def _multi_labels(row: pd.Series, choices):
+    labels = []
+    for col, lbl in choices:
+        v = row.get(col, 0)
+        if pd.notna(v) and str(v).strip() not in ["0", "0.0", "", "False", "NaN"]:
+            labels.append(lbl)
+    return labels if labels else ["-"]
+
+
+# ------------------------- Sınıflandırma -------------------------
+
+def sop_sinifi(deger) -> str:
+    """SOP bantlarında DegerTuru -> VA / NVAN / NVA ("" : sınıfsız)."""
+    if not isinstance(deger, str):
+        return ""
+    d = deger.strip().upper()
+    if d in ("KD", "VA"):
+        return "VA"
+    if d in ("ZGK", "NVAN", "NVAA", "NV-AN"):
+        return "NVAN"
+    if d in ("KDZ", "NVA"):
+        return "NVA"
+    return ""
+
+def ana_sayfa_sinifi(deger_turu) -> Optional[str]:
+    """Ana Sayfa toplamlarında DegerTuru -> VA / NVAN / NVA (None: sınıfsız)."""
+    dt = str(deger_turu or "").strip().upper()
+    if dt in ("KD", "VA"):
+        return "VA"
+    if dt in ("ZGK", "KDG", "NVAN"):
+        return "NVAN"
+    if dt in ("KDZ", "KDS", "NVA"):
+        return "NVA"
+    return None
+
+def gantt_parcalari(sure: float, deger_turu: str) -> Tuple[float, float, float]:
+    """Gantt çubuğunun (VA, NVAN, NVA) parçaları; sınıfsız adımın süresi NVA sayılır."""
+    va_val = sure if deger_turu in ("VA", "KD") else 0
+    nvan_val = sure if deger_turu in ("NVAN", "ZGK", "NVAA") else 0
+    nva_val = sure if deger_turu in ("NVA", "KDZ", "KDS") else 0
+    if va_val == 0 and nvan_val == 0 and nva_val == 0:
+        nva_val = sure
+    return va_val, nvan_val, nva_val
+
+
+# ------------------------- CPM -------------------------
+
+def cpm_satirlari(steps_df: pd.DataFrame, durations_map: Dict,
+                  grafik: Optional[CpmGrafigi] = None) -> List[Dict]:
+    """
+    CPM tablosunu hesaplar (bkz. cpm_motoru) ve 'DegerTuru' bilgisini de içerir.
+    grafik verilmezse steps_df'ten kurulur; aynı işin kaynakları için bir kez kurup geçirin.
+    Öncül döngüsündeki (veya ardındaki) adımların ES/EF/LS/LF/Bolluk değerleri None'dır.
+    Sonuçları Erken Başlama (ES) süresine göre sıralar (Gantt şelalesi için);
+    planlanamayan adımlar sonda yer alır.
+    """
+    steps = steps_df.dropna(subset=["AdımID"]).copy()
+    if steps.empty:
+        return []
+
+    steps["AdımID"] = steps["AdımID"].astype(int)
+    if grafik is None:
+        grafik = CpmGrafigi(steps["AdımID"].tolist(), steps["Öncül Adım"].tolist())
+
+    ids = grafik.ids.tolist()
+    sonuc = grafik.hesapla([float(durations_map.get(aid, 0.0) or 0.0) for aid in ids])
+    konum = {aid: i for i, aid in enumerate(ids)}
+
+    def _deger(dizi, i):
+        return None if np.isnan(dizi[i]) else float(dizi[i])
+
+    rows: List[Dict] = []
+    for aid, adim_adi, deger_turu in zip(steps["AdımID"].tolist(), steps["Adım Adı"].tolist(),
+                                         steps["DegerTuru"].tolist()):
+        i = konum[aid]
+        sure = float(sonuc.sure[i])
+        deger_turu = str(deger_turu).strip().upper()
+        va, nvan, nva = gantt_parcalari(sure, deger_turu)
+
+        rows.append({
+            "AdımID": aid,
+            "Adım Adı": adim_adi or "",
+            "Öncül": ",".join(str(p) for p in grafik.onculler(i)),
+            "Süre": sure,
+            "ES": _deger(sonuc.es, i),
+            "EF": _deger(sonuc.ef, i),
+            "LS": _deger(sonuc.ls, i),
+            "LF": _deger(sonuc.lf, i),
+            "Bolluk": _deger(sonuc.bolluk, i),
+            "Kritik": bool(sonuc.kritik[i]),
+            "DegerTuru": deger_turu,
+            "VA": va,
+            "NVAN": nvan,
+            "NVA": nva,
+        })
+
+    # Listeyi Erken Başlama (ES) zamanına göre sırala -> Gantt'ta şelale görünümü için
+    rows.sort(key=lambda x: (x["ES"] is None, x["ES"] or 0.0, x["AdımID"]))
+
+    return rows
+
+
+# ------------------------- Model -------------------------
+
+class IsModeli:
+    """
+    Bir işin rapor verisi (Excel'de bir iş sayfası):
+        sop:  {kaynak: [{"No", "AdımID", "Adım Adı", "Öncül Adım", "VA", "NVAN", "NVA"}, ...]};
+              kaynak süresi yoksa None (bant boş kalır)
+        cpm:  {kaynak: cpm_satirlari(...)}; Westinghouse süresi yoksa boş liste
+        donguler: öncül döngüleri (her biri AdımID listesi; bkz. CpmGrafigi.donguler)
+        most_gruplari: AnalizID başına MOST tablosu satırları (MOST_HEADERS sırasıyla)
+        west_bloklari: AnalizID başına Westinghouse bloğu (adım adı ve faktör etiketleri)
+    """
+
+    KAYNAKLAR = ("Zaman Etüdü", "Westinghouse", "MOST")
+
+    def __init__(self, ad: str, job_id, adim_sayisi: int, sop: Dict, cpm: Dict,
+                 most_gruplari: List[List[List]], west_bloklari: List[Dict],
+                 donguler: Optional[List[List[int]]] = None):
+        self.ad = ad
+        self.job_id = job_id
+        self.adim_sayisi = adim_sayisi
+        self.sop = sop
+        self.cpm = cpm
+        self.most_gruplari = most_gruplari
+        self.west_bloklari = west_bloklari
+        self.donguler = donguler or []
+
+
+class ReportModel:
+    """
+    paths:
+        {
+          "is_adimlari": ".../Is_Adimlari.csv",
+          "zaman_etudu": ".../Zaman_Etudu",  # aylık bölüm klasörü (veya tek CSV)
+          "basic_analiz": ".../Basic_Most_Analizleri.csv",
+          "basic_detay":  ".../Basic_Most_Detaylari.csv",
+          "maxi_analiz":  ".../Maxi_Most_Analizleri.csv",
+          "maxi_detay":   ".../Maxi_Most_Detaylari.csv",
+          "mini_analiz":  ".../Mini_Most_Analizleri.csv",
+          "mini_detay":   ".../Mini_Most_Detaylari.csv",
+          "westinghouse": ".../Westinghouse_Analizleri.csv",
+        }
+    Tablolar kurulurken okunur; iş verileri (is_modeli) istendiğinde hesaplanır, böylece
+    paralel Excel kipinde her iş kendi işçi sürecinde hesaplanıp çizilir.
+    """
+
+    # MOST başlıkları
+    MOST_HEADERS = ["Adım Adı", "Model", "Sekans", "Genel Tekrar İndis",
+                    "İndis", "İndis Tekrarı", "Açıklama"]
+
+    # Ana Sayfa başlıkları
+    ANA_HEADERS = ["İstasyon", "Operasyon Adı", "VA (sn)", "NVAN (sn)", "NVA (sn)",
+                   "Ortalama Süre (sn)", "Analiz Zamanı"]
+
+    # Westinghouse sabit satır sıraları
+    WH_PF_NAMES = ["Yetenek", "Çaba", "Çalışma Koşulları", "Tutarlılık"]
+    WH_ZF_NAMES = ["Kişisel Gereksinimler", "Fiziksel Çaba", "Düşünsel Çaba",
+                   "Çalışma Pozisyonu", "Atmosfer", "Isı", "Gürültü"]
+
+    def __init__(self, paths: Dict[str, str], selected_job_ids=None):
+        self.paths = paths
+        self.selected_job_ids = [int(j) for j in selected_job_ids] if selected_job_ids else []
+
+        # Veri setleri
+        self.is_adimlari = pd.DataFrame()
+        self.analiz_all = pd.DataFrame(columns=["AnalizID", "AdımID", "ModelTipi"])
+        self.detay_all  = pd.DataFrame(columns=["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"])
+        self.west       = pd.DataFrame()
+
+        self._load()
+
+        # Eğer sadece belirli JobID'ler seçildiyse, İş tablosunu filtrele
+        if self.selected_job_ids and "JobID" in self.is_adimlari.columns:
+            self.is_adimlari = self.is_adimlari[
+                self.is_adimlari["JobID"].isin(self.selected_job_ids)
+            ]
+
+    # ------------ Yardımcı: WH kolonlarını normalize et ------------
+    def _normalize_west_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df is None or df.empty:
+            return df
+
+        # Beklediğimiz ana kolonlar
+        required = ["AnalizID", "JobID", "AdımID", "NormalZaman", "StandartZaman"]
+        for col in required:
+            if col not in df.columns:
+                df[col] = pd.NA
+
+        # AnalizID / AdımID sayısal olsun
+        for col in ["AnalizID", "AdımID"]:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+
+        # Zaman kolonlarını float'a çevir
+        for col in ["NormalZaman", "StandartZaman"]:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+
+        return df
+
+    # ------------ Veri Yükleme ------------
+
+    def _load(self):
+        dfs = {k: _read_csv_safe(v, self.selected_job_ids or None) for k, v in self.paths.items()}
+
+        # İş tablosu
+        # DataManager'ın oluşturduğu kolonlarla hizalıyoruz:
+        # ['JobID', 'AdımID', 'İş Adı', 'Adım Adı', 'Öncül Adım', 'DegerTuru', 'İş İstasyonu']
+        self.is_adimlari = _ensure_cols(
+            dfs.get("is_adimlari", pd.DataFrame()),
+            ["JobID", "İş Adı", "AdımID", "Adım Adı", "Öncül Adım", "DegerTuru", "İş İstasyonu"]
+        )
+
+        # Zaman etüdü (opsiyonel) – Timestamp'i de alalım, Ana Sayfa'da kullanacağız
+        self.zaman_etudu = _ensure_cols(
+            dfs.get("zaman_etudu", pd.DataFrame()),
+            ["JobID", "AdımID", "Sure", "Timestamp"]
+        )
+
+        # Analizler (Basic/Maxi/Mini birleştirme) – ToplamSaniye'yi de alıyoruz
+        analiz_frames = []
+        for k in ["basic_analiz", "maxi_analiz", "mini_analiz"]:
+            df = dfs.get(k, pd.DataFrame()).copy()
+            if df.empty:
+                continue
+            df = _ensure_cols(df, ["AnalizID", "AdımID", "ModelTipi", "ToplamSaniye"])
+            if df["ModelTipi"].isna().all():
+                fallback = {"basic_analiz": "BasicMOST",
+                            "maxi_analiz": "MaxiMOST",
+                            "mini_analiz": "MiniMOST"}[k]
+                df["ModelTipi"] = fallback
+            analiz_frames.append(df[["AnalizID", "AdımID", "ModelTipi", "ToplamSaniye"]])
+
+        self.analiz_all = (pd.concat(analiz_frames, ignore_index=True)
+                           if analiz_frames else
+                           pd.DataFrame(columns=["AnalizID", "AdımID", "ModelTipi", "ToplamSaniye"]))
+
+        # Detaylar (Basic/Maxi/Mini birleştirme)
+        detay_frames = []
+        for k in ["basic_detay", "maxi_detay", "mini_detay"]:
+            df = dfs.get(k, pd.DataFrame()).copy()
+            if df.empty:
+                continue
+            df = _ensure_cols(df, ["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"])
+            detay_frames.append(df[["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"]])
+
+        self.detay_all = (pd.concat(detay_frames, ignore_index=True)
+                          if detay_frames else
+                          pd.DataFrame(columns=["AnalizID", "ParametreKodu", "SecilenDeger", "TekrarSayisi"]))
+
+        # Westinghouse
+        self.west = dfs.get("westinghouse", pd.DataFrame()).copy()
+        if not self.west.empty:
+            self.west = self._normalize_west_columns(self.west)
+            # AnalizID/AdımID sayısal — güvenli eşleşme
+            for col in ["AnalizID", "AdımID"]:
+                if col in self.west.columns:
+                    self.west[col] = pd.to_numeric(self.west[col], errors="coerce")
+
+        self._dilimleri_hazirla()
+
+    def _dilimleri_hazirla(self):
+        """
+        İş verilerinin kullandığı süre haritaları ve satır dilimleri bir kez hesaplanır;
+        her iş için tabloları baştan filtrelemek yerine sözlüklerden okunur.
+        Satır dilimleri (konum listeleri) tablodaki özgün sırayı korur.
+        """
+        # Zaman Etüdü: JobID -> {AdımID: ortalama Sure}, JobID -> satır konumları
+        self._zaman_ort: Dict = {}
+        self._zaman_ort_tum = None
+        self._zaman_is_satirlari: Dict = {}
+        if not self.zaman_etudu.empty:
+            for (jid, aid), sure in self.zaman_etudu.groupby(["JobID", "AdımID"])["Sure"].mean().to_dict().items():
+                self._zaman_ort.setdefault(jid, {})[aid] = sure
+            self._zaman_is_satirlari = self.zaman_etudu.groupby("JobID").indices
+
+        # MOST: AdımID -> en son analizin (en büyük AnalizID) ToplamSaniye'si
+        df_most = self.analiz_all.dropna(subset=["ToplamSaniye"])
+        if "AnalizID" in df_most.columns:
+            df_most = df_most.sort_values(["AdımID", "AnalizID"])
+        else:
+            df_most = df_most.sort_values(["AdımID"])
+        self._most_son = (
+            df_most.groupby("AdımID").tail(1)
+            .set_index("AdımID")["ToplamSaniye"]
+            .astype(float)
+            .to_dict()
+        )
+        self._analiz_satirlari = self.analiz_all.groupby("AdımID").indices
+        self._detay_satirlari = self.detay_all.groupby("AnalizID").indices
+
+        # Westinghouse: AdımID -> en son analizin StandartZaman'ı, AdımID/JobID -> satır konumları
+        self._west_son: Dict = {}
+        self._west_satirlari: Dict = {}
+        self._west_is_satirlari: Dict = {}
+        if not self.west.empty:
+            if "StandartZaman" in self.west.columns:
+                son = self.west.sort_values(["AdımID", "AnalizID"]).groupby("AdımID").tail(1)
+                self._west_son = son.set_index("AdımID")["StandartZaman"].dropna().astype(float).to_dict()
+            if "AdımID" in self.west.columns:
+                self._west_satirlari = self.west.groupby("AdımID").indices
+            if "JobID" in self.west.columns:
+                self._west_is_satirlari = self.west.groupby("JobID").indices
+
+    @staticmethod
+    def _dilim(df: pd.DataFrame, satirlar: Dict, anahtarlar) -> pd.DataFrame:
+        """anahtarlar'a düşen satırlar, tablodaki sırasıyla (df[df[kolon].isin(anahtarlar)] ile aynı)."""
+        konumlar = [satirlar[k] for k in dict.fromkeys(anahtarlar) if k in satirlar]
+        if not konumlar:
+            return df.iloc[0:0]
+        return df.iloc[np.sort(np.concatenate(konumlar))]
+
+    def _zaman_haritasi(self, job_id) -> Dict:
+        """AdımID -> ortalama Sure (job_id None ise tüm ölçümler)."""
+        if self.zaman_etudu.empty:
+            return {}
+        if job_id is None:
+            if self._zaman_ort_tum is None:
+                self._zaman_ort_tum = self.zaman_etudu.groupby("AdımID")["Sure"].mean().to_dict()
+            return dict(self._zaman_ort_tum)
+        return dict(self._zaman_ort.get(job_id, {}))
+
+    @staticmethod
+    def _is_job_id(job_df: pd.DataFrame):
+        """İşin JobID'si (ilk dolu değer); yoksa None."""
+        if "JobID" in job_df.columns:
+            s = job_df["JobID"].dropna()
+            if not s.empty:
+                return s.iloc[0]
+        return None
+
+    def _ilgili_detaylar(self, ilgili_analizler: pd.DataFrame) -> pd.DataFrame:
+        """ilgili_analizler ile birleştirilecek MOST detay satırları."""
+        analiz_anahtarlari = ilgili_analizler["AnalizID"]
+        if analiz_anahtarlari.isna().any():
+            return self.detay_all  # merge boş AnalizID'leri de eşleştirir; dilim bunları içermez
+        return self._dilim(self.detay_all, self._detay_satirlari, analiz_anahtarlari.unique())
+
+    def _west_for_job(self, adim_ids, ilgili_analizler: pd.DataFrame) -> pd.DataFrame:
+        """İşin Westinghouse satırları: önce AdımID ile (daha güvenli), yoksa MOST AnalizID kesişimiyle."""
+        west_for_job = pd.DataFrame()
+        if not self.west.empty:
+            if "AdımID" in self.west.columns:
+                west_for_job = self._dilim(self.west, self._west_satirlari, adim_ids)
+            if west_for_job.empty and "AnalizID" in self.west.columns:
+                analiz_ids = ilgili_analizler["AnalizID"].dropna().unique().tolist()
+                west_for_job = self.west[self.west["AnalizID"].isin(analiz_ids)].copy()
+        return west_for_job
+
+    # ------------ İşler ------------
+
+    def isler(self) -> List[Tuple[str, pd.DataFrame]]:
+        """(İş Adı, iş adımları) çiftleri, İş Adı sırasıyla."""
+        return [] if self.is_adimlari.empty else list(self.is_adimlari.groupby("İş Adı"))
+
+    def is_parmak_izi(self, job_name: str, job_df: pd.DataFrame, surum=0) -> str:
+        """
+        İşin parmak izi: is_modeli'nin o iş için okuduğu satırların özeti. surum, çıktının
+        kendi sürümüdür (çizim değişince eski parmak izleri geçersiz olsun diye).
+        """
+        ozet = hashlib.sha1(f"{surum}\x1e{job_name}".encode("utf-8"))
+        _tablo_ozeti(ozet, job_df)
+
+        adim_ids = job_df["AdımID"].dropna().unique().tolist()
+        if adim_ids:
+            ilgili_analizler = self._dilim(self.analiz_all, self._analiz_satirlari, adim_ids)
+            _tablo_ozeti(ozet, ilgili_analizler)
+            _tablo_ozeti(ozet, self._ilgili_detaylar(ilgili_analizler))
+
+            job_id = self._is_job_id(job_df)
+            if self.zaman_etudu.empty or job_id is None:
+                _tablo_ozeti(ozet, self.zaman_etudu)
+            else:
+                _tablo_ozeti(ozet, self._dilim(self.zaman_etudu, self._zaman_is_satirlari, [job_id]))
+
+            _tablo_ozeti(ozet, self._west_for_job(adim_ids, ilgili_analizler))
+            # MOST haritasının boş olup olmaması süre geri dönüşlerini belirler (bkz. _sure_haritalari)
+            ozet.update(b"\x1e1" if self._most_son else b"\x1e0")
+        return ozet.hexdigest()
+
+    def _sure_haritalari(self, job_df: pd.DataFrame, steps_df: pd.DataFrame):
+        """(zaman_map, west_map, most_map): kaynak başına AdımID -> süre, geri dönüşleriyle."""
+        # Zaman Etüdü süreleri (bu işin ölçümleri; JobID yoksa tüm ölçümler)
+        zaman_map: Dict = self._zaman_haritasi(self._is_job_id(job_df))
+
+        # MOST süreleri (ToplamSaniye): AdımID başına en son analiz. Tüm işlerin haritası
+        # paylaşılır (salt okunur); boş olup olmaması aşağıdaki geri dönüşleri belirler.
+        most_map = self._most_son
+
+        # Westinghouse haritası – ÖNCE StandartZaman, yoksa Zaman Etüdü / MOST
+        west_map: Dict[int, float] = {}
+        if not self.west.empty and "StandartZaman" in self.west.columns:
+            # Bu işe ait adımlar; her adım için en son yapılan analiz
+            adim_ids = steps_df["AdımID"].dropna().astype(int).unique().tolist()
+            west_map = {aid: self._west_son[aid] for aid in adim_ids if aid in self._west_son}
+
+        if not west_map:
+            if zaman_map:
+                west_map = zaman_map
+            elif most_map:
+                west_map = most_map
+
+        # Zaman Etüdü haritası boşsa, en azından MOST'tan doldur
+        if not zaman_map and most_map:
+            zaman_map = most_map
+
+        # Hâlâ boşsa, tüm adımlar için 0 ver (grafikler bozulmasın)
+        if not zaman_map:
+            zaman_map = {aid: 0.0 for aid in steps_df["AdımID"]}
+
+        # MOST boşsa, Zaman Etüdü'ne yaslansın
+        if not most_map:
+            most_map = zaman_map
+
+        return zaman_map, west_map, most_map
+
+    @staticmethod
+    def _sop_satirlari(job_df: pd.DataFrame, sure_map: Dict) -> List[Dict]:
+        """SOP tablosu satırları: adımlar AdımID sırasıyla, süre DegerTuru sütununa dağıtılır."""
+        steps = job_df.dropna(subset=["AdımID"]).copy()
+        steps["AdımID"] = steps["AdımID"].astype(int)
+        steps = steps.sort_values("AdımID")
+
+        satirlar = []
+        for no, (_, r) in enumerate(steps.iterrows(), start=1):
+            adim_id = int(r["AdımID"])
+            cat = sop_sinifi(r.get("DegerTuru"))
+            sure = float(sure_map.get(adim_id, 0.0) or 0.0)
+            satirlar.append({
+                "No": no,
+                "AdımID": adim_id,
+                "Adım Adı": r.get("Adım Adı"),
+                "Öncül Adım": r.get("Öncül Adım"),
+                "VA": round(sure if cat == "VA" else 0.0, 4),
+                "NVAN": round(sure if cat == "NVAN" else 0.0, 4),
+                "NVA": round(sure if cat == "NVA" else 0.0, 4),
+            })
+        return satirlar
+
+    def _most_gruplari(self, merged: pd.DataFrame) -> List[List[List]]:
+        """AnalizID başına MOST tablosu satırları (MOST_HEADERS sırasıyla)."""
+        # Genel tekrar haritası
+        genel_tekrar_map = (
+            merged[merged["ParametreKodu"].apply(_is_genel_tekrar)]
+            .groupby("AnalizID")["TekrarSayisi"]
+            .max()
+            .to_dict()
+        )
+
+        gruplar: List[List[List]] = []
+        for analiz_id, grp in merged.groupby("AnalizID", sort=False):
+            grp_eff = grp[~grp["ParametreKodu"].apply(_is_genel_tekrar)].copy()
+
+            genel_tekrar = int(genel_tekrar_map.get(analiz_id, 1))
+            first = grp_eff.iloc[0] if not grp_eff.empty else grp.iloc[0]
+            step_name = first.get("Adım Adı", "") or ""
+            model_left, sekans = _split_model_and_sekans(first.get("ModelTipi", "") or "")
+
+            if grp_eff.empty:
+                gruplar.append([[step_name, model_left, sekans, genel_tekrar, "", "", ""]])
+            else:
+                gruplar.append([
+                    [step_name, model_left, sekans, genel_tekrar,
+                     _extract_indis(r.get("ParametreKodu", "")), r.get("TekrarSayisi", ""), r.get("SecilenDeger", "")]
+                    for _, r in grp_eff.iterrows()
+                ])
+        return gruplar
+
+    @classmethod
+    def _west_blogu(cls, step_name: str, wh_row: pd.Series) -> Dict:
+        """Bir Westinghouse analizinin faktör etiketleri."""
+        pf = [(nm, str(wh_row.get(nm, "-")) if pd.notna(wh_row.get(nm, None)) else "-")
+              for nm in cls.WH_PF_NAMES]
+
+        zf_map = {
+            "Kişisel Gereksinimler": str(wh_row.get("Kisisel_Gereksinimler", "-")) if pd.notna(wh_row.get("Kisisel_Gereksinimler", None)) else "-",
+            "Fiziksel Çaba": _pick_label(wh_row, [
+                ("Fiziksel_Caba_Cok_Hafif", "Çok Hafif"),
+                ("Fiziksel_Caba_Hafif", "Hafif"),
+                ("Fiziksel_Caba_Orta", "Orta"),
+                ("Fiziksel_Caba_Agir", "Ağır"),
+                ("Fiziksel_Caba_Cok_Agir", "Çok Ağır"),
+            ]),
+            "Düşünsel Çaba": _pick_label(wh_row, [
+                ("Dusunsel_Caba_Plan_Normal", "Plan/Normal"),
+                ("Dusunsel_Caba_Karisik_Normal", "Karışık/Normal"),
+                ("Dusunsel_Caba_Plan_Yogun", "Plan/Yoğun"),
+                ("Dusunsel_Caba_Karisik_Yogun", "Karışık/Yoğun"),
+            ]),
+            "Çalışma Pozisyonu": _pick_label(wh_row, [
+                ("Poz_Serbest", "Serbest"),
+                ("Poz_Sabit_Durus", "Sabit Duruş"),
+                ("Poz_Sabit_Ayakta", "Sabit Ayakta"),
+                ("Poz_Cokme_Egilme", "Çökme/Eğilme"),
+                ("Poz_Uzanma_ve_Omuz", "Uzanma/Omuz"),
+            ]),
+            "Atmosfer": _pick_label(wh_row, [
+                ("Atmosfer_Temiz", "Temiz"),
+                ("Atmosfer_Kotu_Koku", "Kötü Koku"),
+                ("Atmosfer_Zararlı_Toz_Gaz", "Zararlı Toz/Gaz"),
+            ]),
+            "Isı": _pick_label(wh_row, [
+                ("Isı_Soguk", "Soğuk"),
+                ("Isı_Normal", "Normal"),
+                ("Isı_Sicak", "Sıcak"),
+            ]),
+            "Gürültü": _pick_label(wh_row, [
+                ("Gurultu_Normal_Is", "Normal (İş)"),
+                ("Gurultu_Normal_Makine", "Normal (Makine)"),
+                ("Gurultu_Yuksek_Sabit", "Yüksek (Sabit)"),
+                ("Gurultu_Yuksek_Frekans", "Yüksek (Frekans)"),
+            ]),
+        }
+
+        return {
+            "Adım Adı": step_name,
+            "Performans Faktörleri": pf,
+            "Zorluk Faktörleri": [(nm, zf_map.get(nm, "-")) for nm in cls.WH_ZF_NAMES],
+            "Genel Koşullar": _multi_labels(wh_row, [
+                ("Genel_Kirli", "Kirli"),
+                ("Genel_Islak_Doseme", "Islak Döşeme"),
+                ("Genel_Titresim", "Titreşim"),
+                ("Genel_Monotonluk", "Monotonluk"),
+                ("Genel_Dusunsel_Yorgunluk", "Düşünsel Yorgunluk"),
+            ]),
+            "Koruyucu Ekipmanlar": _multi_labels(wh_row, [
+                ("Koruyucu_Elbise_Takım", "Takım"),
+                ("Koruyucu_Elbise_Eldiven", "Eldiven"),
+                ("Koruyucu_Elbise_Agır_ve_Ozel_Yelek", "Ağır/Özel Yelek"),
+                ("Koruyucu_Elbise_Maske", "Maske"),
+            ]),
+        }
+
+    def is_modeli(self, job_name: str, job_df: pd.DataFrame) -> IsModeli:
+        """Bir işin SOP / CPM / MOST / Westinghouse verisi (bkz. IsModeli)."""
+        job_id = self._is_job_id(job_df)
+
+        # Bu işe ait adımlar
+        adim_ids = job_df["AdımID"].dropna().unique().tolist()
+        if not adim_ids:
+            return IsModeli(job_name, job_id, 0, {k: None for k in IsModeli.KAYNAKLAR},
+                            {k: [] for k in IsModeli.KAYNAKLAR}, [], [])
+
+        # Adım listesi (CPM için) – Öncül Adım ve DegerTuru kolonlarını al
+        steps_df = (
+            job_df[["AdımID", "Adım Adı", "Öncül Adım", "DegerTuru"]]
+            .dropna(subset=["AdımID"])
+            .drop_duplicates()
+        )
+
+        # Bu işe ait MOST analizleri ve detayları
+        ilgili_analizler = self._dilim(self.analiz_all, self._analiz_satirlari, adim_ids)
+        merged = self._ilgili_detaylar(ilgili_analizler).merge(ilgili_analizler, on="AnalizID", how="right")
+        merged = merged.merge(job_df[["AdımID", "Adım Adı"]].drop_duplicates(),
+                              on="AdımID", how="left")
+
+        zaman_map, west_map, most_map = self._sure_haritalari(job_df, steps_df)
+
+        # SOP: Westinghouse / MOST bantları yalnızca süre haritası doluysa doldurulur
+        sop = {
+            "Zaman Etüdü": self._sop_satirlari(job_df, zaman_map),
+            "Westinghouse": self._sop_satirlari(job_df, west_map) if west_map else None,
+            "MOST": self._sop_satirlari(job_df, most_map) if most_map else None,
+        }
+        # Öncül grafiği kaynaktan bağımsızdır: bir kez kurulur, üç süre kümesiyle hesaplanır
+        adimlar = steps_df.dropna(subset=["AdımID"])
+        grafik = CpmGrafigi(adimlar["AdımID"].astype(int).tolist(), adimlar["Öncül Adım"].tolist())
+        cpm = {
+            "Zaman Etüdü": cpm_satirlari(steps_df, zaman_map, grafik),
+            "Westinghouse": cpm_satirlari(steps_df, west_map, grafik) if west_map else [],
+            "MOST": cpm_satirlari(steps_df, most_map, grafik),
+        }
+
+        most_gruplari = self._most_gruplari(merged) if not ilgili_analizler.empty else []
+
+        west_bloklari = []
+        west_for_job = self._west_for_job(adim_ids, ilgili_analizler)
+        if not west_for_job.empty:
+            # Adım adı sözlükleri: AnalizID -> MOST'taki ilk dolu ad, AdımID -> iş adımlarındaki ilk ad
+            most_adlari = (merged.dropna(subset=["Adım Adı"]).drop_duplicates("AnalizID")
+                           .set_index("AnalizID")["Adım Adı"].to_dict())
+            adim_adlari = job_df.drop_duplicates("AdımID").set_index("AdımID")["Adım Adı"].to_dict()
+
+            for aid, g in west_for_job.groupby("AnalizID", sort=False):
+                # Adım adını bul (önce MOST'tan, yoksa iş adımlarından)
+                step_nm = most_adlari.get(aid, "")
+                if not step_nm:
+                    if "AdımID" in g.columns:
+                        gid = g.iloc[0].get("AdımID")
+                        if pd.notna(gid) and gid in adim_adlari:
+                            step_nm = adim_adlari[gid]
+                if not step_nm and not job_df.empty:
+                    step_nm = job_df["Adım Adı"].dropna().iloc[0]
+
+                west_bloklari.append(self._west_blogu(step_nm, g.iloc[0]))
+
+        return IsModeli(job_name, job_id, len(steps_df), sop, cpm, most_gruplari, west_bloklari,
+                        grafik.donguler)
+
+    def ana_satirlar(self) -> List[Dict]:
+        """Ana Sayfa: adımı olan her iş için bir satır (ANA_HEADERS)."""
+        # Zaman etüdü: JobID–AdımID bazında ortalama süre
+        step_avg = pd.DataFrame(columns=["JobID", "AdımID", "Sure"])
+        if not self.zaman_etudu.empty:
+            step_avg = (
+                self.zaman_etudu.groupby(["JobID", "AdımID"])["Sure"]
+                .mean()
+                .reset_index()
+            )
+
+        satirlar = []
+        for job_name, job_df in self.isler():
+            # JobID
+            job_id = self._is_job_id(job_df)
+            if job_id is not None:
+                job_id = int(job_id)
+
+            # Bu işe ait adımlar
+            steps = job_df.dropna(subset=["AdımID"]).copy()
+            if steps.empty:
+                continue
+
+            # İstasyon = en sık geçen İş İstasyonu
+            istasyon = ""
+            if "İş İstasyonu" in steps.columns:
+                ist_ser = steps["İş İstasyonu"].dropna()
+                if not ist_ser.empty:
+                    istasyon = ist_ser.value_counts().idxmax()
+
+            # Adım ortalamalarını bu iş ile birleştir (merge sonucu yeni sıra numarası alır;
+            # süreler konumla aktarılır)
+            sureler = np.zeros(len(steps))
+            if job_id is not None and not step_avg.empty:
+                m = steps.merge(step_avg, on=["JobID", "AdımID"], how="left", suffixes=("_adim", ""))
+                sureler = m["Sure"].fillna(0.0).to_numpy(dtype=float)
+            elif not step_avg.empty:
+                # JobID kullanılamıyorsa sadece AdımID üzerinden dener
+                m = steps.merge(step_avg[["AdımID", "Sure"]], on="AdımID", how="left", suffixes=("_adim", ""))
+                sureler = m["Sure"].fillna(0.0).to_numpy(dtype=float)
+
+            # VA / NVAN / NVA toplamları
+            toplamlar = {"VA": 0.0, "NVAN": 0.0, "NVA": 0.0}
+            for sure, deger_turu in zip(sureler, steps["DegerTuru"]):
+                cat = ana_sayfa_sinifi(deger_turu)
+                if cat:
+                    toplamlar[cat] += float(sure or 0.0)
+            va, nv_an, nva = toplamlar["VA"], toplamlar["NVAN"], toplamlar["NVA"]
+            toplam = va + nv_an + nva
+
+            # Analiz Zamanı: Zaman Etüdü veya Westinghouse içindeki en güncel Timestamp
+            analiz_zamani = ""
+            timestamps = []
+
+            if job_id is not None and not self.zaman_etudu.empty:
+                ts = self._dilim(self.zaman_etudu, self._zaman_is_satirlari, [job_id])["Timestamp"].dropna()
+                timestamps.extend(ts.tolist())
+
+            if job_id is not None and not self.west.empty and "Timestamp" in self.west.columns:
+                ts = self._dilim(self.west, self._west_is_satirlari, [job_id])["Timestamp"].dropna()
+                timestamps.extend(ts.tolist())
+
+            if timestamps:
+                # ISO tarih formatı olduğu için string max en yeni zamana denk gelir
+                analiz_zamani = max(timestamps)
+
+            satirlar.append(dict(zip(self.ANA_HEADERS, [
+                istasyon,
+                job_name,
+                round(va, 4) if va else 0,
+                round(nv_an, 4) if nv_an else 0,
+                round(nva, 4) if nva else 0,
+                round(toplam, 4) if toplam else 0,
+                analiz_zamani,
+            ])))
+        return satirlar
+
+    # ------------ Düz Tablolar ------------
+
+    def tablolar(self) -> Dict[str, pd.DataFrame]:
+        """
+        Raporun sayıları düz tablolar olarak (csv/json/parquet çıktıları için):
+            ana_sayfa, sop, cpm (her satırda İş Adı ve Kaynak), cpm_donguler, most, westinghouse
+        """
+        sop, cpm, donguler, most, west = [], [], [], [], []
+        for job_name, job_df in self.isler():
+            im = self.is_modeli(job_name, job_df)
+            for kaynak in IsModeli.KAYNAKLAR:
+                for satir in im.sop[kaynak] or []:
+                    sop.append({"İş Adı": job_name, "Kaynak": kaynak, **satir})
+                for satir in im.cpm[kaynak]:
+                    cpm.append({"İş Adı": job_name, "Kaynak": kaynak, **satir})
+            for dongu_no, dongu in enumerate(im.donguler, start=1):
+                for aid in dongu:
+                    donguler.append({"İş Adı": job_name, "Döngü": dongu_no, "AdımID": aid})
+            for grup_no, grup in enumerate(im.most_gruplari, start=1):
+                for satir in grup:
+                    most.append({"İş Adı": job_name, "Grup": grup_no, **dict(zip(self.MOST_HEADERS, satir))})
+            for blok in im.west_bloklari:
+                for bolum in ("Performans Faktörleri", "Zorluk Faktörleri"):
+                    for faktor, deger in blok[bolum]:
+                        west.append({"İş Adı": job_name, "Adım Adı": blok["Adım Adı"],
+                                     "Bölüm": bolum, "Faktör": faktor, "Değer": deger})
+                for bolum in ("Genel Koşullar", "Koruyucu Ekipmanlar"):
+                    for deger in blok[bolum]:
+                        west.append({"İş Adı": job_name, "Adım Adı": blok["Adım Adı"],
+                                     "Bölüm": bolum, "Faktör": "", "Değer": deger})
+
+        return {
+            "ana_sayfa": pd.DataFrame(self.ana_satirlar(), columns=self.ANA_HEADERS),
+            "sop": pd.DataFrame(sop, columns=["İş Adı", "Kaynak", "No", "AdımID", "Adım Adı", "Öncül Adım",
+                                              "VA", "NVAN", "NVA"]),
+            "cpm": pd.DataFrame(cpm, columns=["İş Adı", "Kaynak", "AdımID", "Adım Adı", "Öncül", "Süre",
+                                              "ES", "EF", "LS", "LF", "Bolluk", "Kritik", "DegerTuru",
+                                              "VA", "NVAN", "NVA"]),
+            "cpm_donguler": pd.DataFrame(donguler, columns=["İş Adı", "Döngü", "AdımID"]),
+            "most": pd.DataFrame(most, columns=["İş Adı", "Grup"] + self.MOST_HEADERS),
+            "westinghouse": pd.DataFrame(west, columns=["İş Adı", "Adım Adı", "Bölüm", "Faktör", "Değer"]),
+        }
+
+
+def _tablo_ozeti(ozet, df: pd.DataFrame):
+    """df'in kolon adlarını ve satırlarını (sırasıyla; sıra çıktıyı etkiler) özete ekler."""
+    ozet.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    ozet.update(b"\x1e%d\x1e" % len(df))
+    if len(df):
+        ozet.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+
+
+# ------------------------- Çıktılar -------------------------
+
+def _xlsx_yaz(model: ReportModel, output_path: str, **secenekler) -> str:
+    # openpyxl yalnızca xlsx istendiğinde yüklenir
+    from modul_excel_raporu import MostExcelJobReport
+    return MostExcelJobReport(model.paths, model.selected_job_ids, model=model).build(output_path, **secenekler)
+
+def _klasore_yaz(model: ReportModel, output_path: str, uzanti: str, yaz) -> str:
+    os.makedirs(output_path, exist_ok=True)
+    for ad, df in model.tablolar().items():
+        yaz(df, os.path.join(output_path, f"{ad}.{uzanti}"))
+    return output_path
+
+def _csv_yaz(model: ReportModel, output_path: str) -> str:
+    """output_path klasörüne tablo başına bir CSV."""
+    return _klasore_yaz(model, output_path, "csv", lambda df, path: df.to_csv(path, index=False))
+
+def _parquet_yaz(model: ReportModel, output_path: str) -> str:
+    """output_path klasörüne tablo başına bir Parquet dosyası (pyarrow veya fastparquet gerekir)."""
+    return _klasore_yaz(model, output_path, "parquet", lambda df, path: df.to_parquet(path, index=False))
+
+def _json_yaz(model: ReportModel, output_path: str) -> str:
+    """Tek JSON dosyası: {tablo_adı: [satır, ...]}."""
+    parent = os.path.dirname(output_path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for i, (ad, df) in enumerate(model.tablolar().items()):
+            f.write(("," if i else "") + f"\n{json.dumps(ad)}: ")
+            f.write(df.to_json(orient="records", force_ascii=False))
+        f.write("\n}\n")
+    return output_path
+
+
+# bicim -> yazıcı(model, output_path, **secenekler); xlsx seçenekleri için bkz. MostExcelJobReport.build
+CIKTI_BICIMLERI = {
+    "xlsx": _xlsx_yaz,
+    "csv": _csv_yaz,
+    "json": _json_yaz,
+    "parquet": _parquet_yaz,
+}
+
+
+def raporu_disa_aktar(output_path: str, paths: Dict[str, str], selected_job_ids=None,
+                      bicim: str = "csv", **secenekler) -> str:
+    """
+    Raporu bicim'de yazar (bkz. CIKTI_BICIMLERI):
+        xlsx            -> biçimli Excel raporu (create_most_report_job_based ile aynı)
+        csv / parquet   -> output_path klasörüne tablo başına bir dosya (bkz. ReportModel.tablolar)
+        json            -> output_path dosyasına tüm tablolar
+    """
+    if bicim not in CIKTI_BICIMLERI:
+        raise ValueError(f"Bilinmeyen rapor biçimi: {bicim} ({', '.join(CIKTI_BICIMLERI)})")
+    model = ReportModel(paths, selected_job_ids=selected_job_ids)
+    return CIKTI_BICIMLERI[bicim](model, output_path, **secenekler)
+
+
+# İsteğe bağlı süre ölçümü (bkz. izleme): modelin aşamaları
+izleme.sinifi_olc(ReportModel, ['_load', 'is_modeli', 'ana_satirlar', 'is_parmak_izi', 'tablolar'])
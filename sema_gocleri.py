@@ -0,0 +1,146 @@
+import csv
+import json
+import os
+from collections import namedtuple
+from contextlib import ExitStack
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from islem_gunlugu import _yerine_koy, kuyrugu_onar
+
+
+# Tabloların şema sürümleri veri klasöründe tutulur: {"tablolar": {"Westinghouse_Analizleri": 1, ...}}.
+# Açılışta yalnızca bu dosya okunur; bütün tablolar güncelse hiçbir CSV açılmaz.
+SEMA_DOSYASI = 'Sema.json'
+
+# Göçler dosyayı bu kadar satırlık parçalar halinde okuyup yazar (büyük tablolar belleğe alınmaz)
+PARCA_SATIRI = 50000
+
+# tablo: tablo adı (CSV adı, uzantısız); surum: göçten sonraki şema sürümü (tablo içinde 1'den artan)
+# donustur(df) -> df: tek bir parçayı dönüştürür. Değerler metin olarak gelir (boş hücreler ''),
+#   böylece dokunulmayan kolonlar dosyaya aynen geri yazılır. Yarıda kalan bir göç açılışta
+#   tekrarlanabileceğinden zaten dönüştürülmüş parçayı değiştirmemelidir.
+# gerekli(kolonlar) -> bool: başlığa bakarak dosyanın yeniden yazılması gerekip gerekmediği
+#   (False ise sürüm dosya açılmadan kaydedilir; None: her zaman yazılır)
+Goc = namedtuple('Goc', ['tablo', 'surum', 'aciklama', 'donustur', 'gerekli'])
+
+
+def _westinghouse_zaman_kolonlari(df: pd.DataFrame) -> pd.DataFrame:
+    if "Tutarlılık" in df.columns:
+        base_index = df.columns.get_loc("Tutarlılık") + 1
+    else:
+        base_index = min(3, len(df.columns))
+
+    if "NormalZaman" not in df.columns:
+        df.insert(base_index, "NormalZaman", '')
+        base_index += 1
+
+    if "StandartZaman" not in df.columns:
+        df.insert(base_index, "StandartZaman", '')
+    return df
+
+
+GOCLER = [
+    Goc('Westinghouse_Analizleri', 1, "NormalZaman ve StandartZaman kolonları eklendi",
+        _westinghouse_zaman_kolonlari,
+        lambda kolonlar: not {'NormalZaman', 'StandartZaman'} <= set(kolonlar)),
+]
+
+
+def son_surum(tablo: str) -> int:
+    """Tablonun güncel şema sürümü (göçü olmayan tablolar için 0)."""
+    return max((goc.surum for goc in GOCLER if goc.tablo == tablo), default=0)
+
+
+def surumleri_oku(klasor: str) -> Dict[str, int]:
+    try:
+        with open(os.path.join(klasor, SEMA_DOSYASI), 'r', encoding='utf-8') as f:
+            return {k: int(v) for k, v in json.load(f).get('tablolar', {}).items()}
+    except (OSError, ValueError, AttributeError, TypeError):
+        return {}
+
+
+def _surumleri_yaz(klasor: str, surumler: Dict[str, int]):
+    path = os.path.join(klasor, SEMA_DOSYASI)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'tablolar': dict(sorted(surumler.items()))}, f, ensure_ascii=False, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    _yerine_koy(tmp_path, path)
+
+
+def _baslik(path: str) -> List[str]:
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader([f.readline()]), [])
+
+
+def dosyayi_donustur(path: str, gocler: List[Goc], parca_satiri: int = PARCA_SATIRI):
+    """Dosyayı parça parça okuyup göçleri sırayla uygular; geçici dosya + fsync + rename ile yerine koyar."""
+    kuyrugu_onar(path)  # yarım kalmış son satır yeniden yazılıp tam satır gibi görünmesin
+    tmp_path = f"{path}.{os.getpid()}.goc.tmp"
+    try:
+        parcalar = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig',
+                               chunksize=parca_satiri)
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            for i, parca in enumerate(parcalar):
+                for goc in gocler:
+                    parca = goc.donustur(parca)
+                parca.to_csv(f, header=(i == 0), index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        _yerine_koy(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def gocleri_uygula(klasor: str, tablolar: Dict[str, List[str]], kilit: Callable) -> List[tuple]:
+    """
+    Kayıtlı sürümü geride kalan tablolara bekleyen göçleri uygular; dosyası yeniden yazılan
+    tablolar için [(tablo, yeni_sürüm)] döndürür.
+    tablolar: {tablo_adı: [csv_yolları]} (bölümlü tablolar için birden çok dosya).
+    kilit(yol): tablo dosyasının süreçler arası yazma kilidi (bkz. DataManager._tablo_kilidi).
+    Aynı anda açılan süreçlerden yalnızca biri dosyaları dönüştürür; diğeri kilidi alınca
+    güncel sürümü görür. Sürüm, dosyalar yerine konduktan sonra kaydedilir.
+    """
+    surumler = surumleri_oku(klasor)
+    geride = [t for t in tablolar if surumler.get(t, -1) < son_surum(t)]
+    if not geride:
+        return []
+
+    sema_path = os.path.join(klasor, SEMA_DOSYASI)
+    uygulanan = []
+    for tablo in geride:
+        if not any(g.tablo == tablo for g in GOCLER):
+            continue  # göçü yok: yalnızca sürümü kaydedilir
+        paths = [p for p in tablolar[tablo] if os.path.exists(p)]
+        yazilan = 0
+        with ExitStack() as stack:
+            for path in sorted(paths):
+                stack.enter_context(kilit(path))
+            mevcut = surumleri_oku(klasor).get(tablo, 0)
+            gocler = sorted((g for g in GOCLER if g.tablo == tablo and g.surum > mevcut), key=lambda g: g.surum)
+            for path in paths:
+                if not gocler or os.path.getsize(path) == 0:
+                    continue
+                if all(g.gerekli is not None and not g.gerekli(_baslik(path)) for g in gocler):
+                    continue
+                dosyayi_donustur(path, gocler)
+                yazilan += 1
+            with kilit(sema_path):
+                _surum_kaydet(klasor, [tablo])
+        if yazilan:
+            uygulanan.append((tablo, son_surum(tablo)))
+
+    with kilit(sema_path):
+        _surum_kaydet(klasor, geride)
+    return uygulanan
+
+
+def _surum_kaydet(klasor: str, tablolar: List[str]):
+    surumler = surumleri_oku(klasor)
+    for tablo in tablolar:
+        surumler[tablo] = max(surumler.get(tablo, 0), son_surum(tablo))
+    _surumleri_yaz(klasor, surumler)
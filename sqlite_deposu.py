@@ -0,0 +1,190 @@
+import os
+import sqlite3
+import threading
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+# Sayısal kolonların SQLite tipleri; listede olmayan kolonlar tip belirtilmeden
+# (değer nasıl geldiyse öyle) saklanır.
+INTEGER_COLUMNS = {'JobID', 'AdımID', 'AnalizID', 'OlcuID', 'DetayID', 'TekrarSayisi'}
+REAL_COLUMNS = {'Sure', 'ToplamTMU', 'ToplamSaniye', 'NormalZaman', 'StandartZaman'}
+
+# Bu kolonlara sahip her tabloya indeks açılır
+INDEXED_COLUMNS = ['JobID', 'AdımID', 'AnalizID']
+
+
+def _q(name: str) -> str:
+    """Türkçe karakter/boşluk içeren tablo ve kolon adlarını tırnaklar."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SqliteDeposu:
+    """
+    DataManager'ın dokuz tablosunu tek bir yerel SQLite dosyasında tutar.
+    Tablo adları CSV dosya adlarıyla aynıdır (uzantısız), kolonlar birebir korunur.
+    """
+
+    def __init__(self, db_path: str, tablo_kolonlari: Dict[str, List[str]]):
+        self.db_path = db_path
+        self.tablo_kolonlari = tablo_kolonlari
+        self.yeni_olusturuldu = not os.path.exists(db_path) or os.path.getsize(db_path) == 0
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._lock = threading.RLock()
+        # Kendi yazmalarımız data_version'ı değiştirmez; tablo başına ayrıca sayılır
+        self._yerel_surum = {name: 0 for name in tablo_kolonlari}
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock:
+            for name, columns in self.tablo_kolonlari.items():
+                col_defs = []
+                for c in columns:
+                    if c in INTEGER_COLUMNS:
+                        col_defs.append(f'{_q(c)} INTEGER')
+                    elif c in REAL_COLUMNS:
+                        col_defs.append(f'{_q(c)} REAL')
+                    else:
+                        col_defs.append(_q(c))
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS {_q(name)} ({", ".join(col_defs)})')
+                for c in INDEXED_COLUMNS:
+                    if c in columns:
+                        self.conn.execute(
+                            f'CREATE INDEX IF NOT EXISTS {_q("ix_" + name + "_" + c)} ON {_q(name)} ({_q(c)})')
+
+    # ------------ Okuma ------------
+
+    def signature(self, name: str):
+        """Önbellek imzası: başka bağlantılar commit ettikçe data_version, biz yazdıkça yerel sürüm değişir."""
+        with self._lock:
+            data_version = self.conn.execute('PRAGMA data_version').fetchone()[0]
+        return (data_version, self._yerel_surum.get(name, 0))
+
+    def read_table(self, name: str) -> pd.DataFrame:
+        columns = self.tablo_kolonlari[name]
+        with self._lock:
+            df = pd.read_sql_query(f'SELECT * FROM {_q(name)} ORDER BY rowid', self.conn)
+        # NULL'lar CSV'den okunmuş gibi NaN olsun
+        df = df.replace({None: np.nan})
+        for c in columns:
+            if c not in df.columns:
+                df[c] = pd.NA
+        return df[columns + [c for c in df.columns if c not in columns]]
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def scalar(self, sql: str, params=()):
+        with self._lock:
+            row = self.conn.execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    # ------------ Yazma ------------
+
+    @staticmethod
+    def _records(df: pd.DataFrame, columns: List[str]):
+        df = df.reindex(columns=columns)
+        df = df.astype(object)
+        df = df.where(df.notna(), None)
+        return [tuple(r) for r in df.itertuples(index=False, name=None)]
+
+    def _insert_sql(self, name: str, columns: List[str]) -> str:
+        return (f'INSERT INTO {_q(name)} ({", ".join(_q(c) for c in columns)}) '
+                f'VALUES ({", ".join("?" for _ in columns)})')
+
+    def _ensure_columns(self, name: str, columns: List[str]):
+        """Tabloda olmayan kolonları ekler (CSV'de sonradan eklenmiş kolonlar için)."""
+        existing = {r[1] for r in self.conn.execute(f'PRAGMA table_info({_q(name)})')}
+        for c in columns:
+            if c not in existing:
+                self.conn.execute(f'ALTER TABLE {_q(name)} ADD COLUMN {_q(c)}')
+
+    def replace_table(self, name: str, df: pd.DataFrame):
+        columns = list(df.columns)
+        with self._lock:
+            self._ensure_columns(name, columns)
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                self.conn.execute(f'DELETE FROM {_q(name)}')
+                self.conn.executemany(self._insert_sql(name, columns), self._records(df, columns))
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+            self._yerel_surum[name] = self._yerel_surum.get(name, 0) + 1
+
+    @staticmethod
+    def _deger(v):
+        """numpy skalerlerini sqlite3'ün kabul ettiği Python tiplerine, NaN/NA'yı NULL'a çevirir."""
+        if isinstance(v, np.generic):
+            v = v.item()
+        try:
+            return None if pd.isna(v) else v
+        except (TypeError, ValueError):
+            return v
+
+    def apply_ops(self, ops: List[dict]):
+        """
+        DataManager'ın mantıksal işlemlerini (bkz. islem_gunlugu.islemi_uygula) tek bir
+        veritabanı işleminde uygular; hata olursa hiçbiri uygulanmaz.
+        """
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                for op in ops:
+                    name = op['table']
+                    if op['op'] == 'append':
+                        columns = self.tablo_kolonlari[name]
+                        self.conn.executemany(self._insert_sql(name, columns),
+                                              self._records(pd.DataFrame(op['rows']), columns))
+                    elif op['op'] == 'update':
+                        col, value = op['where']
+                        sets = list(op['set'].items())
+                        self.conn.execute(
+                            f'UPDATE {_q(name)} SET {", ".join(f"{_q(c)} = ?" for c, _ in sets)} WHERE {_q(col)} = ?',
+                            [self._deger(v) for _, v in sets] + [self._deger(value)])
+                    elif op['op'] == 'delete':
+                        col, values = op['where']
+                        values = [self._deger(v) for v in values]
+                        # SQLite'ın parametre sınırını aşmamak için parçalar halinde
+                        for i in range(0, len(values), 500):
+                            chunk = values[i:i + 500]
+                            self.conn.execute(
+                                f'DELETE FROM {_q(name)} WHERE {_q(col)} IN ({", ".join("?" for _ in chunk)})', chunk)
+                    else:
+                        raise ValueError(f"Bilinmeyen işlem: {op['op']}")
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+            for name in {op['table'] for op in ops}:
+                self._yerel_surum[name] = self._yerel_surum.get(name, 0) + 1
+
+    # ------------ CSV içe / dışa aktarma ------------
+
+    def import_csv_files(self, csv_paths: Dict[str, str], dtypes: Dict[str, dict] = None):
+        """
+        Tek seferlik içe aktarma: {tablo_adı: csv_yolu}. Var olan tablo içeriği CSV ile değiştirilir.
+        Dosyası olmayan veya boş olan tablolar atlanır.
+        """
+        dtypes = dtypes or {}
+        for name, path in csv_paths.items():
+            try:
+                df = pd.read_csv(path, dtype=dtypes.get(name))
+            except (FileNotFoundError, pd.errors.EmptyDataError):
+                continue
+            self.replace_table(name, df)
+
+    def export_csv_files(self, csv_paths: Dict[str, str]):
+        """Uyumluluk için tabloları eski CSV düzenine yazar: {tablo_adı: csv_yolu}."""
+        for name, path in csv_paths.items():
+            self.read_table(name).to_csv(path, index=False)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
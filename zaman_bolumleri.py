@@ -0,0 +1,155 @@
+import glob
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from islem_gunlugu import _yerine_koy, tablolari_atomik_yaz
+
+
+# Zaman_Etudu ölçümleri tek bir dosya yerine aylık bölümlerde tutulur:
+#   Zaman_Etudu/2026-10.csv            — bir ayın ölçümleri (Timestamp'e göre)
+#   Zaman_Etudu/2026-01_2026-06.csv    — sıkıştırmada birleştirilmiş ardışık aylar
+#   Zaman_Etudu/tarihsiz.csv           — Timestamp'i ay olarak okunamayan satırlar
+#   Zaman_Etudu/manifest.json          — bölüm başına satır sayısı ve JobID listesi
+KLASOR_ADI = 'Zaman_Etudu'
+MANIFEST_ADI = 'manifest.json'
+TARIHSIZ = 'tarihsiz'
+
+_AY = re.compile(r'^\d{4}-\d{2}$')
+
+
+def ay_anahtari(timestamp) -> str:
+    """'2026-10-18 14:03:00' -> '2026-10'; ay okunamıyorsa 'tarihsiz'."""
+    ay = str(timestamp)[:7]
+    return ay if _AY.match(ay) else TARIHSIZ
+
+
+def bolum_araligi(ad: str) -> Optional[Tuple[str, str]]:
+    """Bölüm adının kapsadığı aylar: '2026-10' -> ('2026-10', '2026-10'), '2026-01_2026-06' -> (...); tarihsiz -> None."""
+    parcalar = ad.split('_')
+    if len(parcalar) == 1 and _AY.match(ad):
+        return ad, ad
+    if len(parcalar) == 2 and all(_AY.match(p) for p in parcalar):
+        return parcalar[0], parcalar[1]
+    return None
+
+
+def kapsayan_bolum(adlar: Iterable[str], ay: str) -> str:
+    """Ayın satırlarının yazılacağı bölüm: ayı kapsayan (birleştirilmiş) bölüm varsa o, yoksa ayın kendisi."""
+    if ay == TARIHSIZ:
+        return TARIHSIZ
+    for ad in sorted(adlar):
+        aralik = bolum_araligi(ad)
+        if aralik is not None and aralik[0] <= ay <= aralik[1]:
+            return ad
+    return ay
+
+
+def dosya_imzasi(path: str) -> Optional[List[int]]:
+    """Manifest girdisinin geçerlilik imzası [mtime_ns, boyut]; dosya yoksa None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def bolum_adlari(klasor: str) -> List[str]:
+    """Klasördeki bölüm dosyalarının adları (uzantısız), kronolojik sırada."""
+    return sorted(os.path.splitext(os.path.basename(p))[0] for p in glob.glob(os.path.join(klasor, '*.csv')))
+
+
+def bolum_ozeti(ad: str, df: pd.DataFrame, imza) -> dict:
+    """Bölümün manifest girdisi; imza, özetin ait olduğu dosya halidir (bkz. dosya_imzasi)."""
+    aralik = bolum_araligi(ad)
+    job_ids = pd.to_numeric(df['JobID'], errors='coerce').dropna().unique() if 'JobID' in df.columns else []
+    return {
+        'dosya': ad + '.csv',
+        'baslangic': aralik[0] if aralik else None,
+        'bitis': aralik[1] if aralik else None,
+        'satir': int(len(df)),
+        'JobID': sorted(int(j) for j in job_ids),
+        'imza': list(imza) if imza is not None else None,
+    }
+
+
+def manifest_oku(klasor: str) -> Dict[str, dict]:
+    """{bölüm_adı: girdi}; manifest yoksa veya bozuksa boş sözlük (bölümler taranarak yeniden kurulur)."""
+    try:
+        with open(os.path.join(klasor, MANIFEST_ADI), 'r', encoding='utf-8') as f:
+            return dict(json.load(f).get('bolumler', {}))
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def manifest_yaz(klasor: str, bolumler: Dict[str, dict]):
+    """
+    Manifesti geçici dosya + rename ile yazar. Kilitsizdir: girdiler imzalarıyla doğrulandığından
+    eski veya başka bir süreçten kalmış bir manifest yalnızca bölümlerin yeniden taranmasına yol açar.
+    """
+    path = os.path.join(klasor, MANIFEST_ADI)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'bolumler': dict(sorted(bolumler.items()))}, f, ensure_ascii=False, indent=1)
+    _yerine_koy(tmp_path, path)
+
+
+def ilgili_bolumler(klasor: str, job_ids=None, bolumler: Dict[str, dict] = None) -> List[str]:
+    """
+    job_ids'den en az birini içeren bölümlerin adları (job_ids=None: tümü). Manifest girdisi olmayan
+    veya imzası dosyayla uyuşmayan (manifestten sonra değişmiş) bölümler her durumda dahil edilir.
+    """
+    adlar = bolum_adlari(klasor)
+    if job_ids is None:
+        return adlar
+    if bolumler is None:
+        bolumler = manifest_oku(klasor)
+    aranan = {int(j) for j in job_ids}
+    secilen = []
+    for ad in adlar:
+        girdi = bolumler.get(ad)
+        if (girdi is None or girdi.get('imza') != dosya_imzasi(os.path.join(klasor, ad + '.csv'))
+                or aranan.intersection(girdi.get('JobID', ()))):
+            secilen.append(ad)
+    return secilen
+
+
+def bolumleri_oku(klasor: str, job_ids=None, columns: List[str] = None) -> pd.DataFrame:
+    """İlgili bölümleri (bkz. ilgili_bolumler) okuyup tek tabloda birleştirir; diğer bölümler açılmaz."""
+    frames = []
+    for ad in ilgili_bolumler(klasor, job_ids):
+        try:
+            frames.append(pd.read_csv(os.path.join(klasor, ad + '.csv')))
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            continue
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def aylara_ayir(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Satırları Timestamp aylarına göre böler: {ay: DataFrame} (bkz. ay_anahtari)."""
+    if df.empty:
+        return {}
+    aylar = df['Timestamp'].astype(str).str.slice(0, 7)
+    aylar = aylar.where(aylar.str.match(r'^\d{4}-\d{2}$'), TARIHSIZ)
+    return {ay: grup for ay, grup in df.groupby(aylar, sort=True)}
+
+
+def bolumlere_yaz(klasor: str, df: pd.DataFrame):
+    """
+    Tüm tabloyu aylık bölümler olarak yazar ve klasördeki diğer bölümleri siler (SQLite'tan CSV'ye
+    dışa aktarma için). Manifest yeni bölümlerle yeniden yazılır.
+    """
+    os.makedirs(klasor, exist_ok=True)
+    aylar = aylara_ayir(df)
+    tablolari_atomik_yaz({os.path.join(klasor, ay + '.csv'): grup for ay, grup in aylar.items()})
+    for ad in bolum_adlari(klasor):
+        if ad not in aylar:
+            os.remove(os.path.join(klasor, ad + '.csv'))
+    manifest_yaz(klasor, {ay: bolum_ozeti(ay, grup, dosya_imzasi(os.path.join(klasor, ay + '.csv')))
+                          for ay, grup in aylar.items()})